@@ -0,0 +1,23 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+
+from analytics.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily booking and revenue rollups from bookings and payments."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", default=None, help="First date to rebuild (YYYY-MM-DD), defaults to all history")
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            since = datetime.date.fromisoformat(options["since"])
+        started = time.perf_counter()
+        written = rebuild_rollups(since=since)
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {written} rollup rows in {time.perf_counter() - started:.2f}s"
+        ))
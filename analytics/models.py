@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class RollupDimension(models.TextChoices):
+    ARTIST = 'artist'
+    VENUE = 'venue'
+    CITY = 'city'
+
+
+class DailyRollup(models.Model):
+    """
+    Booking and revenue totals for one artist, venue or city on one day.
+    Bookings count on the day they were made, payments on the day they were
+    paid. ``key`` is the artist or venue id, or ``"city|state"`` lowercased.
+    """
+    dimension = models.CharField(max_length=10, choices=RollupDimension.choices)
+    key = models.CharField(max_length=220)
+    date = models.DateField()
+    booking_count = models.IntegerField(default=0)
+    booking_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    pending_count = models.IntegerField(default=0)
+    confirmed_count = models.IntegerField(default=0)
+    cancelled_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    payment_count = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        unique_together = ('dimension', 'key', 'date')
+        indexes = [models.Index(fields=['dimension', 'date'], name='analytics_rollup_date_idx')]
+        ordering = ['dimension', 'key', 'date']
+
+    def __str__(self):
+        return f"{self.dimension}:{self.key} {self.date}"
@@ -0,0 +1,200 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from analytics.models import DailyRollup, RollupDimension
+from base.constants import BookingStatus, PaymentStatus
+from booking.models import Booking, Event, Payment
+
+STATUS_FIELDS = {
+    BookingStatus.PENDING: 'pending_count',
+    BookingStatus.CONFIRMED: 'confirmed_count',
+    BookingStatus.CANCELLED: 'cancelled_count',
+    BookingStatus.COMPLETED: 'completed_count',
+}
+METRICS = ['booking_count', 'booking_amount', *STATUS_FIELDS.values(), 'payment_count', 'revenue']
+
+
+def city_key(city, state):
+    return f"{(city or '').strip().lower()}|{(state or '').strip().lower()}"
+
+
+def dimension_keys(artist_id, venue):
+    """``(dimension, key)`` pairs a fact counts towards; ``venue`` is ``(id, city, state)``."""
+    keys = []
+    if artist_id:
+        keys.append((RollupDimension.ARTIST, str(artist_id)))
+    if venue and venue[0]:
+        keys.append((RollupDimension.VENUE, str(venue[0])))
+        keys.append((RollupDimension.CITY, city_key(venue[1], venue[2])))
+    return keys
+
+
+def event_venues(event_ids):
+    event_ids = {event_id for event_id in event_ids if event_id}
+    if not event_ids:
+        return {}
+    return {
+        event_id: (venue_id, city, state)
+        for event_id, venue_id, city, state in Event.all_objects.filter(pk__in=event_ids).values_list(
+            'pk', 'venue_id', 'venue__city', 'venue__state'
+        )
+    }
+
+
+def booking_contribution(state, venues):
+    """What one booking snapshot adds to the rollups, as ``{(dimension, key, date): metrics}``."""
+    if not state or not state['is_active'] or state['created_at'] is None:
+        return {}
+    metrics = {'booking_count': 1, 'booking_amount': Decimal(state['amount'] or 0)}
+    if state['status'] in STATUS_FIELDS:
+        metrics[STATUS_FIELDS[state['status']]] = 1
+    date = timezone.localdate(state['created_at'])
+    return {
+        (dimension, key, date): metrics
+        for dimension, key in dimension_keys(state['artist_id'], venues.get(state['event_id']))
+    }
+
+
+def payment_contribution(state, bookings):
+    """Completed payments add revenue on the day they were paid; ``bookings`` maps id to ``(artist_id, venue)``."""
+    if not state or not state['is_active'] or state['status'] != PaymentStatus.COMPLETED:
+        return {}
+    paid_on = state['paid_at'] or state['created_at']
+    if paid_on is None or state['booking_id'] not in bookings:
+        return {}
+    artist_id, venue = bookings[state['booking_id']]
+    metrics = {'payment_count': 1, 'revenue': Decimal(state['amount'] or 0)}
+    date = timezone.localdate(paid_on)
+    return {(dimension, key, date): metrics for dimension, key in dimension_keys(artist_id, venue)}
+
+
+def payment_bookings(booking_ids):
+    booking_ids = {booking_id for booking_id in booking_ids if booking_id}
+    rows = list(Booking.all_objects.filter(pk__in=booking_ids).values_list('pk', 'artist_id', 'event_id'))
+    venues = event_venues(event_id for _, _, event_id in rows)
+    return {pk: (artist_id, venues.get(event_id)) for pk, artist_id, event_id in rows}
+
+
+def summed_contributions(bookings=None, payments=None):
+    """
+    The rollup contributions of ``bookings`` and completed ``payments`` as if
+    they were all active, from grouped queries rather than row by row.
+    """
+    totals = defaultdict(lambda: defaultdict(int))
+    facts = []
+    if bookings is not None:
+        grouped = bookings.annotate(day=TruncDate('created_at')).order_by().values(
+            'artist_id', 'event_id', 'status', 'day'
+        ).annotate(count=Count('pk'), amount=Coalesce(Sum('amount'), Decimal(0)))
+        for row in grouped:
+            metrics = {'booking_count': row['count'], 'booking_amount': row['amount']}
+            if row['status'] in STATUS_FIELDS:
+                metrics[STATUS_FIELDS[row['status']]] = row['count']
+            facts.append((row['artist_id'], row['event_id'], row['day'], metrics))
+    if payments is not None:
+        grouped = payments.filter(status=PaymentStatus.COMPLETED, booking__isnull=False).annotate(
+            day=TruncDate(Coalesce('paid_at', 'created_at'))
+        ).order_by().values('booking__artist_id', 'booking__event_id', 'day').annotate(
+            count=Count('pk'), amount=Coalesce(Sum('amount'), Decimal(0))
+        )
+        for row in grouped:
+            metrics = {'payment_count': row['count'], 'revenue': row['amount']}
+            facts.append((row['booking__artist_id'], row['booking__event_id'], row['day'], metrics))
+
+    venues = event_venues(event_id for _, event_id, _, _ in facts)
+    for artist_id, event_id, day, metrics in facts:
+        if day is None:
+            continue
+        for dimension, key in dimension_keys(artist_id, venues.get(event_id)):
+            for metric, value in metrics.items():
+                totals[dimension, key, day][metric] += value
+    return totals
+
+
+def apply_changes(removed, added):
+    """Subtract the ``removed`` contributions and add the ``added`` ones, touching only rows that change."""
+    deltas = defaultdict(lambda: defaultdict(int))
+    for contributions, sign in ((removed, -1), (added, 1)):
+        for row_key, metrics in contributions.items():
+            for metric, value in metrics.items():
+                deltas[row_key][metric] += sign * value
+
+    for (dimension, key, date), metrics in deltas.items():
+        metrics = {metric: value for metric, value in metrics.items() if value}
+        if metrics:
+            _apply(dimension, key, date, metrics)
+
+
+def _apply(dimension, key, date, metrics):
+    rows = DailyRollup.objects.filter(dimension=dimension, key=key, date=date)
+    increments = {metric: F(metric) + value for metric, value in metrics.items()}
+    if rows.update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            DailyRollup.objects.create(dimension=dimension, key=key, date=date, **metrics)
+    except IntegrityError:
+        # Another writer created the row first.
+        rows.update(**increments)
+
+
+def rebuild_rollups(since=None):
+    """
+    Recompute rollup rows from ``since`` (default: all time) with grouped
+    aggregate queries over the live and the archived bookings and payments.
+    Returns the number of rows written.
+    """
+    booking_metrics = {
+        'booking_count': Count('pk'),
+        'booking_amount': Coalesce(Sum('amount'), Decimal(0)),
+        **{field: Count('pk', filter=Q(status=status)) for status, field in STATUS_FIELDS.items()},
+    }
+    payment_metrics = {
+        'payment_count': Count('pk'),
+        'revenue': Coalesce(Sum('amount'), Decimal(0)),
+    }
+    bookings = [
+        rows.annotate(day=TruncDate('created_at'))
+        for rows in (Booking.active_objects.all(), Booking.all_objects.archived().filter(is_active=True))
+    ]
+    payments = [
+        rows.filter(status=PaymentStatus.COMPLETED).annotate(day=TruncDate(Coalesce('paid_at', 'created_at')))
+        for rows in (Payment.active_objects.all(), Payment.all_objects.archived().filter(is_active=True))
+    ]
+    if since is not None:
+        bookings = [rows.filter(day__gte=since) for rows in bookings]
+        payments = [rows.filter(day__gte=since) for rows in payments]
+
+    dimensions = [
+        (RollupDimension.ARTIST, ['artist_id'], ['booking__artist_id']),
+        (RollupDimension.VENUE, ['event__venue_id'], ['booking__event__venue_id']),
+        (RollupDimension.CITY, ['event__venue__city', 'event__venue__state'],
+         ['booking__event__venue__city', 'booking__event__venue__state']),
+    ]
+    totals = defaultdict(lambda: defaultdict(int))
+    for dimension, booking_paths, payment_paths in dimensions:
+        sources = [(facts, booking_paths, booking_metrics) for facts in bookings]
+        sources += [(facts, payment_paths, payment_metrics) for facts in payments]
+        for facts, paths, metrics in sources:
+            grouped = facts.filter(**{f'{paths[0]}__isnull': False}).values('day', *paths).annotate(**metrics).order_by()
+            for row in grouped:
+                key = city_key(*(row[path] for path in paths)) if dimension == RollupDimension.CITY else str(row[paths[0]])
+                for metric in metrics:
+                    totals[dimension, key, row['day']][metric] += row[metric]
+
+    rows = [
+        DailyRollup(dimension=dimension, key=key, date=date, **metrics)
+        for (dimension, key, date), metrics in totals.items()
+    ]
+    with transaction.atomic():
+        stale = DailyRollup.objects.all()
+        if since is not None:
+            stale = stale.filter(date__gte=since)
+        stale.delete()
+        DailyRollup.objects.bulk_create(rows, batch_size=5000)
+    return len(rows)
@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+from analytics.rollups import METRICS
+
+
+class RollupQuerySerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField()
+    interval = serializers.ChoiceField(choices=['day', 'week', 'month', 'total'], default='total')
+    key = serializers.CharField(required=False, help_text="One artist id, venue id or \"city|state\"")
+    ordering = serializers.ChoiceField(
+        choices=[*METRICS, *[f'-{metric}' for metric in METRICS]],
+        default='-revenue'
+    )
+
+    def validate(self, data):
+        if data['end'] < data['start']:
+            raise serializers.ValidationError("End date must not be before start date.")
+        return data
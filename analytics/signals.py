@@ -0,0 +1,87 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from analytics.rollups import (
+    apply_changes,
+    booking_contribution,
+    event_venues,
+    payment_bookings,
+    payment_contribution,
+    summed_contributions,
+)
+from base.signals import soft_delete_changed
+from booking.models import Booking, Payment
+from booking.signals import bookings_bulk_created
+
+BOOKING_FIELDS = ('artist_id', 'event_id', 'status', 'amount', 'is_active', 'created_at')
+PAYMENT_FIELDS = ('booking_id', 'status', 'amount', 'is_active', 'paid_at', 'created_at')
+
+
+def _snapshot(instance, fields):
+    values = instance.__dict__
+    return {field: values.get(field) for field in fields}
+
+
+@receiver(post_init, sender=Booking)
+def remember_booking_rollup(sender, instance, **kwargs):
+    instance._rollup_state = _snapshot(instance, BOOKING_FIELDS)
+
+
+@receiver(post_save, sender=Booking)
+def update_booking_rollups(sender, instance, created, **kwargs):
+    previous = None if created else instance._rollup_state
+    current = _snapshot(instance, BOOKING_FIELDS)
+    if previous != current:
+        venues = event_venues([previous and previous['event_id'], current['event_id']])
+        apply_changes(booking_contribution(previous, venues), booking_contribution(current, venues))
+    instance._rollup_state = current
+
+
+@receiver(post_delete, sender=Booking)
+def remove_booking_from_rollups(sender, instance, **kwargs):
+    state = instance._rollup_state
+    apply_changes(booking_contribution(state, event_venues([state['event_id']])), {})
+
+
+@receiver(bookings_bulk_created)
+def add_bulk_bookings_to_rollups(sender, bookings, **kwargs):
+    states = [_snapshot(booking, BOOKING_FIELDS) for booking in bookings]
+    venues = event_venues(state['event_id'] for state in states)
+    added = {}
+    for state in states:
+        for row_key, metrics in booking_contribution(state, venues).items():
+            totals = added.setdefault(row_key, {})
+            for metric, value in metrics.items():
+                totals[metric] = totals.get(metric, 0) + value
+    apply_changes({}, added)
+
+
+@receiver(post_init, sender=Payment)
+def remember_payment_rollup(sender, instance, **kwargs):
+    instance._rollup_state = _snapshot(instance, PAYMENT_FIELDS)
+
+
+@receiver(post_save, sender=Payment)
+def update_payment_rollups(sender, instance, created, **kwargs):
+    previous = None if created else instance._rollup_state
+    current = _snapshot(instance, PAYMENT_FIELDS)
+    if previous != current:
+        bookings = payment_bookings([previous and previous['booking_id'], current['booking_id']])
+        apply_changes(payment_contribution(previous, bookings), payment_contribution(current, bookings))
+    instance._rollup_state = current
+
+
+@receiver(post_delete, sender=Payment)
+def remove_payment_from_rollups(sender, instance, **kwargs):
+    state = instance._rollup_state
+    apply_changes(payment_contribution(state, payment_bookings([state['booking_id']])), {})
+
+
+@receiver(soft_delete_changed, sender=Booking)
+@receiver(soft_delete_changed, sender=Payment)
+def update_soft_deleted_rollups(sender, rows, active, **kwargs):
+    contributions = summed_contributions(**{'bookings' if sender is Booking else 'payments': rows})
+    if active:
+        apply_changes({}, contributions)
+    else:
+        apply_changes(contributions, {})
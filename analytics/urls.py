@@ -0,0 +1,6 @@
+from django.urls import path
+from analytics.views import RollupView
+
+urlpatterns = [
+    path('rollups/<str:dimension>/', RollupView.as_view(), name='analytics-rollups'),
+]
@@ -0,0 +1,74 @@
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from rest_framework import generics, permissions, status
+
+from analytics.models import DailyRollup, RollupDimension
+from analytics.rollups import METRICS
+from analytics.serializers import RollupQuerySerializer
+from artist.models import Artist
+from base.api_response import APIResponse
+from base.utils import CustomPagination
+from booking.models import Venue
+
+TRUNCATE = {'week': TruncWeek, 'month': TruncMonth}
+
+
+class RollupView(generics.GenericAPIView):
+    """
+    Booking and revenue totals per artist, venue or city between ``start``
+    and ``end``, per ``interval`` or for the whole range. Answered by summing
+    daily rollup rows, so the cost grows with the number of days and keys in
+    range, not with the number of bookings.
+    """
+    permission_classes = [permissions.IsAdminUser]
+    pagination_class = CustomPagination
+
+    def get(self, request, dimension, *args, **kwargs):
+        if dimension not in RollupDimension.values:
+            return APIResponse.error(
+                message=f"Unknown dimension, use one of {', '.join(RollupDimension.values)}",
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+        query = RollupQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return APIResponse.error(
+                message="Invalid rollup query",
+                errors=query.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        params = query.validated_data
+
+        rows = DailyRollup.objects.filter(dimension=dimension, date__range=(params['start'], params['end']))
+        if 'key' in params:
+            rows = rows.filter(key=params['key'])
+
+        group_by, ordering = ['key'], [params['ordering'], 'key']
+        if params['interval'] == 'day':
+            rows = rows.annotate(period=F('date'))
+        elif params['interval'] in TRUNCATE:
+            rows = rows.annotate(period=TRUNCATE[params['interval']]('date'))
+        if params['interval'] != 'total':
+            group_by, ordering = ['period', 'key'], ['period', params['ordering'], 'key']
+
+        totals = rows.values(*group_by).annotate(**{metric: Sum(metric) for metric in METRICS}).order_by(*ordering)
+        page = self.paginate_queryset(totals)
+        results = self.describe(dimension, list(page if page is not None else totals))
+        if page is not None:
+            return self.get_paginated_response(results)
+        return APIResponse.success(data=results)
+
+    def describe(self, dimension, results):
+        """Name each key (stage name, venue name or "city, state") and format money as strings."""
+        if dimension == RollupDimension.CITY:
+            names = {result['key']: result['key'].replace('|', ', ') for result in results}
+        else:
+            model, field = (Artist, 'stage_name') if dimension == RollupDimension.ARTIST else (Venue, 'name')
+            names = {
+                str(pk): name
+                for pk, name in model.all_objects.filter(pk__in={result['key'] for result in results}).values_list('pk', field)
+            }
+        for result in results:
+            result['label'] = names.get(result['key'])
+            for metric in ('booking_amount', 'revenue'):
+                result[metric] = f"{result[metric] or 0:.2f}"
+        return results
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ArtistConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'artist'
+
+    def ready(self):
+        import artist.signals  # noqa: F401
@@ -0,0 +1,170 @@
+import datetime
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from artist.models import ArtistAvailability, ArtistDayAvailability
+from base.constants import BookingStatus
+from booking.models import Booking
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+BITMAP_BYTES = SLOTS_PER_DAY // 8
+FULL_DAY = (1 << SLOTS_PER_DAY) - 1
+
+
+def to_bytes(bitmap):
+    return bitmap.to_bytes(BITMAP_BYTES, 'big')
+
+
+def from_bytes(value):
+    return int.from_bytes(bytes(value), 'big')
+
+
+def _minutes(value):
+    return value.hour * 60 + value.minute + value.second / 60
+
+
+def _mask(first_slot, last_slot):
+    """Bits ``first_slot`` up to, but not including, ``last_slot``."""
+    first_slot, last_slot = max(int(first_slot), 0), min(int(last_slot), SLOTS_PER_DAY)
+    if last_slot <= first_slot:
+        return 0
+    return ((1 << (last_slot - first_slot)) - 1) << first_slot
+
+
+def inner_mask(start_time, end_time):
+    """Slots lying entirely inside ``start_time``-``end_time``."""
+    return _mask(-(-_minutes(start_time) // SLOT_MINUTES), _minutes(end_time) // SLOT_MINUTES)
+
+
+def outer_mask(start_minutes, end_minutes):
+    """Slots touched by the span, given in minutes from midnight."""
+    return _mask(start_minutes // SLOT_MINUTES, -(-end_minutes // SLOT_MINUTES))
+
+
+def window_mask(start_time, end_time):
+    """Slots that must all be free for an artist to cover the whole window."""
+    end_minutes = _minutes(end_time) or 24 * 60
+    return outer_mask(_minutes(start_time), end_minutes)
+
+
+def _day_start(date):
+    return timezone.make_aware(datetime.datetime.combine(date, datetime.time.min))
+
+
+def booked_mask(date, start, end):
+    """Slots on local ``date`` touched by an event running from ``start`` to ``end``."""
+    day_start = _day_start(date)
+    return outer_mask(
+        max((start - day_start).total_seconds() / 60, 0),
+        min((end - day_start).total_seconds() / 60, 24 * 60)
+    )
+
+
+def compute_days(artist_id, dates):
+    """Bitmaps for several of an artist's days, ``{date: bitmap}``, with two queries."""
+    dates = set(dates)
+    available, blocked = defaultdict(int), defaultdict(int)
+    for date, start_time, end_time, is_available in ArtistAvailability.active_objects.filter(
+        artist_id=artist_id, date__in=dates
+    ).values_list('date', 'start_time', 'end_time', 'is_available'):
+        if is_available:
+            available[date] |= inner_mask(start_time, end_time)
+        else:
+            blocked[date] |= outer_mask(_minutes(start_time), _minutes(end_time))
+
+    for start, end in confirmed_bookings(artist_id=artist_id).filter(
+        event__start_time__lt=_day_start(max(dates)) + datetime.timedelta(days=1),
+        event__end_time__gt=_day_start(min(dates))
+    ).values_list('event__start_time', 'event__end_time'):
+        for date in dates.intersection(booking_dates(start, end)):
+            blocked[date] |= booked_mask(date, start, end)
+    return {date: available[date] & ~blocked[date] & FULL_DAY for date in dates}
+
+
+def compute_day(artist_id, date):
+    return compute_days(artist_id, [date])[date]
+
+
+def confirmed_bookings(**filters):
+    return Booking.active_objects.filter(
+        status=BookingStatus.CONFIRMED,
+        event__isnull=False,
+        event__is_active=True,
+        **filters
+    )
+
+
+def booking_dates(start, end):
+    """Local dates an event running from ``start`` to ``end`` touches."""
+    first = timezone.localtime(start).date()
+    last = timezone.localtime(end - datetime.timedelta(microseconds=1)).date()
+    return [first + datetime.timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+def refresh_days(artist_days):
+    """Recompute the bitmap rows for an iterable of ``(artist_id, date)`` pairs, a few queries per artist."""
+    by_artist = defaultdict(set)
+    for artist_id, date in artist_days:
+        if artist_id is not None:
+            by_artist[artist_id].add(date)
+    for artist_id, dates in by_artist.items():
+        bitmaps = compute_days(artist_id, dates)
+        with transaction.atomic():
+            ArtistDayAvailability.objects.filter(artist_id=artist_id, date__in=dates).delete()
+            ArtistDayAvailability.objects.bulk_create([
+                ArtistDayAvailability(artist_id=artist_id, date=date, free_slots=to_bytes(bitmap))
+                for date, bitmap in bitmaps.items() if bitmap
+            ])
+
+
+def rebuild_all(since=None):
+    """Rebuild every bitmap row from ``since`` (default today) onwards. Returns rows written."""
+    since = since or timezone.localdate()
+    artist_days = defaultdict(lambda: [0, 0])
+    for artist_id, date, start_time, end_time, is_available in ArtistAvailability.active_objects.filter(
+        date__gte=since, artist__isnull=False
+    ).values_list('artist_id', 'date', 'start_time', 'end_time', 'is_available'):
+        if is_available:
+            artist_days[artist_id, date][0] |= inner_mask(start_time, end_time)
+        else:
+            artist_days[artist_id, date][1] |= outer_mask(_minutes(start_time), _minutes(end_time))
+
+    for artist_id, start, end in confirmed_bookings(
+        artist__isnull=False, event__end_time__gt=_day_start(since)
+    ).values_list('artist_id', 'event__start_time', 'event__end_time'):
+        for date in booking_dates(start, end):
+            if (artist_id, date) in artist_days:
+                artist_days[artist_id, date][1] |= booked_mask(date, start, end)
+
+    rows = [
+        ArtistDayAvailability(artist_id=artist_id, date=date, free_slots=to_bytes(available & ~blocked & FULL_DAY))
+        for (artist_id, date), (available, blocked) in artist_days.items()
+        if available & ~blocked
+    ]
+    with transaction.atomic():
+        ArtistDayAvailability.objects.filter(date__gte=since).delete()
+        ArtistDayAvailability.objects.bulk_create(rows, batch_size=5000)
+    return len(rows)
+
+
+def free_artist_ids(dates, start_time, end_time, match_all=True):
+    """
+    Artists free for the whole ``start_time``-``end_time`` window on every
+    one of ``dates`` (or on at least one of them when ``match_all`` is False).
+    """
+    dates = set(dates)
+    mask = window_mask(start_time, end_time)
+    if not dates or not mask:
+        return set()
+
+    free_days = defaultdict(int)
+    for artist_id, free_slots in ArtistDayAvailability.objects.filter(
+        date__in=dates
+    ).values_list('artist_id', 'free_slots').iterator():
+        if from_bytes(free_slots) & mask == mask:
+            free_days[artist_id] += 1
+    required = len(dates) if match_all else 1
+    return {artist_id for artist_id, count in free_days.items() if count >= required}
@@ -0,0 +1,9 @@
+from django.conf import settings
+
+from base.facets import BooleanFacet, FacetSet, RangeFacet, TermsFacet
+
+artist_facets = FacetSet('artist', [
+    TermsFacet('genre'),
+    RangeFacet('hourly_rate', settings.FACET_SETTINGS['HOURLY_RATE_EDGES']),
+    BooleanFacet('available_for_booking'),
+])
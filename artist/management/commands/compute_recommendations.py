@@ -0,0 +1,19 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from artist.recommendations import compute_artist_recommendations
+
+
+class Command(BaseCommand):
+    help = "Recompute the top-k similar artists table used by the recommendation endpoints."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top-k", type=int, default=None, help="Neighbours stored per artist")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        written = compute_artist_recommendations(top_k=options["top_k"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {written} recommendations in {time.perf_counter() - started:.2f}s"
+        ))
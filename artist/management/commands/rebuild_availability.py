@@ -0,0 +1,23 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+
+from artist.availability import rebuild_all
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-day artist availability bitmaps from slots and confirmed bookings."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", default=None, help="First date to rebuild (YYYY-MM-DD), defaults to today")
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            since = datetime.date.fromisoformat(options["since"])
+        started = time.perf_counter()
+        written = rebuild_all(since=since)
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {written} artist-day bitmaps in {time.perf_counter() - started:.2f}s"
+        ))
@@ -2,7 +2,8 @@ from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 from authentication.models import User
-from base.constants import MEDIATYPE
+from base.constants import MEDIATYPE, BookingStatus
+from base.archive import archive_model
 from base.models import BaseModel
 from booking.models import Booking
 
@@ -17,6 +18,17 @@ class Artist(BaseModel):
     instagram_handle = models.CharField(max_length=50, blank=True, null=True)
     spotify_profile = models.URLField(blank=True, null=True)
     available_for_booking = models.BooleanField(default=True)
+    # Maintained by booking.signals; see booking.counters.
+    upcoming_bookings_count = models.IntegerField(default=0, editable=False)
+    completed_gigs_count = models.IntegerField(default=0, editable=False)
+    counter_fields = ('upcoming_bookings_count', 'completed_gigs_count')
+
+    # Deactivated with the artist; see base.managers.SoftDeleteQuerySet.
+    soft_delete_cascade = [
+        ('availability', {}),
+        ('portfolio_items', {}),
+        ('bookings', {'status': BookingStatus.PENDING}),
+    ]
 
     def __str__(self):
         return self.stage_name
@@ -55,4 +67,46 @@ class ArtistAvailability(BaseModel):
         unique_together = ('artist', 'date', 'start_time', 'end_time')
         
     def __str__(self):
-        return f"{self.artist.stage_name} - {self.date} {self.start_time}-{self.end_time}"
\ No newline at end of file
+        return f"{self.artist.stage_name} - {self.date} {self.start_time}-{self.end_time}"
+
+
+class ArtistRecommendation(models.Model):
+    """
+    Precomputed top-k similar artists, rebuilt by the compute_recommendations
+    command. Derived data, so it skips the BaseModel bookkeeping columns.
+    """
+    artist = models.ForeignKey(Artist, on_delete=models.CASCADE, related_name='recommendations')
+    recommended = models.ForeignKey(Artist, on_delete=models.CASCADE, related_name='+')
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        unique_together = ('artist', 'rank')
+        ordering = ['artist', 'rank']
+
+    def __str__(self):
+        return f"{self.artist_id} -> {self.recommended_id} ({self.score:.3f})"
+
+
+class ArtistDayAvailability(models.Model):
+    """
+    One row per artist-day holding a bitmap of free 15 minute slots: declared
+    availability minus unavailable slots and confirmed bookings. Derived from
+    ArtistAvailability and Booking and kept in sync by artist.signals.
+    """
+    artist = models.ForeignKey(Artist, on_delete=models.CASCADE, related_name='day_availability')
+    date = models.DateField(db_index=True)
+    free_slots = models.BinaryField(max_length=12)
+
+    class Meta:
+        unique_together = ('artist', 'date')
+        ordering = ['artist', 'date']
+
+    def __str__(self):
+        return f"{self.artist_id} - {self.date}"
+
+
+# Rows moved out of the live tables by archival; see booking.archival.
+ArchivedReview = archive_model(Review)
+ArchivedArtistPortfolioItem = archive_model(ArtistPortfolioItem)
+ArchivedArtistAvailability = archive_model(ArtistAvailability)
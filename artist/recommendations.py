@@ -0,0 +1,104 @@
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg, Count
+
+from artist.models import Artist, ArtistRecommendation, Review
+from base.constants import BookingStatus
+from booking.models import Booking
+
+
+def load_artist_features():
+    """
+    Pull everything the similarity model needs in four queries and return
+    ``(artist_ids, genres, log_rates, ratings, venue_matrix)`` as arrays.
+    """
+    rows = list(Artist.active_objects.order_by('pk').values_list('pk', 'genre', 'hourly_rate'))
+    artist_ids = np.array([row[0] for row in rows], dtype=np.int64)
+    position = {artist_id: index for index, artist_id in enumerate(artist_ids.tolist())}
+
+    genre_labels = [(row[1] or '').strip().lower() for row in rows]
+    genre_index = {genre: index for index, genre in enumerate(sorted(set(genre_labels)))}
+    genres = np.array([genre_index[genre] for genre in genre_labels], dtype=np.int64)
+    log_rates = np.log1p(np.array([float(row[2] or 0) for row in rows], dtype=np.float64))
+
+    # Unrated artists sit at the neutral midpoint of the 1-5 scale.
+    ratings = np.full(len(rows), 3.0)
+    for artist_id, average, count in Review.active_objects.filter(
+        artist_id__in=position
+    ).values('artist_id').annotate(average=Avg('rating'), count=Count('id')).values_list(
+        'artist_id', 'average', 'count'
+    ):
+        # Shrink sparse averages towards the midpoint.
+        ratings[position[artist_id]] = (average * count + 3.0 * 2) / (count + 2)
+
+    pairs = set(Booking.active_objects.exclude(status=BookingStatus.CANCELLED).filter(
+        artist_id__in=position, event__venue__isnull=False
+    ).values_list('artist_id', 'event__venue_id'))
+    venue_ids = sorted({venue_id for _, venue_id in pairs})
+    venue_position = {venue_id: index for index, venue_id in enumerate(venue_ids)}
+    venue_matrix = np.zeros((len(rows), len(venue_ids)), dtype=np.float32)
+    for artist_id, venue_id in pairs:
+        venue_matrix[position[artist_id], venue_position[venue_id]] = 1.0
+
+    return artist_ids, genres, log_rates, ratings, venue_matrix
+
+
+def top_k_similar(genres, log_rates, ratings, venue_matrix, top_k, block_size=1024):
+    """
+    Blended similarity of every artist against every other, scored a block of
+    rows at a time so memory stays at ``block_size * n``. Returns
+    ``(neighbours, scores)`` arrays of shape ``(n, k)``.
+    """
+    weights = settings.ARTIST_RECOMMENDATION_SETTINGS['WEIGHTS']
+    count = len(genres)
+    k = min(top_k, count - 1)
+    if k <= 0:
+        return np.empty((count, 0), dtype=np.int64), np.empty((count, 0))
+
+    norms = np.linalg.norm(venue_matrix, axis=1)
+    norms[norms == 0] = 1.0
+    venues = venue_matrix / norms[:, None]
+    rate_scale = max(float(np.std(log_rates)), 1e-6)
+
+    neighbours = np.empty((count, k), dtype=np.int64)
+    scores = np.empty((count, k))
+    for start in range(0, count, block_size):
+        stop = min(start + block_size, count)
+        rows = slice(start, stop)
+        similarity = (
+            weights['genre'] * (genres[rows, None] == genres[None, :])
+            + weights['price'] * np.exp(-np.abs(log_rates[rows, None] - log_rates[None, :]) / rate_scale)
+            + weights['rating'] * (1.0 - np.abs(ratings[rows, None] - ratings[None, :]) / 4.0)
+            + weights['co_booking'] * (venues[rows] @ venues.T)
+        )
+        similarity[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+
+        candidates = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(similarity, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind='stable')
+        neighbours[rows] = np.take_along_axis(candidates, order, axis=1)
+        scores[rows] = np.take_along_axis(candidate_scores, order, axis=1)
+    return neighbours, scores
+
+
+def compute_artist_recommendations(top_k=None, batch_size=5000):
+    """Rebuild the ArtistRecommendation table. Returns the number of rows written."""
+    top_k = top_k or settings.ARTIST_RECOMMENDATION_SETTINGS['TOP_K']
+    artist_ids, genres, log_rates, ratings, venue_matrix = load_artist_features()
+    neighbours, scores = top_k_similar(genres, log_rates, ratings, venue_matrix, top_k)
+
+    recommendations = [
+        ArtistRecommendation(
+            artist_id=int(artist_ids[row]),
+            recommended_id=int(artist_ids[neighbour]),
+            rank=rank,
+            score=float(scores[row, rank - 1])
+        )
+        for row in range(len(artist_ids))
+        for rank, neighbour in enumerate(neighbours[row], start=1)
+    ]
+    with transaction.atomic():
+        ArtistRecommendation.objects.all().delete()
+        ArtistRecommendation.objects.bulk_create(recommendations, batch_size=batch_size)
+    return len(recommendations)
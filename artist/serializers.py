@@ -1,7 +1,10 @@
+import datetime
+
+from django.conf import settings
 from django.utils import timezone
 from rest_framework import serializers
 
-from artist.models import Artist, Review, ArtistPortfolioItem, ArtistAvailability
+from artist.models import Artist, Review, ArtistPortfolioItem, ArtistAvailability, ArtistRecommendation
 from authentication.serializers import UserProfileSerializer
 from base.constants import MEDIATYPE
 
@@ -14,9 +17,10 @@ class ArtistSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'user', 'user_details', 'stage_name', 'genre', 
             'hourly_rate', 'portfolio_url', 'instagram_handle',
-            'spotify_profile', 'available_for_booking'
+            'spotify_profile', 'available_for_booking',
+            'upcoming_bookings_count', 'completed_gigs_count'
         ]
-        read_only_fields = ['id', 'user_details']
+        read_only_fields = ['id', 'user_details', 'upcoming_bookings_count', 'completed_gigs_count']
     
     def get_user_details(self, obj):
         if obj.user:
@@ -119,4 +123,62 @@ class ArtistAvailabilitySerializer(serializers.ModelSerializer):
         if qs.exists():
             raise serializers.ValidationError("This time slot overlaps with existing availability.")
         
-        return data
\ No newline at end of file
+        return data
+
+
+class ArtistRecommendationSerializer(serializers.ModelSerializer):
+    artist_details = ArtistSerializer(source='recommended', read_only=True)
+
+    class Meta:
+        model = ArtistRecommendation
+        fields = ['rank', 'score', 'artist_details']
+
+
+class RecommendationQuerySerializer(serializers.Serializer):
+    limit = serializers.IntegerField(min_value=1, required=False)
+
+    def validate_limit(self, value):
+        return min(value, settings.ARTIST_RECOMMENDATION_SETTINGS['MAX_LIMIT'])
+
+
+class EventRecommendationQuerySerializer(RecommendationQuerySerializer):
+    event = serializers.IntegerField()
+
+
+class AvailabilitySearchSerializer(serializers.Serializer):
+    """Query parameters for finding artists free in a recurring time window."""
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    start_time = serializers.TimeField()
+    end_time = serializers.TimeField()
+    weekdays = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=7),
+        required=False,
+        help_text="ISO weekdays to include, 1 (Monday) to 7 (Sunday); every day when omitted."
+    )
+    match = serializers.ChoiceField(choices=['all', 'any'], default='all')
+
+    def to_internal_value(self, data):
+        if hasattr(data, 'getlist'):
+            data = data.dict() | {'weekdays': [
+                day for value in data.getlist('weekdays') for day in value.split(',') if day
+            ]}
+        return super().to_internal_value(data)
+
+    def validate(self, data):
+        if data['end_date'] < data['start_date']:
+            raise serializers.ValidationError("End date must not be before start date.")
+        if (data['end_date'] - data['start_date']).days > 366:
+            raise serializers.ValidationError("Search at most one year at a time.")
+        if data['end_time'] != datetime.time.min and data['end_time'] <= data['start_time']:
+            raise serializers.ValidationError("End time must be after start time.")
+
+        weekdays = set(data.get('weekdays') or range(1, 8))
+        data['dates'] = [
+            date for date in (
+                data['start_date'] + datetime.timedelta(days=offset)
+                for offset in range((data['end_date'] - data['start_date']).days + 1)
+            )
+            if date.isoweekday() in weekdays
+        ]
+        return data
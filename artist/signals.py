@@ -0,0 +1,145 @@
+from django.db import transaction
+from django.utils import timezone
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+
+from artist.availability import booking_dates, confirmed_bookings, refresh_days
+from artist.facets import artist_facets
+from artist.models import Artist, ArtistAvailability
+from base.constants import BookingStatus
+from base.signals import soft_delete_changed
+from booking.models import Booking, Event
+
+
+def _slot_days(state):
+    artist_id, date = state
+    return [(artist_id, date)] if artist_id and date else []
+
+
+def _event_days(artist_ids, start, end):
+    if not artist_ids or start is None or end is None:
+        return []
+    return [(artist_id, date) for artist_id in artist_ids for date in booking_dates(start, end)]
+
+
+@receiver(post_init, sender=ArtistAvailability)
+def remember_availability_day(sender, instance, **kwargs):
+    instance._bitmap_day = (instance.__dict__.get('artist_id'), instance.__dict__.get('date'))
+
+
+@receiver(post_save, sender=ArtistAvailability)
+def refresh_availability_day(sender, instance, **kwargs):
+    current = (instance.artist_id, instance.date)
+    refresh_days(_slot_days(instance._bitmap_day) + _slot_days(current))
+    instance._bitmap_day = current
+
+
+@receiver(post_delete, sender=ArtistAvailability)
+def refresh_deleted_availability_day(sender, instance, **kwargs):
+    refresh_days(_slot_days((instance.artist_id, instance.date)))
+
+
+def _booking_state(instance):
+    values = instance.__dict__
+    confirmed = values.get('status') == BookingStatus.CONFIRMED and values.get('is_active', True)
+    return (values.get('artist_id'), values.get('event_id')) if confirmed else None
+
+
+def _booking_days(state):
+    if state is None:
+        return []
+    artist_id, event_id = state
+    event = Event.all_objects.filter(pk=event_id).values('start_time', 'end_time').first()
+    return _event_days([artist_id], event['start_time'], event['end_time']) if event else []
+
+
+@receiver(post_init, sender=Booking)
+def remember_booking_state(sender, instance, **kwargs):
+    instance._bitmap_state = _booking_state(instance)
+
+
+@receiver(post_save, sender=Booking)
+def refresh_booking_days(sender, instance, **kwargs):
+    current = _booking_state(instance)
+    if current != instance._bitmap_state:
+        refresh_days(_booking_days(instance._bitmap_state) + _booking_days(current))
+    instance._bitmap_state = current
+
+
+@receiver(post_delete, sender=Booking)
+def refresh_deleted_booking_days(sender, instance, **kwargs):
+    refresh_days(_booking_days(_booking_state(instance)))
+
+
+@receiver(post_init, sender=Event)
+def remember_event_times(sender, instance, **kwargs):
+    values = instance.__dict__
+    instance._bitmap_times = (values.get('start_time'), values.get('end_time'), values.get('is_active'))
+
+
+@receiver(post_save, sender=Event)
+def refresh_event_days(sender, instance, created, **kwargs):
+    current = (instance.start_time, instance.end_time, instance.is_active)
+    if not created and current != instance._bitmap_times:
+        artist_ids = set(Booking.active_objects.filter(
+            event=instance, status=BookingStatus.CONFIRMED, artist__isnull=False
+        ).values_list('artist_id', flat=True))
+        refresh_days(
+            _event_days(artist_ids, *instance._bitmap_times[:2])
+            + _event_days(artist_ids, instance.start_time, instance.end_time)
+        )
+    instance._bitmap_times = current
+
+
+@receiver(pre_delete, sender=Event)
+def remember_deleted_event_artists(sender, instance, **kwargs):
+    # The bookings lose their event once it is gone, so collect them first.
+    instance._bitmap_artists = set(confirmed_bookings(event=instance).values_list('artist_id', flat=True))
+
+
+@receiver(post_delete, sender=Event)
+def refresh_deleted_event_days(sender, instance, **kwargs):
+    refresh_days(_event_days(getattr(instance, '_bitmap_artists', ()), instance.start_time, instance.end_time))
+
+
+@receiver(post_save, sender=Artist)
+@receiver(post_delete, sender=Artist)
+def invalidate_artist_facets(sender, instance, **kwargs):
+    transaction.on_commit(artist_facets.invalidate)
+
+
+# Soft deletes through a queryset: collect the affected days up front and
+# recompute them once the flip has committed. Past days are left as they are.
+def _refresh_on_commit(artist_days):
+    artist_days = set(artist_days)
+    if artist_days:
+        transaction.on_commit(lambda: refresh_days(artist_days))
+
+
+def _confirmed_booking_days(bookings):
+    rows = bookings.filter(
+        status=BookingStatus.CONFIRMED, artist__isnull=False, event__end_time__gte=timezone.now()
+    ).order_by().values_list('artist_id', 'event__start_time', 'event__end_time').distinct()
+    return [day for artist_id, start, end in rows for day in _event_days([artist_id], start, end)]
+
+
+@receiver(soft_delete_changed, sender=ArtistAvailability)
+def refresh_soft_deleted_availability_days(sender, rows, **kwargs):
+    _refresh_on_commit(
+        rows.filter(date__gte=timezone.localdate()).order_by().values_list('artist_id', 'date').distinct()
+    )
+
+
+@receiver(soft_delete_changed, sender=Booking)
+def refresh_soft_deleted_booking_days(sender, rows, **kwargs):
+    _refresh_on_commit(_confirmed_booking_days(rows))
+
+
+@receiver(soft_delete_changed, sender=Event)
+def refresh_soft_deleted_event_days(sender, rows, **kwargs):
+    _refresh_on_commit(_confirmed_booking_days(Booking.active_objects.filter(event__in=rows.values('pk'))))
+
+
+@receiver(soft_delete_changed, sender=Artist)
+def invalidate_soft_deleted_artist_facets(sender, **kwargs):
+    transaction.on_commit(artist_facets.invalidate)
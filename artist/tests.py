@@ -1,3 +1,132 @@
+import datetime
+from decimal import Decimal
+
 from django.test import TestCase
+from django.utils import timezone
+
+from artist.models import Artist, ArtistAvailability, ArtistPortfolioItem
+from authentication.models import User
+from base.constants import BookingStatus
+from booking.models import Booking, Event, Venue
+from search.models import ArtistTrigram
+
+
+class ArtistSoftDeleteTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(email='owner@example.com', username='owner', password='pass12345')
+        venue = Venue.all_objects.create(
+            name='Hall', owner=self.owner, address='1 Road', city='Lagos', state='Lagos',
+            zip_code='100001', capacity=100, description='Hall'
+        )
+        start = timezone.now() + datetime.timedelta(days=7)
+        event = Event.all_objects.create(
+            title='Gig', description='Gig', venue=venue, start_time=start,
+            end_time=start + datetime.timedelta(hours=2), ticket_price=Decimal('10.00')
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.artist = Artist.all_objects.create(
+                user=User.objects.create_user(email='artist@example.com', username='artist', password='pass12345'),
+                stage_name='Wizkid Live', genre='afrobeat', hourly_rate=Decimal('100.00')
+            )
+        day = timezone.localdate() + datetime.timedelta(days=3)
+        self.slots = [
+            ArtistAvailability.all_objects.create(
+                artist=self.artist, date=day, start_time=datetime.time(hour), end_time=datetime.time(hour + 1)
+            )
+            for hour in (10, 12)
+        ]
+        self.item = ArtistPortfolioItem.all_objects.create(
+            artist=self.artist, title='Live', media_url='https://example.com/live.png'
+        )
+        self.pending = Booking.all_objects.create(event=event, artist=self.artist, booker=self.owner, amount=200)
+        self.confirmed = Booking.all_objects.create(
+            event=event, artist=self.artist, booker=self.owner, amount=200, status=BookingStatus.CONFIRMED
+        )
+
+    def refresh(self, *instances):
+        for instance in instances:
+            instance.refresh_from_db()
+
+    def test_delete_cascades_to_configured_relations(self):
+        total, counts = Artist.all_objects.filter(pk=self.artist.pk).delete()
+
+        self.assertEqual(total, 5)
+        self.assertEqual(counts, {
+            'artist.Artist': 1,
+            'artist.ArtistAvailability': 2,
+            'artist.ArtistPortfolioItem': 1,
+            'booking.Booking': 1,
+        })
+        self.refresh(self.artist, self.item, self.pending, self.confirmed, *self.slots)
+        self.assertFalse(self.artist.is_active)
+        for row in (self.item, self.pending, *self.slots):
+            self.assertFalse(row.is_active)
+            self.assertEqual(row.deleted_at, self.artist.deleted_at)
+        self.assertTrue(self.confirmed.is_active)
+
+    def test_restore_brings_back_only_rows_deleted_with_the_artist(self):
+        ArtistAvailability.all_objects.filter(pk=self.slots[0].pk).delete()
+        Artist.all_objects.filter(pk=self.artist.pk).delete()
+
+        total, counts = Artist.all_objects.filter(pk=self.artist.pk).restore()
+
+        self.assertEqual(total, 4)
+        self.assertEqual(counts, {
+            'artist.Artist': 1,
+            'artist.ArtistAvailability': 1,
+            'artist.ArtistPortfolioItem': 1,
+            'booking.Booking': 1,
+        })
+        self.refresh(self.artist, self.item, self.pending, *self.slots)
+        self.assertFalse(self.slots[0].is_active)
+        for row in (self.artist, self.item, self.pending, self.slots[1]):
+            self.assertTrue(row.is_active)
+            self.assertIsNone(row.deleted_at)
+
+    def test_instance_soft_delete_and_restore_cascade(self):
+        self.artist.soft_delete()
+        self.refresh(self.item, self.pending)
+        self.assertFalse(self.item.is_active)
+        self.assertFalse(self.pending.is_active)
+
+        self.artist.restore()
+        self.refresh(self.item, self.pending)
+        self.assertTrue(self.item.is_active)
+        self.assertTrue(self.pending.is_active)
+
+    def test_counters_follow_cascaded_bookings(self):
+        self.refresh(self.artist, self.owner)
+        self.assertEqual(self.artist.upcoming_bookings_count, 2)
+        self.assertEqual(self.owner.bookings_count, 2)
+
+        Artist.all_objects.filter(pk=self.artist.pk).delete()
+        self.refresh(self.artist, self.owner)
+        self.assertEqual(self.artist.upcoming_bookings_count, 1)
+        self.assertEqual(self.owner.bookings_count, 1)
+
+        Artist.all_objects.filter(pk=self.artist.pk).restore()
+        self.refresh(self.artist, self.owner)
+        self.assertEqual(self.artist.upcoming_bookings_count, 2)
+        self.assertEqual(self.owner.bookings_count, 2)
+
+    def test_search_index_follows_soft_delete(self):
+        postings = ArtistTrigram.objects.filter(artist=self.artist)
+        self.assertTrue(postings.exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Artist.all_objects.filter(pk=self.artist.pk).delete()
+        self.assertFalse(postings.exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Artist.all_objects.filter(pk=self.artist.pk).restore()
+        self.assertTrue(postings.exists())
+
+    def test_hard_delete_removes_rows(self):
+        total, counts = Artist.all_objects.filter(pk=self.artist.pk).hard_delete()
 
-# Create your tests here.
+        self.assertEqual(counts['artist.Artist'], 1)
+        self.assertEqual(counts['artist.ArtistAvailability'], 2)
+        self.assertFalse(Artist.all_objects.filter(pk=self.artist.pk).exists())
+        self.assertFalse(ArtistPortfolioItem.all_objects.filter(pk=self.item.pk).exists())
+        self.pending.refresh_from_db()
+        self.assertIsNone(self.pending.artist_id)
@@ -2,17 +2,25 @@ from django.urls import path
 from artist.views import (
     ArtistListView,
     ArtistDetailView,
+    ArtistChangeFeedView,
     ReviewListView,
     ArtistPortfolioListView,
     ArtistAvailabilityView,
-    ArtistAvailabilityDetailView
+    ArtistAvailabilityDetailView,
+    ArtistAvailabilitySearchView,
+    SimilarArtistsView,
+    EventArtistRecommendationView
 )
 
 urlpatterns = [
     path('', ArtistListView.as_view(), name='artist-list'),
+    path('changes/', ArtistChangeFeedView.as_view(), name='artist-changes'),
     path('<int:pk>/', ArtistDetailView.as_view(), name='artist-detail'),
+    path('<int:pk>/similar/', SimilarArtistsView.as_view(), name='artist-similar'),
+    path('recommended/', EventArtistRecommendationView.as_view(), name='artist-recommended'),
     path('reviews/', ReviewListView.as_view(), name='review-list'),
     path('portfolio/', ArtistPortfolioListView.as_view(), name='portfolio-list'),
     path('availability/', ArtistAvailabilityView.as_view(), name='availability-list'),
+    path('availability/free/', ArtistAvailabilitySearchView.as_view(), name='availability-free'),
     path('availability/<uuid:pk>/', ArtistAvailabilityDetailView.as_view(), name='availability-detail'),
 ]
\ No newline at end of file
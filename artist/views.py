@@ -1,24 +1,40 @@
 from django_filters.rest_framework import DjangoFilterBackend
+from django.conf import settings
+from django.shortcuts import get_object_or_404
 from django.utils import timezone 
 from rest_framework import filters
 from rest_framework import generics, permissions, status
-from artist.models import Artist, Review, ArtistPortfolioItem, ArtistAvailability
+from artist.availability import free_artist_ids
+from artist.facets import artist_facets
+from artist.models import Artist, Review, ArtistPortfolioItem, ArtistAvailability, ArtistRecommendation
 from artist.serializers import (
     ArtistSerializer,
     ReviewSerializer,
     ArtistPortfolioItemSerializer,
-    ArtistAvailabilitySerializer
+    ArtistAvailabilitySerializer,
+    ArtistRecommendationSerializer,
+    AvailabilitySearchSerializer,
+    EventRecommendationQuerySerializer,
+    RecommendationQuerySerializer
 )
 from artist.utils import validate_artist_profile_management
 from base.api_response import APIResponse
+from base.changes import ChangeFeedView
+from base.constants import BookingStatus
+from base.facets import FacetedListMixin
+from base.streaming import StreamingListMixin
+from base.throttling import ReadThrottleMixin
 from base.utils import CustomPagination
+from booking.models import Booking, Event
 
 
-class ArtistListView(generics.ListCreateAPIView):
+class ArtistListView(ReadThrottleMixin, FacetedListMixin, generics.ListCreateAPIView):
     queryset = Artist.active_objects.select_related('user')
     serializer_class = ArtistSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    throttle_scope = 'search'
     pagination_class = CustomPagination
+    facet_set = artist_facets
     
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = {
@@ -42,17 +58,6 @@ class ArtistListView(generics.ListCreateAPIView):
     ]
     ordering = ['-created_at']
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-            
-        serializer = self.get_serializer(queryset, many=True)
-        return APIResponse.success(data=serializer.data)
-
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
@@ -74,6 +79,12 @@ class ArtistListView(generics.ListCreateAPIView):
             status_code=status.HTTP_400_BAD_REQUEST
         )
 
+class ArtistChangeFeedView(ChangeFeedView):
+    queryset = Artist.all_objects.select_related('user')
+    serializer_class = ArtistSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+
 class ArtistDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Artist.active_objects.all()
     serializer_class = ArtistSerializer
@@ -166,21 +177,25 @@ class ReviewListView(generics.ListCreateAPIView):
         )
     
 
-class ArtistPortfolioListView(generics.ListCreateAPIView):
+class ArtistPortfolioListView(StreamingListMixin, generics.ListCreateAPIView):
     queryset = ArtistPortfolioItem.active_objects.all()
     serializer_class = ArtistPortfolioItemSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = {
+        'artist': ['exact'],
+        'media_type': ['exact'],
+    }
     
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.filter_queryset(self.get_queryset()).order_by('-created_at', 'pk')
         page = self.paginate_queryset(queryset)
         
         if page is not None:
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
             
-        serializer = self.get_serializer(queryset, many=True)
-        return APIResponse.success(data=serializer.data)
+        return self.streaming_list_response(queryset)
     
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -205,22 +220,27 @@ class ArtistPortfolioListView(generics.ListCreateAPIView):
         )
     
 
-class ArtistAvailabilityView(generics.ListCreateAPIView):
+class ArtistAvailabilityView(StreamingListMixin, generics.ListCreateAPIView):
     queryset = ArtistAvailability.active_objects.all()
     serializer_class = ArtistAvailabilitySerializer
     permission_classes = [permissions.IsAuthenticated]
-
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = {
+        'artist': ['exact'],
+        'date': ['exact', 'gte', 'lte'],
+        'is_available': ['exact'],
+    }
 
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset().filter(date__gte=timezone.now().date()))
+        queryset = queryset.order_by('date', 'start_time', 'pk')
         page = self.paginate_queryset(queryset)
         
         if page is not None:
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
             
-        serializer = self.get_serializer(queryset, many=True)
-        return APIResponse.success(data=serializer.data)
+        return self.streaming_list_response(queryset)
     
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -243,6 +263,45 @@ class ArtistAvailabilityView(generics.ListCreateAPIView):
 
 
 
+class ArtistAvailabilitySearchView(generics.ListAPIView):
+    """
+    Artists free for the whole of ``start_time``-``end_time`` on every
+    matching day between ``start_date`` and ``end_date`` (``match=any`` for at
+    least one), answered from the per-day availability bitmaps.
+    """
+    serializer_class = ArtistSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    throttle_scope = 'search'
+    pagination_class = CustomPagination
+
+    def list(self, request, *args, **kwargs):
+        search = AvailabilitySearchSerializer(data=request.query_params)
+        if not search.is_valid():
+            return APIResponse.error(
+                message="Invalid availability search",
+                errors=search.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        artist_ids = free_artist_ids(
+            search.validated_data['dates'],
+            search.validated_data['start_time'],
+            search.validated_data['end_time'],
+            match_all=search.validated_data['match'] == 'all'
+        )
+        queryset = Artist.active_objects.filter(
+            pk__in=artist_ids, available_for_booking=True
+        ).select_related('user').order_by('stage_name', 'pk')
+        page = self.paginate_queryset(queryset)
+
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return APIResponse.success(data=serializer.data)
+
+
 class ArtistAvailabilityDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = ArtistAvailability.active_objects.all()
     serializer_class = ArtistAvailabilitySerializer
@@ -270,4 +329,73 @@ class ArtistAvailabilityDetailView(generics.RetrieveUpdateDestroyAPIView):
         instance = self.get_object()
         validate_artist_profile_management(instance.artist, request)
         instance.delete()
-        return APIResponse.success(message="Availability removed successfully")
\ No newline at end of file
+        return APIResponse.success(message="Availability removed successfully")
+
+
+class SimilarArtistsView(generics.ListAPIView):
+    serializer_class = ArtistRecommendationSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    def get_queryset(self):
+        return ArtistRecommendation.objects.filter(
+            artist_id=self.kwargs['pk'],
+            recommended__is_active=True
+        ).select_related('recommended__user').order_by('rank')
+
+    def list(self, request, *args, **kwargs):
+        query = RecommendationQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return APIResponse.error(
+                message="Invalid recommendation query",
+                errors=query.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        limit = query.validated_data.get('limit', settings.ARTIST_RECOMMENDATION_SETTINGS['TOP_K'])
+        serializer = self.get_serializer(self.get_queryset()[:limit], many=True)
+        return APIResponse.success(data=serializer.data)
+
+
+class EventArtistRecommendationView(generics.GenericAPIView):
+    """
+    Artists for an event: neighbours of the artists already booked for it or,
+    failing that, of artists previously booked at its venue.
+    """
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+    def get(self, request, *args, **kwargs):
+        query = EventRecommendationQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return APIResponse.error(
+                message="An integer event and optional integer limit are required",
+                errors=query.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        limit = query.validated_data.get('limit', settings.ARTIST_RECOMMENDATION_SETTINGS['TOP_K'])
+        event = get_object_or_404(Event.active_objects.all(), pk=query.validated_data['event'])
+
+        bookings = Booking.active_objects.exclude(status=BookingStatus.CANCELLED)
+        booked = set(bookings.filter(event=event).values_list('artist_id', flat=True))
+        seeds = booked or set(
+            bookings.filter(event__venue_id=event.venue_id).values_list('artist_id', flat=True)
+        )
+        seeds.discard(None)
+
+        scores, artists = {}, {}
+        for recommendation in ArtistRecommendation.objects.filter(
+            artist_id__in=seeds,
+            recommended__is_active=True,
+            recommended__available_for_booking=True
+        ).exclude(recommended_id__in=booked).select_related('recommended__user'):
+            scores[recommendation.recommended_id] = scores.get(recommendation.recommended_id, 0) + recommendation.score
+            artists[recommendation.recommended_id] = recommendation.recommended
+
+        ranked = sorted(scores, key=lambda artist_id: (-scores[artist_id], artist_id))[:limit]
+        data = [
+            {
+                'rank': rank,
+                'score': round(scores[artist_id], 4),
+                'artist_details': ArtistSerializer(artists[artist_id]).data
+            }
+            for rank, artist_id in enumerate(ranked, start=1)
+        ]
+        return APIResponse.success(data=data)
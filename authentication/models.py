@@ -14,7 +14,11 @@ class User(BaseModel, AbstractUser):
     email = models.EmailField(verbose_name="email address", unique=True)
     middle_name = models.CharField(max_length=200, null=True, blank=True)
     phone_number = models.CharField(max_length=15, null=True, blank=True)
-    profile_picture = models.ImageField(upload_to='profile_pictures/', blank=True, null=True, validators=[ProfilePictureValidator.validate_all])
+    profile_picture = models.ImageField(upload_to='profile_pictures/', blank=True, null=True, validators=[ProfilePictureValidator.validate_upload])
+    # Maintained by booking.signals; see booking.counters.
+    bookings_count = models.IntegerField(default=0, editable=False)
+    total_spend = models.DecimalField(max_digits=14, decimal_places=2, default=0, editable=False)
+    counter_fields = ('bookings_count', 'total_spend')
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
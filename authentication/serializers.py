@@ -36,7 +36,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     
     def validate_profile_picture(self, value):
         try:
-            ProfilePictureValidator.validate_all(value)
+            ProfilePictureValidator.validate_upload(value)
         except ValidationError as e:
             raise serializers.ValidationError(str(e))
         return value
@@ -101,12 +101,19 @@ class UserProfileSerializer(serializers.ModelSerializer):
         return value
     def validate_profile_picture(self, value):
         try:
-            ProfilePictureValidator.validate_all(value)
+            ProfilePictureValidator.validate_upload(value)
         except ValidationError as e:
             raise serializers.ValidationError(str(e))
         return value
     
 
+class UserAccountSerializer(UserProfileSerializer):
+    """The profile plus the user's own booking counters, for the user and staff only."""
+    class Meta(UserProfileSerializer.Meta):
+        fields = UserProfileSerializer.Meta.fields + ['bookings_count', 'total_spend']
+        read_only_fields = UserProfileSerializer.Meta.read_only_fields + ['bookings_count', 'total_spend']
+
+
 class UserUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -119,7 +126,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
     
     def validate_profile_picture(self, value):
         try:
-            ProfilePictureValidator.validate_all(value)
+            ProfilePictureValidator.validate_upload(value)
         except ValidationError as e:
             raise serializers.ValidationError(str(e))
         return value
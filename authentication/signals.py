@@ -0,0 +1,18 @@
+from django.db.models.signals import post_init, post_save
+from django.dispatch import receiver
+
+from authentication.models import User
+from authentication.tasks import check_profile_picture
+
+
+@receiver(post_init, sender=User)
+def remember_profile_picture(sender, instance, **kwargs):
+    instance._checked_picture = instance.__dict__.get('profile_picture')
+
+
+@receiver(post_save, sender=User)
+def queue_profile_picture_check(sender, instance, **kwargs):
+    name = instance.profile_picture.name if instance.profile_picture else ''
+    if name and name != str(instance._checked_picture or ''):
+        check_profile_picture.delay(str(instance.pk), name)
+    instance._checked_picture = name
@@ -0,0 +1,23 @@
+from django.core.exceptions import ValidationError
+
+from authentication.models import User
+from base.validators import ProfilePictureValidator
+from tasks.queue import task
+
+
+@task
+def check_profile_picture(user_id, name):
+    """
+    Decode an uploaded profile picture off the request thread and drop it if
+    its dimensions are too small. Skipped if the picture has been replaced
+    since the check was queued.
+    """
+    user = User.all_objects.filter(pk=user_id).first()
+    if user is None or not user.profile_picture or user.profile_picture.name != name:
+        return
+    try:
+        with user.profile_picture.open('rb') as picture:
+            ProfilePictureValidator.validate_dimensions(picture)
+    except ValidationError:
+        user.profile_picture.delete(save=False)
+        User.all_objects.filter(pk=user_id, profile_picture=name).update(profile_picture='')
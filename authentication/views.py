@@ -9,6 +9,7 @@ from authentication.serializers import (
     UserRegistrationSerializer,
     UserLoginSerializer,
     UserProfileSerializer,
+    UserAccountSerializer,
     UserUpdateSerializer,
     ChangePasswordSerializer
 )
@@ -46,6 +47,7 @@ class UserRegistrationView(generics.GenericAPIView):
 class UserLoginView(generics.GenericAPIView):
     serializer_class = UserLoginSerializer
     permission_classes = [permissions.AllowAny]
+    throttle_scope = 'login'
     
     def post(self, request):
         serializer = self.get_serializer(data=request.data, context={'request': request})
@@ -69,7 +71,7 @@ class UserLoginView(generics.GenericAPIView):
     
 
 class UserProfileView(generics.RetrieveAPIView):
-    serializer_class = UserProfileSerializer
+    serializer_class = UserAccountSerializer
     permission_classes = [permissions.IsAuthenticated]
     
     def get_object(self):
@@ -95,7 +97,7 @@ class UserUpdateView(generics.UpdateAPIView):
         if serializer.is_valid():
             serializer.save()
             return APIResponse.success(
-                data=UserProfileSerializer(instance).data,
+                data=UserAccountSerializer(instance).data,
                 message="Profile updated successfully"
             )
         
@@ -152,7 +154,7 @@ class UserLogoutView(APIView):
 
 
 class UserListView(generics.ListAPIView):
-    serializer_class = UserProfileSerializer
+    serializer_class = UserAccountSerializer
     permission_classes = [permissions.IsAdminUser]
     queryset = User.objects.all()
     pagination_class=CustomPagination
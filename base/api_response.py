@@ -1,5 +1,7 @@
 # utils/api_response.py
+from rest_framework.exceptions import Throttled
 from rest_framework.response import Response
+from rest_framework.views import exception_handler
 from typing import Any, Dict, List, Optional
 
 class APIResponse:
@@ -36,4 +38,22 @@ class APIResponse:
             "message": message,
             "errors": errors or []
         }
-        return Response(response, status=status_code)
\ No newline at end of file
+        return Response(response, status=status_code)
+
+
+def api_exception_handler(exc, context):
+    """
+    DRF's exception handler, except throttled requests get the standard
+    error envelope while keeping the ``Retry-After`` header.
+    """
+    response = exception_handler(exc, context)
+    if isinstance(exc, Throttled) and response is not None:
+        throttled = APIResponse.error(
+            message="Too many requests, please retry later",
+            status_code=response.status_code,
+            errors=[{"retry_after": exc.wait}] if exc.wait is not None else None
+        )
+        for header, value in response.items():
+            throttled[header] = value
+        return throttled
+    return response
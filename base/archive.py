@@ -0,0 +1,120 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+
+def archive_model(model, related=None):
+    """
+    Build the archive table for ``model``: the same columns in the same
+    order, so rows can be copied with ``INSERT ... SELECT`` and read back
+    through a ``UNION ALL``. Foreign keys keep their columns but lose their
+    constraints, and timestamps are copied as they are. ``related`` maps a
+    foreign key to the archive model it should follow instead, e.g. a
+    payment's booking. The archive is reachable as ``model.archive_model``.
+    """
+    related = related or {}
+    attrs = {'__module__': model.__module__, 'objects': models.Manager()}
+    for field in model._meta.concrete_fields:
+        if field.is_relation:
+            # Built by hand: deconstruct() on a relation needs the app registry.
+            attrs[field.name] = type(field)(
+                related.get(field.name, field.remote_field.model), on_delete=models.DO_NOTHING,
+                null=field.null, blank=field.blank, db_constraint=False, related_name='+'
+            )
+            continue
+        name, _, args, kwargs = field.deconstruct()
+        for option in ('auto_now', 'auto_now_add', 'auto_created'):
+            kwargs.pop(option, None)
+        attrs[name] = type(field)(*args, **kwargs)
+    attrs['Meta'] = type('Meta', (), {
+        'app_label': model._meta.app_label,
+        'db_table': f'{model._meta.db_table}_archive',
+        'ordering': model._meta.ordering,
+        'verbose_name': f'archived {model._meta.verbose_name}',
+    })
+    archive = type(f'Archived{model.__name__}', (models.Model,), attrs)
+    model.archive_model = archive
+    return archive
+
+
+def soft_deleted(now):
+    """Rows soft-deleted longer than ``SOFT_DELETED_AFTER_DAYS`` ago."""
+    cutoff = now - timedelta(days=settings.ARCHIVE_SETTINGS['SOFT_DELETED_AFTER_DAYS'])
+    return Q(is_active=False) & (Q(deleted_at__lt=cutoff) | Q(deleted_at__isnull=True, updated_at__lt=cutoff))
+
+
+class ArchivePolicy:
+    """
+    Which rows of ``model`` to archive: ``eligible(now)`` returns the
+    condition. ``dependents`` lists ``(model, foreign key)`` pairs whose rows
+    move in the same transaction as the rows they point at.
+    """
+
+    def __init__(self, model, eligible, dependents=()):
+        self.model = model
+        self.eligible = eligible
+        self.dependents = dependents
+
+
+def _move(model, condition):
+    """Copy the matching rows into the archive table, then delete them. Returns the row count."""
+    archive = model.archive_model
+    fields = model._meta.concrete_fields
+    rows = model.all_objects.filter(condition).order_by()
+    select, params = rows.values_list(*(field.attname for field in fields)).query.sql_with_params()
+    columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.execute(f'INSERT INTO {connection.ops.quote_name(archive._meta.db_table)} ({columns}) {select}', params)
+    # A raw delete: archiving is not deleting, so no delete signals or
+    # SET_NULL cascades should run and counters keep the archived rows.
+    return rows._raw_delete(connection.alias)
+
+
+def archive_batch(policy, now, batch_size):
+    """Move up to ``batch_size`` eligible rows, and their dependents, in one transaction."""
+    model = policy.model
+    with transaction.atomic():
+        candidates = model.all_objects.filter(policy.eligible(now)).order_by('pk')
+        if connection.features.has_select_for_update_skip_locked:
+            # Lock only this table's rows: a policy may join related tables,
+            # and Postgres refuses FOR UPDATE on the nullable side of a LEFT JOIN.
+            of = ('self',) if connection.features.has_select_for_update_of else ()
+            candidates = candidates.select_for_update(skip_locked=True, of=of)
+        pks = list(candidates.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return 0
+        moved = 0
+        for dependent, field in policy.dependents:
+            dependent_pks = list(dependent.all_objects.filter(**{f'{field}__in': pks}).values_list('pk', flat=True))
+            if dependent_pks:
+                moved += _move(dependent, Q(pk__in=dependent_pks))
+        return moved + _move(model, Q(pk__in=pks))
+
+
+def archive_rows(policies, batch_size=None, max_batches=None, now=None):
+    """
+    Run each policy in batches until nothing is left (or ``max_batches``
+    per policy). Returns ``{model label: (rows moved, seconds)}``, the rows
+    including dependents.
+    """
+    config = settings.ARCHIVE_SETTINGS
+    batch_size = batch_size or config['BATCH_SIZE']
+    now = now or timezone.now()
+    report = {}
+    for policy in policies:
+        started = time.perf_counter()
+        moved = batches = 0
+        while max_batches is None or batches < max_batches:
+            count = archive_batch(policy, now, batch_size)
+            if not count:
+                break
+            moved += count
+            batches += 1
+            if config['PAUSE_SECONDS']:
+                time.sleep(config['PAUSE_SECONDS'])
+        report[policy.model._meta.label] = (moved, time.perf_counter() - started)
+    return report
@@ -117,4 +117,26 @@ class AbstractCRUD:
         try:
             return cls.model.active_objects.bulk_update(instances, fields, batch_size=batch_size)
         except Exception as e:
-            raise ValueError(f"Bulk update failed for {cls.model.__name__}: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Bulk update failed for {cls.model.__name__}: {str(e)}")
+    
+    @classmethod
+    def bulk_soft_delete(cls, filters: Dict[str, Any]) -> Dict[str, int]:
+        """Soft-delete every active row matching ``filters``, cascading as the model configures; returns counts per model."""
+        cls.validate_model_class()
+        
+        try:
+            _, counts = cls.model.active_objects.filter(**filters).soft_delete()
+            return counts
+        except Exception as e:
+            raise ValueError(f"Bulk soft delete failed for {cls.model.__name__}: {str(e)}")
+    
+    @classmethod
+    def bulk_restore(cls, filters: Dict[str, Any]) -> Dict[str, int]:
+        """Restore every soft-deleted row matching ``filters`` and what was deleted with it; returns counts per model."""
+        cls.validate_model_class()
+        
+        try:
+            _, counts = cls.model.all_objects.filter(**filters).restore()
+            return counts
+        except Exception as e:
+            raise ValueError(f"Bulk restore failed for {cls.model.__name__}: {str(e)}")
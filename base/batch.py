@@ -0,0 +1,143 @@
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connections
+from django.urls import Resolver404, resolve
+from rest_framework import status
+
+
+class BatchDispatcher:
+    """
+    Runs batched sub-requests through the URL resolver in-process, reusing the
+    user already authenticated on the outer request instead of decoding the
+    JWT and running the middleware stack once per sub-request.
+    """
+
+    STRIPPED_META_KEYS = ('HTTP_AUTHORIZATION', 'HTTP_COOKIE', 'CONTENT_TYPE', 'CONTENT_LENGTH')
+
+    def __init__(self, request, view_class=None, max_workers=None):
+        self.request = request
+        self.view_class = view_class
+        self.max_workers = max_workers or settings.BATCH_REQUEST_SETTINGS['MAX_WORKERS']
+
+    def dispatch(self, sub_requests, parallel=False):
+        """
+        Execute sub-requests in order. With ``parallel`` set, consecutive GETs
+        are run concurrently; any write acts as a barrier so reads issued
+        after it observe its effects.
+        """
+        results = [None] * len(sub_requests)
+        pending_reads = []
+
+        for index, sub_request in enumerate(sub_requests):
+            if parallel and sub_request['method'] == 'GET':
+                pending_reads.append((index, sub_request))
+                continue
+
+            self._run_concurrently(pending_reads, results)
+            pending_reads = []
+            results[index] = self.execute(sub_request)
+
+        self._run_concurrently(pending_reads, results)
+        return results
+
+    def execute(self, sub_request):
+        url = urlsplit(sub_request['path'])
+
+        try:
+            match = resolve(url.path)
+        except Resolver404:
+            return self._result(sub_request, status.HTTP_404_NOT_FOUND, {
+                "success": False,
+                "message": f"No endpoint matches {url.path}",
+                "errors": []
+            })
+
+        if self.view_class and getattr(match.func, 'view_class', None) is self.view_class:
+            return self._result(sub_request, status.HTTP_400_BAD_REQUEST, {
+                "success": False,
+                "message": "Batch requests cannot be nested",
+                "errors": []
+            })
+
+        http_request = self._build_request(sub_request, url)
+        try:
+            response = match.func(http_request, *match.args, **match.kwargs)
+        except Exception as e:
+            return self._result(sub_request, status.HTTP_500_INTERNAL_SERVER_ERROR, {
+                "success": False,
+                "message": f"Sub-request failed: {str(e)}",
+                "errors": []
+            })
+
+        return self._result(sub_request, response.status_code, self._response_body(response))
+
+    def _run_concurrently(self, indexed_requests, results):
+        if len(indexed_requests) <= 1:
+            for index, sub_request in indexed_requests:
+                results[index] = self.execute(sub_request)
+            return
+
+        workers = min(self.max_workers, len(indexed_requests))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = executor.map(
+                self._execute_in_thread,
+                [sub_request for _, sub_request in indexed_requests]
+            )
+            for (index, _), result in zip(indexed_requests, responses):
+                results[index] = result
+
+    def _execute_in_thread(self, sub_request):
+        try:
+            return self.execute(sub_request)
+        finally:
+            connections.close_all()
+
+    def _build_request(self, sub_request, url):
+        body = b''
+        if sub_request.get('body') is not None:
+            body = json.dumps(sub_request['body']).encode()
+
+        environ = {
+            key: value for key, value in self.request.META.items()
+            if key not in self.STRIPPED_META_KEYS
+        }
+        environ.update({
+            'REQUEST_METHOD': sub_request['method'],
+            'SCRIPT_NAME': '',
+            'PATH_INFO': url.path,
+            'QUERY_STRING': url.query,
+            'CONTENT_TYPE': 'application/json',
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': io.BytesIO(body),
+        })
+        http_request = WSGIRequest(environ)
+
+        user = getattr(self.request, 'user', None)
+        if user is not None and user.is_authenticated:
+            http_request._force_auth_user = user
+            http_request._force_auth_token = self.request.auth
+        return http_request
+
+    def _response_body(self, response):
+        if hasattr(response, 'data'):
+            return response.data
+
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+        if not content:
+            return None
+        try:
+            return json.loads(content)
+        except ValueError:
+            return content.decode(response.charset, errors='replace')
+
+    def _result(self, sub_request, status_code, body):
+        return {
+            "id": sub_request.get('id'),
+            "status": status_code,
+            "body": body
+        }
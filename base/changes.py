@@ -0,0 +1,89 @@
+import datetime
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import generics, status
+
+from base.api_response import APIResponse
+
+CURSOR_SALT = 'base.change-feed'
+
+
+def encode_cursor(updated_at, pk):
+    return signing.dumps([updated_at.isoformat(), str(pk)], salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(cursor):
+    """Return ``(updated_at, pk)`` or raise ``signing.BadSignature``."""
+    try:
+        updated_at, pk = signing.loads(cursor, salt=CURSOR_SALT)
+        return parse_datetime(updated_at), pk
+    except (TypeError, ValueError) as exc:
+        raise signing.BadSignature(str(exc))
+
+
+class ChangeFeedView(generics.GenericAPIView):
+    """
+    Rows changed since an opaque ``cursor``, oldest first by ``(updated_at, pk)``.
+    Soft-deleted rows come back as tombstones. Subclasses set ``serializer_class``
+    and return their visible rows, deleted ones included, from ``get_queryset``.
+
+    Rows younger than ``SETTLE_SECONDS`` are held back so a write committed
+    just after a page was read cannot land behind the cursor.
+    """
+
+    def get(self, request, *args, **kwargs):
+        feed_settings = settings.CHANGE_FEED_SETTINGS
+        try:
+            limit = min(int(request.query_params.get('limit', feed_settings['PAGE_SIZE'])), feed_settings['MAX_PAGE_SIZE'])
+            if limit <= 0:
+                raise ValueError(limit)
+        except ValueError:
+            return APIResponse.error(
+                message="limit must be a positive integer",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        settled = timezone.now() - datetime.timedelta(seconds=feed_settings['SETTLE_SECONDS'])
+        queryset = self.get_queryset().filter(updated_at__lte=settled)
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            try:
+                updated_at, pk = decode_cursor(cursor)
+            except signing.BadSignature:
+                return APIResponse.error(
+                    message="Invalid cursor",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            queryset = queryset.filter(Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, pk__gt=pk))
+
+        rows = list(queryset.order_by('updated_at', 'pk')[:limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        changes = [self.serialize_change(row) for row in rows]
+        next_cursor = encode_cursor(rows[-1].updated_at, rows[-1].pk) if rows else cursor
+        return APIResponse.success(data={
+            'changes': changes,
+            'cursor': next_cursor,
+            'has_more': has_more
+        })
+
+    def serialize_change(self, instance):
+        if not instance.is_active:
+            return {
+                'id': instance.pk,
+                'updated_at': instance.updated_at,
+                'deleted': True,
+                'deleted_at': instance.deleted_at,
+                'data': None
+            }
+        return {
+            'id': instance.pk,
+            'updated_at': instance.updated_at,
+            'deleted': False,
+            'data': self.get_serializer(instance).data
+        }
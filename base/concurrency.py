@@ -0,0 +1,43 @@
+import random
+import time
+
+from django.conf import settings
+from django.db import transaction
+
+
+class ConcurrentUpdateError(Exception):
+    """A versioned row changed between being read and being saved."""
+
+    def __init__(self, instance):
+        self.instance = instance
+        super().__init__(
+            f"{type(instance).__name__} {instance.pk} was changed by another request (expected version {instance.version})"
+        )
+
+
+def update_with_retry(model, pk, apply, attempts=None):
+    """
+    Read-modify-write for a versioned model without holding row locks.
+    ``apply(instance)`` makes its change and returns the fields it touched,
+    or nothing when there is nothing to do. The save only lands if the row
+    still has the version that was read; otherwise the row is read again and
+    ``apply`` rerun, up to ``attempts`` times with a short jittered backoff.
+    Returns ``(instance, changed)``.
+    """
+    config = settings.OPTIMISTIC_LOCKING_SETTINGS
+    attempts = attempts or config['MAX_ATTEMPTS']
+    for attempt in range(1, attempts + 1):
+        instance = model.all_objects.get(pk=pk)
+        fields = apply(instance)
+        if not fields:
+            return instance, False
+        try:
+            # A savepoint, so a conflict inside an outer transaction can be
+            # retried instead of leaving that transaction unusable.
+            with transaction.atomic():
+                instance.save(update_fields=fields)
+            return instance, True
+        except ConcurrentUpdateError:
+            if attempt == attempts:
+                raise
+            time.sleep(config['RETRY_BACKOFF_SECONDS'] * attempt * random.uniform(0.5, 1.5))
@@ -32,3 +32,10 @@ class MEDIATYPE(TextChoices):
     IMAGE='IMAGE'
     VIDEO='VIDEO'
     AUDIO='AUDIO'
+
+
+class TaskStatus(TextChoices):
+    QUEUED='QUEUED'
+    RUNNING='RUNNING'
+    SUCCEEDED='SUCCEEDED'
+    FAILED='FAILED'
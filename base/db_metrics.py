@@ -0,0 +1,44 @@
+from django.db import connections
+
+
+def connection_pool_stats():
+    """
+    Report connection reuse for every configured database. Pooled aliases
+    expose the psycopg pool counters; others report their persistent
+    connection settings.
+    """
+    stats = []
+    for alias in connections:
+        connection = connections[alias]
+        pool = getattr(connection, 'pool', None)
+        if pool is None:
+            stats.append({
+                'alias': alias,
+                'pooled': False,
+                'conn_max_age': connection.settings_dict.get('CONN_MAX_AGE', 0),
+                'health_checks': connection.settings_dict.get('CONN_HEALTH_CHECKS', False),
+            })
+            continue
+
+        pool_stats = pool.get_stats()
+        size = pool_stats.get('pool_size', 0)
+        available = pool_stats.get('pool_available', 0)
+        queued = pool_stats.get('requests_queued', 0)
+        wait_ms = pool_stats.get('requests_wait_ms', 0)
+        stats.append({
+            'alias': alias,
+            'pooled': True,
+            'min_size': pool_stats.get('pool_min', pool.min_size),
+            'max_size': pool_stats.get('pool_max', pool.max_size),
+            'size': size,
+            'checked_out': size - available,
+            'available': available,
+            'waiters': pool_stats.get('requests_waiting', 0),
+            'requests': pool_stats.get('requests_num', 0),
+            'queued_requests': queued,
+            'total_wait_ms': wait_ms,
+            'avg_wait_ms': round(wait_ms / queued, 2) if queued else 0,
+            'timeouts': pool_stats.get('requests_errors', 0),
+            'connections_opened': pool_stats.get('connections_num', 0),
+        })
+    return stats
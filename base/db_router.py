@@ -0,0 +1,54 @@
+import random
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+@dataclass
+class RoutingState:
+    use_replica: bool = False
+    wrote: bool = False
+
+
+# Set per request by ReplicaRoutingMiddleware. Outside a request (management
+# commands, background work) everything goes to the primary.
+routing_state: ContextVar[RoutingState] = ContextVar('routing_state', default=None)
+
+
+class ReplicaRouter:
+    """
+    Sends reads to a replica when the current request allows it and all writes
+    to the primary. Writes are recorded on the request state so the middleware
+    can pin the client to the primary for a short read-your-writes window.
+    """
+
+    def _replicas(self):
+        return getattr(settings, 'DATABASE_REPLICAS', [])
+
+    def db_for_read(self, model, **hints):
+        state = routing_state.get()
+        replicas = self._replicas()
+        if not replicas or state is None or not state.use_replica or state.wrote:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        pool = {DEFAULT_DB_ALIAS, *self._replicas()}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in self._replicas():
+            return False
+        return None
@@ -0,0 +1,141 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from base.api_response import APIResponse
+
+
+class TermsFacet:
+    """Counts for the most common values of ``field``."""
+    has_terms = True
+
+    def __init__(self, name, field=None):
+        self.name = name
+        self.field = field or name
+
+    def values(self, queryset, limit):
+        rows = queryset.order_by().values(self.field).annotate(count=Count('pk')).order_by('-count', self.field)
+        return [{'value': row[self.field], 'count': row['count']} for row in rows[:limit]]
+
+    def conditions(self, terms):
+        return [({'value': value}, Q(**{self.field: value})) for value in terms.get(self.name, [])]
+
+
+class BooleanFacet:
+    """Counts for true and false."""
+    has_terms = False
+
+    def __init__(self, name, field=None):
+        self.name = name
+        self.field = field or name
+
+    def conditions(self, terms):
+        return [({'value': value}, Q(**{self.field: value})) for value in (True, False)]
+
+
+class RangeFacet:
+    """Counts per bucket between consecutive ``edges``; the first and last buckets are open ended."""
+    has_terms = False
+
+    def __init__(self, name, edges, field=None):
+        self.name = name
+        self.field = field or name
+        self.edges = list(edges)
+
+    def conditions(self, terms):
+        bounds = [None, *self.edges, None]
+        buckets = []
+        for low, high in zip(bounds, bounds[1:]):
+            condition = Q()
+            if low is not None:
+                condition &= Q(**{f'{self.field}__gte': low})
+            if high is not None:
+                condition &= Q(**{f'{self.field}__lt': high})
+            buckets.append(({'from': low, 'to': high}, condition))
+        return buckets
+
+
+class FacetSet:
+    """
+    Facet counts for a list view. ``counts`` answers any filtered queryset
+    with a single conditional-aggregate query. The unfiltered counts are
+    cached as the facet table until ``invalidate`` is called or
+    ``FACET_SETTINGS['CACHE_TIMEOUT']`` passes. Terms facets count the values
+    listed in that table, so a filtered query never needs a GROUP BY.
+    """
+
+    def __init__(self, key, facets):
+        self.cache_key = f'facets:{key}'
+        self.facets = facets
+
+    def table(self, queryset):
+        """Facet counts for the unfiltered ``queryset``, built on a cache miss."""
+        table = cache.get(self.cache_key)
+        if table is None:
+            limit = settings.FACET_SETTINGS['TERMS_LIMIT']
+            terms = {
+                facet.name: [row['value'] for row in facet.values(queryset, limit)]
+                for facet in self.facets if facet.has_terms
+            }
+            table = self.counts(queryset, terms)
+            cache.set(self.cache_key, table, settings.FACET_SETTINGS['CACHE_TIMEOUT'])
+        return table
+
+    def counts(self, queryset, terms):
+        buckets, aggregates = [], {'total': Count('pk')}
+        for facet in self.facets:
+            for bucket, condition in facet.conditions(terms):
+                alias = f'facet_{len(buckets)}'
+                buckets.append((facet.name, bucket, alias))
+                aggregates[alias] = Count('pk', filter=condition)
+
+        totals = queryset.order_by().aggregate(**aggregates)
+        counts = {'total': totals['total'], **{facet.name: [] for facet in self.facets}}
+        for name, bucket, alias in buckets:
+            counts[name].append({**bucket, 'count': totals[alias]})
+        return counts
+
+    def terms(self, table):
+        """The values each terms facet counts, as listed in the facet table."""
+        return {
+            facet.name: [row['value'] for row in table[facet.name]]
+            for facet in self.facets if facet.has_terms
+        }
+
+    def invalidate(self):
+        cache.delete(self.cache_key)
+
+
+class FacetedListMixin:
+    """
+    Adds facet counts to a list response when ``?facets=true`` is passed.
+    Requests without filters are answered from the cached facet table.
+    """
+    facet_set = None
+    unfiltered_query_params = {'page', 'page_size', 'ordering', 'facets'}
+
+    def get_facets(self, queryset):
+        params = self.request.query_params
+        if params.get('facets', '').lower() not in ('1', 'true', 'yes'):
+            return None
+        table = self.facet_set.table(self.get_queryset())
+        if set(params) <= self.unfiltered_query_params:
+            return table
+        return self.facet_set.counts(queryset, self.facet_set.terms(table))
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        facets = self.get_facets(queryset)
+        page = self.paginate_queryset(queryset)
+
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            response = self.get_paginated_response(serializer.data)
+            if facets is not None:
+                response.data['data']['facets'] = facets
+            return response
+
+        serializer = self.get_serializer(queryset, many=True)
+        if facets is not None:
+            return APIResponse.success(data={'results': serializer.data, 'facets': facets})
+        return APIResponse.success(data=serializer.data)
@@ -0,0 +1,94 @@
+import math
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+EARTH_RADIUS_KM = 6371.0088
+MAX_PRECISION = 12
+
+# Approximate (width, height) of a geohash cell in km at the equator, by precision.
+CELL_SIZES_KM = {
+    1: (5009.4, 4992.6),
+    2: (1252.3, 624.1),
+    3: (156.5, 156.0),
+    4: (39.1, 19.5),
+    5: (4.89, 4.89),
+    6: (1.22, 0.61),
+    7: (0.153, 0.152),
+    8: (0.0382, 0.019),
+}
+
+
+def encode(latitude, longitude, precision=MAX_PRECISION):
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit_count, even = [], 0, 0, True
+
+    while len(chars) < precision:
+        value_range, value = (lng_range, longitude) if even else (lat_range, latitude)
+        middle = (value_range[0] + value_range[1]) / 2
+        if value >= middle:
+            bits = (bits << 1) | 1
+            value_range[0] = middle
+        else:
+            bits = bits << 1
+            value_range[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(BASE32[bits])
+            bits, bit_count = 0, 0
+    return ''.join(chars)
+
+
+def decode_bounds(geohash):
+    """Return ``(min_lat, max_lat, min_lng, max_lng)`` of a geohash cell."""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        bits = BASE32.index(char)
+        for shift in range(4, -1, -1):
+            value_range = lng_range if even else lat_range
+            middle = (value_range[0] + value_range[1]) / 2
+            if (bits >> shift) & 1:
+                value_range[0] = middle
+            else:
+                value_range[1] = middle
+            even = not even
+    return lat_range[0], lat_range[1], lng_range[0], lng_range[1]
+
+
+def neighbourhood(geohash):
+    """The cell itself and its eight neighbours at the same precision."""
+    min_lat, max_lat, min_lng, max_lng = decode_bounds(geohash)
+    height, width = max_lat - min_lat, max_lng - min_lng
+    center_lat, center_lng = (min_lat + max_lat) / 2, (min_lng + max_lng) / 2
+
+    cells = set()
+    for lat_step in (-1, 0, 1):
+        latitude = center_lat + lat_step * height
+        if not -90 <= latitude <= 90:
+            continue
+        for lng_step in (-1, 0, 1):
+            longitude = (center_lng + lng_step * width + 180) % 360 - 180
+            cells.add(encode(latitude, longitude, len(geohash)))
+    return cells
+
+
+def min_cell_dimension_km(precision, latitude):
+    width, height = CELL_SIZES_KM[precision]
+    return min(width * max(math.cos(math.radians(latitude)), 0.01), height)
+
+
+def precision_for_radius(radius_km, latitude):
+    """Finest precision whose cells are at least ``radius_km`` across, or 0 if none."""
+    for precision in range(max(CELL_SIZES_KM), 0, -1):
+        if min_cell_dimension_km(precision, latitude) >= radius_km:
+            return precision
+    return 0
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
@@ -0,0 +1,124 @@
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connection, connections
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authentication.models import User
+from base.db_metrics import connection_pool_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark a short authenticated request (user-profile) with a fresh "
+        "connection per request, persistent connections and, on Postgres with "
+        "psycopg 3, a shared connection pool. Runs on a throwaway test database."
+    )
+
+    MODES = ("fresh", "persistent", "pooled")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, help="Requests per mode")
+        parser.add_argument("--threads", type=int, default=4, help="Worker threads sharing the process")
+        parser.add_argument("--modes", default=",".join(self.MODES), help="Comma separated modes to run")
+
+    def handle(self, *args, **options):
+        modes = [mode for mode in options["modes"].split(",") if mode]
+        unknown = set(modes) - set(self.MODES)
+        if unknown:
+            raise CommandError(f"Unknown modes: {', '.join(sorted(unknown))}")
+
+        db_settings = connections.settings[DEFAULT_DB_ALIAS]
+        original = {
+            "CONN_MAX_AGE": db_settings.get("CONN_MAX_AGE", 0),
+            "CONN_HEALTH_CHECKS": db_settings.get("CONN_HEALTH_CHECKS", False),
+            "OPTIONS": dict(db_settings.get("OPTIONS", {})),
+        }
+        if "pooled" in modes and connection.vendor != "postgresql":
+            self.stdout.write("Skipping pooled mode: connection pooling needs Postgres with psycopg 3.")
+            modes.remove("pooled")
+
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        opened = []
+        counter = lambda sender, **kwargs: opened.append(1)
+        connection_created.connect(counter)
+        try:
+            user = User.objects.create_user(
+                email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+                username=uuid.uuid4().hex,
+                password=uuid.uuid4().hex,
+            )
+            headers = {"Authorization": f"Bearer {RefreshToken.for_user(user).access_token}"}
+            self.stdout.write(f"{options['requests']} user-profile requests per mode, {options['threads']} threads")
+
+            for mode in modes:
+                self.configure(db_settings, mode, original)
+                opened.clear()
+                latencies, elapsed = self.run(options, headers)
+                self.report(mode, latencies, elapsed, len(opened))
+                if mode == "pooled":
+                    for stats in connection_pool_stats():
+                        if stats["pooled"]:
+                            self.stdout.write(f"         pool {stats}")
+                    connection.close_pool()
+        finally:
+            connection_created.disconnect(counter)
+            self.configure(db_settings, None, original)
+            connections.close_all()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def configure(self, db_settings, mode, original):
+        options = {key: value for key, value in original["OPTIONS"].items() if key != "pool"}
+        if mode is None:
+            db_settings.update(original)
+            return
+        if mode == "fresh":
+            db_settings.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False, OPTIONS=options)
+        elif mode == "persistent":
+            db_settings.update(CONN_MAX_AGE=600, CONN_HEALTH_CHECKS=True, OPTIONS=options)
+        elif mode == "pooled":
+            pool = original["OPTIONS"].get("pool") or {"min_size": 1, "max_size": 4}
+            db_settings.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False, OPTIONS={**options, "pool": pool})
+
+    def run(self, options, headers):
+        url = reverse("user-profile")
+
+        def worker(count):
+            client = Client()
+            latencies = []
+            try:
+                for _ in range(count):
+                    # Emulate the request lifecycle a WSGI server drives;
+                    # the test client suppresses these connection hooks.
+                    close_old_connections()
+                    started = time.perf_counter()
+                    response = client.get(url, headers=headers)
+                    latencies.append(time.perf_counter() - started)
+                    close_old_connections()
+                    if response.status_code != 200:
+                        raise CommandError(f"user-profile returned {response.status_code}")
+            finally:
+                connections.close_all()
+            return latencies
+
+        threads = options["threads"]
+        shares = [options["requests"] // threads + (index < options["requests"] % threads) for index in range(threads)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(threads) as executor:
+            latencies = [latency for chunk in executor.map(worker, shares) for latency in chunk]
+        return latencies, time.perf_counter() - started
+
+    def report(self, mode, latencies, elapsed, opened):
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+        self.stdout.write(
+            f"{mode:<11} {len(latencies) / elapsed:8.1f} req/s  "
+            f"mean {statistics.mean(latencies) * 1000:6.2f}ms  p95 {p95 * 1000:6.2f}ms  "
+            f"connections opened {opened}"
+        )
@@ -0,0 +1,47 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the SQLite primary into each SQLite replica every --lag seconds, "
+        "simulating asynchronous replication for local testing of replica routing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lag", type=float, default=2.0, help="Seconds between replica refreshes")
+        parser.add_argument("--once", action="store_true", help="Refresh the replicas once and exit")
+
+    def handle(self, *args, **options):
+        primary = settings.DATABASES[DEFAULT_DB_ALIAS]
+        replicas = [
+            (alias, settings.DATABASES[alias]) for alias in settings.DATABASE_REPLICAS
+            if settings.DATABASES[alias]['ENGINE'] == 'django.db.backends.sqlite3'
+        ]
+        if primary['ENGINE'] != 'django.db.backends.sqlite3' or not replicas:
+            raise CommandError("Needs an SQLite primary and at least one SQLite replica (set USE_SQLITE_REPLICA=1).")
+
+        while True:
+            started = time.perf_counter()
+            for alias, config in replicas:
+                self.copy(primary['NAME'], config['NAME'])
+            self.stdout.write(
+                f"Refreshed {', '.join(alias for alias, _ in replicas)} in "
+                f"{(time.perf_counter() - started) * 1000:.1f}ms"
+            )
+            if options["once"]:
+                return
+            time.sleep(options["lag"])
+
+    def copy(self, source_name, target_name):
+        source = sqlite3.connect(str(source_name))
+        target = sqlite3.connect(str(target_name))
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
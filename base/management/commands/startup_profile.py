@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+IMPORT_SCRIPT = (
+    "import importlib, django; django.setup(); "
+    "from django.conf import settings; importlib.import_module(settings.ROOT_URLCONF)"
+)
+
+
+def parse_importtime(output):
+    """
+    Parse ``python -X importtime`` output into ``(name, depth, self_us,
+    cumulative_us)`` rows, in the order the interpreter reported them.
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if not self_us.strip().isdigit():
+            continue
+        stripped = name.lstrip(' ')
+        rows.append((stripped, (len(name) - len(stripped) - 1) // 2, int(self_us), int(cumulative_us)))
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Import Django and the URLconf (every app, model and view) in a fresh "
+        "interpreter, report where the import time goes and fail when it is "
+        "over the startup budget."
+    )
+
+    def add_arguments(self, parser):
+        profile_settings = settings.STARTUP_PROFILE_SETTINGS
+        parser.add_argument("--budget-ms", type=float, default=profile_settings['BUDGET_MS'],
+                            help="Fail when imports take longer than this")
+        parser.add_argument("--top", type=int, default=profile_settings['TOP'],
+                            help="Rows to show per table")
+        parser.add_argument("--depth", type=int, default=2,
+                            help="Deepest level of the import tree to show")
+        parser.add_argument("--runs", type=int, default=3,
+                            help="Fresh interpreters to sample; the fastest run is reported")
+
+    def handle(self, *args, **options):
+        runs = [self._profile() for _ in range(max(options["runs"], 1))]
+        wall_ms, rows = min(runs, key=lambda run: sum(row[3] for row in run[1] if row[1] == 0))
+        total_ms = sum(cumulative for _, depth, _, cumulative in rows if depth == 0) / 1000
+
+        self.stdout.write(f"Import tree, {total_ms:.1f}ms in imports, {wall_ms:.1f}ms wall including interpreter start")
+        tree = [row for row in rows if row[1] <= options["depth"]]
+        for name, depth, _, cumulative in sorted(tree, key=lambda row: -row[3])[:options["top"]]:
+            self.stdout.write(f"  {cumulative / 1000:8.1f}ms  {'  ' * depth}{name}")
+
+        packages = defaultdict(int)
+        for name, _, self_us, _ in rows:
+            packages[name.split('.')[0]] += self_us
+        self.stdout.write("Self time by top-level package")
+        for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:options["top"]]:
+            self.stdout.write(f"  {self_us / 1000:8.1f}ms  {package}")
+
+        if total_ms > options["budget_ms"]:
+            raise CommandError(f"Startup imports took {total_ms:.1f}ms, over the {options['budget_ms']:.0f}ms budget")
+        self.stdout.write(self.style.SUCCESS(
+            f"Startup imports took {total_ms:.1f}ms, within the {options['budget_ms']:.0f}ms budget"
+        ))
+
+    def _profile(self):
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+            capture_output=True, text=True, env=env
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+        if result.returncode:
+            raise CommandError(f"Importing the project failed:\n{result.stderr[-2000:]}")
+        return wall_ms, parse_importtime(result.stderr)
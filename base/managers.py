@@ -1,5 +1,11 @@
-from django.db import models
+from collections import Counter
+
+from django.db import models, transaction
+from django.db.models import F
 from django.contrib.auth.models import BaseUserManager
+from django.utils import timezone
+
+from base.signals import soft_delete_changed
 
 
 class UserManager(BaseUserManager):
@@ -32,7 +38,104 @@ class UserManager(BaseUserManager):
         return user
 
 
-class ActiveManager(models.Manager):
+class SoftDeleteQuerySet(models.QuerySet):
+    """
+    ``delete()`` soft-deletes with one UPDATE for the matching rows and one
+    per relation in the model's ``soft_delete_cascade``, however many rows
+    match. ``restore()`` undoes it, bringing back the cascaded rows that were
+    deleted together with their parent. Both return ``(total, {model label:
+    count})`` like ``QuerySet.delete()``; ``hard_delete()`` removes the rows.
+    """
+
+    def delete(self):
+        return self.soft_delete()
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def hard_delete(self):
+        return super().delete()
+
+    hard_delete.alters_data = True
+    hard_delete.queryset_only = True
+
+    def soft_delete(self):
+        with transaction.atomic(using=self.db):
+            counts = self._set_active(False, timezone.now())
+        return sum(counts.values()), dict(counts)
+
+    soft_delete.alters_data = True
+    soft_delete.queryset_only = True
+
+    def restore(self):
+        with transaction.atomic(using=self.db):
+            counts = self._set_active(True, None)
+        return sum(counts.values()), dict(counts)
+
+    restore.alters_data = True
+    restore.queryset_only = True
+
+    def cascade(self, active, deleted_at):
+        """
+        Soft-delete (or restore) the related rows of the matching rows, per
+        ``soft_delete_cascade``: ``[(related name, filters), ...]``. Runs
+        before the parents change, so a restore can match children on the
+        parent's ``deleted_at``.
+        """
+        counts = Counter()
+        for related_name, filters in getattr(self.model, 'soft_delete_cascade', ()):
+            relation = self.model._meta.get_field(related_name)
+            foreign_key = relation.field.name
+            children = relation.related_model.all_objects.filter(
+                **{f'{foreign_key}__in': self.values('pk')}, **filters
+            )
+            if active:
+                children = children.filter(deleted_at=F(f'{foreign_key}__deleted_at'))
+            counts.update(children._set_active(active, deleted_at))
+        return counts
+
+    def _set_active(self, active, deleted_at):
+        counts = self.cascade(active, deleted_at)
+        rows = self.filter(is_active=not active)
+        soft_delete_changed.send(sender=self.model, rows=rows, active=active)
+        # update() skips auto_now, and versioned rows must look changed to
+        # anyone holding the old version.
+        changes = {'is_active': active, 'deleted_at': deleted_at, 'updated_at': timezone.now()}
+        if any(field.name == 'version' for field in self.model._meta.concrete_fields):
+            changes['version'] = F('version') + 1
+        updated = rows.update(**changes)
+        if updated:
+            counts[self.model._meta.label] += updated
+        return counts
+
+
+class ActiveManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
     def get_queryset(self):
         return super(ActiveManager, self).get_queryset().filter(is_active=True)
 
+
+
+class ArchiveManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """
+    The ``all_objects`` manager. Rows moved out of the live table by
+    archival (see base.archive) are read through ``archived()``, or together
+    with the live rows through ``including_archived()``.
+    """
+
+    def archived(self):
+        archive = getattr(self.model, 'archive_model', None)
+        if archive is None:
+            return self.none()
+        return archive.objects.all()
+
+    def including_archived(self, *args, **kwargs):
+        """
+        Live and archived rows matching the filters as one ``UNION ALL``,
+        returned as instances of this model. The result can be ordered,
+        sliced and counted but not filtered further.
+        """
+        live = self.filter(*args, **kwargs).order_by()
+        archive = getattr(self.model, 'archive_model', None)
+        if archive is None:
+            return live
+        return live.union(archive.objects.filter(*args, **kwargs).order_by(), all=True)
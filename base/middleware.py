@@ -0,0 +1,79 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core import signing
+from rest_framework.permissions import SAFE_METHODS
+
+from base.db_router import RoutingState, routing_state
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Marks safe requests as eligible for replica reads unless the client is
+    pinned to the primary. A request that writes pins its client for
+    ``PIN_SECONDS`` through a signed cookie, echoed in a response header for
+    clients that do not keep cookies.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = settings.REPLICA_ROUTING_SETTINGS
+        self.signer = signing.TimestampSigner(salt='base.replica-pin')
+        # Stay async under ASGI so async views are not run through a thread.
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        state, token = self.enter(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            routing_state.reset(token)
+        return self.leave(state, response)
+
+    async def __acall__(self, request):
+        state, token = self.enter(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            routing_state.reset(token)
+        return self.leave(state, response)
+
+    def enter(self, request):
+        use_replica = request.method in SAFE_METHODS and not self.is_pinned(request)
+        state = RoutingState(use_replica=use_replica)
+        return state, routing_state.set(state)
+
+    def leave(self, state, response):
+        if state.wrote:
+            self.pin(response)
+        return response
+
+    def is_pinned(self, request):
+        value = (
+            request.headers.get(self.config['HEADER_NAME'])
+            or request.COOKIES.get(self.config['COOKIE_NAME'])
+        )
+        if not value:
+            return False
+        try:
+            self.signer.unsign(value, max_age=self.config['PIN_SECONDS'])
+        except signing.BadSignature:
+            return False
+        return True
+
+    def pin(self, response):
+        value = self.signer.sign('primary')
+        response.set_cookie(
+            self.config['COOKIE_NAME'],
+            value,
+            max_age=self.config['PIN_SECONDS'],
+            httponly=True,
+            samesite='Lax'
+        )
+        response[self.config['HEADER_NAME']] = value
@@ -1,29 +1,98 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
-from base.managers import ActiveManager
+from base.concurrency import ConcurrentUpdateError
+from base.managers import ActiveManager, ArchiveManager
 
 
 class BaseModel(models.Model):
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
-    all_objects = models.Manager()
+    all_objects = ArchiveManager()
     active_objects = ActiveManager()
 
+    # Denormalized counters written only with F() updates (booking.counters).
+    # They are left out of every save after the insert, so a copy read at the
+    # start of a request can never write stale values back.
+    counter_fields = ()
+
     class Meta:
         abstract = True
         ordering = [
             "-created_at",
         ]
 
+    def save(self, *args, **kwargs):
+        if self.counter_fields and not self._state.adding and not kwargs.get('force_insert'):
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                deferred = self.get_deferred_fields()
+                update_fields = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key and field.attname not in deferred
+                ]
+            kwargs['update_fields'] = [field for field in update_fields if field not in self.counter_fields]
+        return super().save(*args, **kwargs)
+
     def soft_delete(self):
-        self.is_active = False
-        self.deleted_at = timezone.now()
-        self.save()
+        with transaction.atomic():
+            self.is_active = False
+            self.deleted_at = timezone.now()
+            self.save()
+            type(self).all_objects.filter(pk=self.pk).cascade(False, self.deleted_at)
+
+    def restore(self):
+        with transaction.atomic():
+            # Children first: they are matched on this row's deleted_at.
+            type(self).all_objects.filter(pk=self.pk).cascade(True, None)
+            self.is_active = True
+            self.deleted_at = None
+            self.save(update_fields=['is_active', 'deleted_at', 'updated_at'])
 
     def delete(self):
         return self.soft_delete()
 
     def force_delete(self):
-        return super().delete()
\ No newline at end of file
+        return super().delete()
+
+
+class VersionedModel(BaseModel):
+    """
+    A BaseModel with optimistic concurrency control. Every update is a
+    compare-and-swap, ``UPDATE ... SET version = n + 1 WHERE pk = ... AND
+    version = n``, and raises ConcurrentUpdateError if another writer got
+    there first. Signals fire as usual. Inside a transaction, save within a
+    savepoint (``transaction.atomic()``) to carry on after catching it, as
+    ``update_with_retry`` does. Queryset ``update()`` and ``bulk_update()``
+    skip the check.
+    """
+    version = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta(BaseModel.Meta):
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            return super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'version', 'updated_at'}
+        self._expected_version = self.version
+        self.version += 1
+        try:
+            return super().save(*args, **kwargs)
+        except Exception:
+            self.version = self._expected_version
+            raise
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        expected = getattr(self, '_expected_version', None)
+        if expected is None:
+            return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
+        if super()._do_update(base_qs.filter(version=expected), using, pk_val, values, update_fields, forced_update):
+            return True
+        if base_qs.filter(pk=pk_val).exists():
+            self.version = expected
+            raise ConcurrentUpdateError(self)
+        return False
@@ -0,0 +1,39 @@
+from django.conf import settings
+from rest_framework import serializers
+
+
+class BatchSubRequestSerializer(serializers.Serializer):
+    METHOD_CHOICES = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']
+
+    id = serializers.CharField(max_length=100, required=False)
+    method = serializers.CharField(max_length=10, default='GET')
+    path = serializers.CharField(max_length=2000)
+    body = serializers.JSONField(required=False, allow_null=True, default=None)
+
+    def validate_method(self, value):
+        value = value.upper()
+        if value not in self.METHOD_CHOICES:
+            raise serializers.ValidationError(
+                f"Unsupported method. Allowed methods: {', '.join(self.METHOD_CHOICES)}"
+            )
+        return value
+
+    def validate_path(self, value):
+        if not value.startswith('/'):
+            raise serializers.ValidationError("Path must be absolute, e.g. /api/bookings/")
+        return value
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    requests = BatchSubRequestSerializer(many=True)
+    parallel = serializers.BooleanField(default=False)
+
+    def validate_requests(self, value):
+        max_requests = settings.BATCH_REQUEST_SETTINGS['MAX_REQUESTS']
+        if not value:
+            raise serializers.ValidationError("At least one sub-request is required.")
+        if len(value) > max_requests:
+            raise serializers.ValidationError(
+                f"A batch can contain at most {max_requests} sub-requests."
+            )
+        return value
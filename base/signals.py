@@ -0,0 +1,7 @@
+from django.dispatch import Signal
+
+# Sent by SoftDeleteQuerySet before each UPDATE that soft-deletes or restores
+# rows, since that UPDATE skips post_save. ``rows`` is a queryset of the rows
+# about to flip and ``active`` their new state. Work that has to see the new
+# state belongs in transaction.on_commit.
+soft_delete_changed = Signal()
@@ -0,0 +1,77 @@
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def _dumps(value):
+    return json.dumps(value, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':'))
+
+
+async def iterate_in_thread(chunks):
+    """
+    Async iterator over the sync iterator ``chunks``, advancing it one chunk
+    at a time through ``sync_to_async`` so each chunk is sent as it is made.
+    """
+    advance = sync_to_async(next)
+    try:
+        while True:
+            chunk = await advance(chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        if hasattr(chunks, 'close'):
+            await sync_to_async(chunks.close)()
+
+
+def streaming_response(request, chunks, **kwargs):
+    """
+    ``StreamingHttpResponse`` over the sync iterator ``chunks``. Under ASGI,
+    Django reads a sync iterator in full before sending anything, so there
+    it is wrapped in ``iterate_in_thread`` instead.
+    """
+    if isinstance(getattr(request, '_request', request), ASGIRequest):
+        chunks = iterate_in_thread(chunks)
+    return StreamingHttpResponse(chunks, **kwargs)
+
+
+def json_envelope(serialize, rows, chunk_size, message="Success"):
+    """
+    Yield the ``APIResponse.success`` envelope around ``rows`` piece by
+    piece, serializing ``chunk_size`` rows at a time with ``serialize``.
+    """
+    yield f'{{"success":true,"message":{_dumps(message)},"data":['
+    separator = ''
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        yield separator + ','.join(_dumps(item) for item in serialize(chunk))
+        separator = ','
+    yield ']}'
+
+
+class StreamingListMixin:
+    """
+    For list views without pagination: instead of serializing the whole
+    queryset into one response, read it through a chunked ``.iterator()``
+    and write the usual envelope as it goes, so memory stays flat however
+    many rows match. An error part way through can only cut the body short,
+    since the status line has already been sent.
+    """
+
+    def streaming_list_response(self, queryset):
+        chunk_size = settings.STREAMING_LIST_SETTINGS['CHUNK_SIZE']
+        rows = queryset.iterator(chunk_size=chunk_size)
+        response = streaming_response(
+            self.request,
+            json_envelope(lambda chunk: self.get_serializer(chunk, many=True).data, rows, chunk_size),
+            content_type='application/json'
+        )
+        response['X-Accel-Buffering'] = 'no'
+        return response
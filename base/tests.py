@@ -1,3 +1,98 @@
+import datetime
+from decimal import Decimal
+
 from django.test import TestCase
+from django.utils import timezone
+
+from authentication.models import User
+from base.signals import soft_delete_changed
+from booking.models import Booking, Event, Venue
+
+
+def create_venue(owner, name='Hall'):
+    return Venue.all_objects.create(
+        name=name, owner=owner, address='1 Road', city='Lagos', state='Lagos',
+        zip_code='100001', capacity=100, description=name
+    )
+
+
+def create_event(venue, title='Gig'):
+    start = timezone.now() + datetime.timedelta(days=7)
+    return Event.all_objects.create(
+        title=title, description=title, venue=venue, start_time=start,
+        end_time=start + datetime.timedelta(hours=2), ticket_price=Decimal('10.00')
+    )
+
+
+class SoftDeleteQuerySetTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(email='owner@example.com', username='owner', password='pass12345')
+        self.venues = [create_venue(self.owner, name) for name in ('Hall', 'Arena', 'Club')]
+
+    def test_delete_soft_deletes_matching_rows(self):
+        total, counts = Venue.all_objects.filter(name__in=['Hall', 'Arena']).delete()
+
+        self.assertEqual((total, counts), (2, {'booking.Venue': 2}))
+        self.assertEqual(Venue.all_objects.count(), 3)
+        self.assertEqual(list(Venue.active_objects.values_list('name', flat=True)), ['Club'])
+        self.assertFalse(Venue.all_objects.filter(is_active=False, deleted_at__isnull=True).exists())
+
+    def test_delete_skips_rows_already_deleted(self):
+        Venue.all_objects.filter(name='Hall').delete()
+        deleted_at = Venue.all_objects.get(name='Hall').deleted_at
+
+        self.assertEqual(Venue.all_objects.filter(name__in=['Hall', 'Arena']).delete(), (1, {'booking.Venue': 1}))
+        self.assertEqual(Venue.all_objects.get(name='Hall').deleted_at, deleted_at)
+
+    def test_restore(self):
+        Venue.all_objects.all().delete()
+
+        self.assertEqual(Venue.all_objects.filter(name='Hall').restore(), (1, {'booking.Venue': 1}))
+        venue = Venue.all_objects.get(name='Hall')
+        self.assertTrue(venue.is_active)
+        self.assertIsNone(venue.deleted_at)
+
+    def test_hard_delete_removes_rows(self):
+        total, counts = Venue.all_objects.filter(name='Hall').hard_delete()
+
+        self.assertEqual((total, counts), (1, {'booking.Venue': 1}))
+        self.assertFalse(Venue.all_objects.filter(name='Hall').exists())
+
+    def test_versioned_rows_change_version(self):
+        booking = Booking.all_objects.create(event=create_event(self.venues[0]), booker=self.owner)
+
+        Booking.all_objects.filter(pk=booking.pk).delete()
+        booking.refresh_from_db()
+        self.assertEqual(booking.version, 1)
+        self.assertFalse(booking.is_active)
+
+    def test_soft_delete_changed_sees_rows_before_update(self):
+        Venue.all_objects.filter(name='Club').delete()
+        seen = []
+
+        def receiver(sender, rows, active, **kwargs):
+            seen.append((sender, sorted(rows.values_list('name', 'is_active')), active))
+        soft_delete_changed.connect(receiver, sender=Venue)
+        self.addCleanup(soft_delete_changed.disconnect, receiver, sender=Venue)
+
+        Venue.all_objects.all().delete()
+        Venue.all_objects.filter(name='Hall').restore()
+
+        self.assertEqual(seen, [
+            (Venue, [('Arena', True), ('Hall', True)], False),
+            (Venue, [('Hall', False)], True),
+        ])
+
+    def test_counters_follow_soft_delete(self):
+        venue = self.venues[0]
+        events = [create_event(venue, title) for title in ('One', 'Two')]
+        venue.refresh_from_db()
+        self.assertEqual(venue.events_hosted_count, 2)
+
+        Event.all_objects.filter(pk=events[0].pk).delete()
+        venue.refresh_from_db()
+        self.assertEqual(venue.events_hosted_count, 1)
 
-# Create your tests here.
+        Event.all_objects.filter(pk=events[0].pk).restore()
+        venue.refresh_from_db()
+        self.assertEqual(venue.events_hosted_count, 2)
@@ -0,0 +1,159 @@
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """``'10/min'`` -> ``(10, 60)``: bucket capacity and the seconds it takes to refill."""
+    count, period = rate.split('/')
+    return int(count), PERIODS[period.strip()[0]]
+
+
+class _Bucket:
+    __slots__ = ('capacity', 'period', 'tokens', 'updated', 'pending', 'synced', 'blocked_until')
+
+    def __init__(self, capacity, period, now):
+        self.capacity = capacity
+        self.period = period
+        self.tokens = float(capacity)
+        self.updated = now
+        self.pending = 0
+        self.synced = now
+        self.blocked_until = 0.0
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets checked in process memory and reconciled with a shared
+    cache every so often.
+
+    Each process refills and spends its own copy of a bucket without I/O.
+    Spent tokens are batched and added to a per-period counter in the cache
+    with one atomic ``incr``. Once that counter shows the key's capacity is
+    used up across all processes, the key is blocked locally until the
+    period ends. Overshoot is bounded by one sync batch per process.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, limits):
+        """
+        Take one token from every ``(key, capacity, period)`` in ``limits``,
+        or from none of them. Returns 0 when allowed, otherwise the seconds to
+        wait before retrying.
+        """
+        rate_settings = settings.RATE_LIMIT_SETTINGS
+        now, wall = time.monotonic(), time.time()
+        to_sync = []
+
+        with self._lock:
+            buckets, wait = [], 0.0
+            for key, capacity, period in limits:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = _Bucket(capacity, period, now)
+                bucket.tokens = min(capacity, bucket.tokens + (now - bucket.updated) * capacity / period)
+                bucket.updated = now
+                if bucket.tokens < 1:
+                    wait = max(wait, (1 - bucket.tokens) * period / capacity)
+                if bucket.blocked_until > wall:
+                    wait = max(wait, bucket.blocked_until - wall)
+                buckets.append((key, bucket))
+            if wait:
+                return wait
+
+            for key, bucket in buckets:
+                bucket.tokens -= 1
+                bucket.pending += 1
+                batch = max(1, int(bucket.capacity * rate_settings['SYNC_FRACTION']))
+                if bucket.pending >= batch or now - bucket.synced >= rate_settings['SYNC_INTERVAL_SECONDS']:
+                    to_sync.append((key, bucket, bucket.pending))
+                    bucket.pending = 0
+                    bucket.synced = now
+
+            if len(self._buckets) > rate_settings['MAX_LOCAL_KEYS']:
+                self._prune(now)
+
+        for key, bucket, count in to_sync:
+            self._sync(key, bucket, count, wall)
+        return 0
+
+    def _sync(self, key, bucket, count, wall):
+        window = int(wall // bucket.period)
+        cache_key = f"throttle:{key}:{window}"
+        cache = caches[settings.RATE_LIMIT_SETTINGS['CACHE_ALIAS']]
+        cache.add(cache_key, 0, timeout=bucket.period * 2)
+        try:
+            used = cache.incr(cache_key, count)
+        except ValueError:
+            # Expired between add and incr; start the window over.
+            cache.add(cache_key, count, timeout=bucket.period * 2)
+            used = count
+        if used >= bucket.capacity:
+            bucket.blocked_until = (window + 1) * bucket.period
+
+    def _prune(self, now):
+        for key, bucket in list(self._buckets.items()):
+            if bucket.pending == 0 and now - bucket.updated > bucket.period:
+                del self._buckets[key]
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+rate_limiter = TokenBucketLimiter()
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Per-user, per-IP and per-route token buckets for views that set
+    ``throttle_scope``. Rates come from ``RATE_LIMIT_SETTINGS['RATES'][scope]``.
+    A kind with no rate is not limited, and anonymous requests skip the
+    user bucket.
+    """
+
+    def allow_request(self, request, view):
+        self.wait_seconds = 0
+        scope = getattr(view, 'throttle_scope', None)
+        rates = settings.RATE_LIMIT_SETTINGS['RATES'].get(scope)
+        if not rates:
+            return True
+
+        user = getattr(request, 'user', None)
+        identities = {
+            'user': user.pk if user is not None and user.is_authenticated else None,
+            'ip': self.get_ident(request),
+            'route': view.__class__.__name__,
+        }
+        limits = [
+            (f"{scope}:{kind}:{identities[kind]}", *parse_rate(rate))
+            for kind, rate in rates.items()
+            if rate and identities.get(kind) is not None
+        ]
+        self.wait_seconds = rate_limiter.acquire(limits)
+        return not self.wait_seconds
+
+    def wait(self):
+        return math.ceil(self.wait_seconds) if self.wait_seconds else None
+
+
+class ReadThrottleMixin:
+    """
+    Applies the view's ``throttle_scope`` to safe methods only, so creates on
+    a list endpoint do not spend the budget meant for its searches.
+    """
+
+    def get_throttles(self):
+        if self.request.method not in SAFE_METHODS:
+            return []
+        return super().get_throttles()
@@ -0,0 +1,7 @@
+from django.urls import path
+from base.views import BatchView, DatabasePoolStatsView
+
+urlpatterns = [
+    path('batch/', BatchView.as_view(), name='batch'),
+    path('db/pool-stats/', DatabasePoolStatsView.as_view(), name='db-pool-stats'),
+]
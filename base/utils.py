@@ -1,5 +1,4 @@
 import json
-import requests
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
@@ -14,14 +13,16 @@ class PaymentCRUD(AbstractCRUD):
     model=Payment
 
 
-import requests
+import asyncio
 import base64
+import weakref
 from django.conf import settings
 from urllib.parse import urlencode
 
 class MonnifyClient:
     def __init__(self):
         self.base_url = settings.MONNIFY_BASE_URL
+        self.transactions_url = settings.MONNIFY_TRANSACTIONS_URL
         self.api_key = settings.MONNIFY_API_KEY
         self.client_secret = settings.MONNIFY_SECRET_KEY
         self.contract_code = settings.MONNIFY_CONTRACT_CODE
@@ -31,25 +32,31 @@ class MonnifyClient:
         """Generate proper authentication headers"""
         if not self.access_token:
             self._authenticate()
+        return self._bearer_headers()
+
+    def _bearer_headers(self):
         return {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.access_token}"
         }
 
-    def _authenticate(self):
-        """Authenticate with Monnify and get access token"""
+    def _basic_auth_headers(self):
         auth_string = f"{self.api_key}:{self.client_secret}"
         encoded_auth = base64.b64encode(auth_string.encode()).decode()
-        
-        headers = {
+        return {
             "Content-Type": "application/json",
             "Authorization": f"Basic {encoded_auth}"
         }
-        
+
+    def _authenticate(self):
+        """Authenticate with Monnify and get access token"""
+        # HTTP clients are imported on first use to keep worker startup light.
+        import requests
+
         try:
             response = requests.post(
                 f"{self.base_url}/auth/login",
-                headers=headers,
+                headers=self._basic_auth_headers(),
                 timeout=10
             )
             response.raise_for_status()
@@ -57,68 +64,83 @@ class MonnifyClient:
         except Exception as e:
             raise Exception(f"Monnify authentication failed: {str(e)}")
 
+    def _checkout_payload(self, booking, user):
+        return {
+            "amount": str(booking.amount),
+            "customerName": user.get_full_name() or user.email.split('@')[0],
+            "customerEmail": user.email,
+            "paymentReference": str(booking.id),
+            "paymentDescription": f"Booking Payment - {booking.event.title}",
+            "currencyCode": "NGN",
+            "contractCode": self.contract_code,
+            "redirectUrl": f"{settings.FRONTEND_URL}/payment/callback?{urlencode({'booking_id': str(booking.id)})}",
+            "paymentMethods": ["CARD", "ACCOUNT_TRANSFER"]
+        }
+
+    def _parse_checkout(self, data):
+        if data.get('requestSuccessful', False):
+            return {
+                'checkout_url': data['responseBody']['checkoutUrl'],
+                'transaction_reference': data['responseBody']['transactionReference']
+            }
+        raise Exception(data.get('responseMessage', 'Payment initiation failed'))
+
+    def _parse_verification(self, data, transaction_reference):
+        if data.get('requestSuccessful', False):
+            return {
+                'status': data['responseBody']['paymentStatus'],
+                'amount_paid': data['responseBody']['amountPaid'],
+                'paid_on': data['responseBody']['paidOn'],
+                'transaction_reference': transaction_reference
+            }
+        raise Exception(data.get('responseMessage', 'Payment verification failed'))
+
+    def _parse_confirmation(self, verification):
+        if verification['status'] == 'PAID':
+            return {
+                'success': True,
+                'transaction': verification
+            }
+        return {
+            'success': False,
+            'message': f"Payment not completed. Status: {verification['status']}"
+        }
+
     def generate_checkout_url(self, booking, user):
         """Generate payment checkout URL"""
+        import requests
+
         try:
             if not self.access_token:
                 self._authenticate()
 
-            payload = {
-                "amount": str(booking.amount),
-                "customerName": user.get_full_name() or user.email.split('@')[0],
-                "customerEmail": user.email,
-                "paymentReference": str(booking.id),
-                "paymentDescription": f"Booking Payment - {booking.event.title}",
-                "currencyCode": "NGN",
-                "contractCode": self.contract_code,
-                "redirectUrl": f"{settings.FRONTEND_URL}/payment/callback?{urlencode({'booking_id': str(booking.id)})}",
-                "paymentMethods": ["CARD", "ACCOUNT_TRANSFER"]
-            }
-
             response = requests.post(
                 f"{self.base_url}/merchant/transactions/init-transaction",
                 headers=self._get_auth_headers(),
-                json=payload,
+                json=self._checkout_payload(booking, user),
                 timeout=15
             )
             response.raise_for_status()
-            
-            data = response.json()
-            if data.get('requestSuccessful', False):
-                return {
-                    'checkout_url': data['responseBody']['checkoutUrl'],
-                    'transaction_reference': data['responseBody']['transactionReference']
-                }
-                
-            raise Exception(data.get('responseMessage', 'Payment initiation failed'))
+            return self._parse_checkout(response.json())
                 
         except Exception as e:
             raise Exception(f"Payment processing failed: {str(e)}")
 
     def verify_payment(self, transaction_reference):
         """Verify payment status"""
+        import requests
+
         try:
             if not self.access_token:
                 self._authenticate()
 
             response = requests.get(
-                f"https://sandbox.monnify.com/api/v2/transactions/{transaction_reference}",
+                f"{self.transactions_url}/{transaction_reference}",
                 headers=self._get_auth_headers(),
                 timeout=10
             )
-            print(response)
             response.raise_for_status()
-            
-            data = response.json()
-            if data.get('requestSuccessful', False):
-                payment_status = data['responseBody']['paymentStatus']
-                return {
-                    'status': payment_status,
-                    'amount_paid': data['responseBody']['amountPaid'],
-                    'paid_on': data['responseBody']['paidOn'],
-                    'transaction_reference': transaction_reference
-                }
-            raise Exception(data.get('responseMessage', 'Payment verification failed'))
+            return self._parse_verification(response.json(), transaction_reference)
                 
         except Exception as e:
             raise Exception(f"Payment verification failed: {str(e)}")
@@ -126,23 +148,98 @@ class MonnifyClient:
     def confirm_payment(self, transaction_reference):
         """Confirm and finalize payment"""
         try:
-            print("hellooo")
             verification = self.verify_payment(transaction_reference)
-            print(verification)
-            
-            if verification['status'] == 'PAID':
-                return {
-                    'success': True,
-                    'transaction': verification
-                }
-            
-            return {
-                'success': False,
-                'message': f"Payment not completed. Status: {verification['status']}"
-            }
+            return self._parse_confirmation(verification)
                 
         except Exception as e:
             raise Exception(f"Payment confirmation failed: {str(e)}")
+
+
+_async_http_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_http_client():
+    """
+    Return the ``httpx.AsyncClient`` shared by everything on the running event
+    loop. Building a client is expensive (TLS context setup), and sharing one
+    lets concurrent gateway calls reuse pooled keep-alive connections.
+    """
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=httpx.Limits(max_connections=500, max_keepalive_connections=100))
+        _async_http_clients[loop] = client
+    return client
+
+
+class AsyncMonnifyClient(MonnifyClient):
+    """
+    Non-blocking Monnify client for async views. Gateway calls are awaited on
+    the event loop, so a slow gateway holds a coroutine instead of a worker
+    thread.
+    """
+
+    def __init__(self, http_client=None):
+        super().__init__()
+        self.http_client = http_client or get_async_http_client()
+
+    async def _authenticate(self):
+        """Authenticate with Monnify and get access token"""
+        try:
+            response = await self.http_client.post(
+                f"{self.base_url}/auth/login",
+                headers=self._basic_auth_headers(),
+                timeout=10
+            )
+            response.raise_for_status()
+            self.access_token = response.json()['responseBody']['accessToken']
+        except Exception as e:
+            raise Exception(f"Monnify authentication failed: {str(e)}")
+
+    async def _get_auth_headers(self):
+        if not self.access_token:
+            await self._authenticate()
+        return self._bearer_headers()
+
+    async def generate_checkout_url(self, booking, user):
+        """Generate payment checkout URL"""
+        try:
+            response = await self.http_client.post(
+                f"{self.base_url}/merchant/transactions/init-transaction",
+                headers=await self._get_auth_headers(),
+                json=self._checkout_payload(booking, user),
+                timeout=15
+            )
+            response.raise_for_status()
+            return self._parse_checkout(response.json())
+
+        except Exception as e:
+            raise Exception(f"Payment processing failed: {str(e)}")
+
+    async def verify_payment(self, transaction_reference):
+        """Verify payment status"""
+        try:
+            response = await self.http_client.get(
+                f"{self.transactions_url}/{transaction_reference}",
+                headers=await self._get_auth_headers(),
+                timeout=10
+            )
+            response.raise_for_status()
+            return self._parse_verification(response.json(), transaction_reference)
+
+        except Exception as e:
+            raise Exception(f"Payment verification failed: {str(e)}")
+
+    async def confirm_payment(self, transaction_reference):
+        """Confirm and finalize payment"""
+        try:
+            verification = await self.verify_payment(transaction_reference)
+            return self._parse_confirmation(verification)
+
+        except Exception as e:
+            raise Exception(f"Payment confirmation failed: {str(e)}")
         
 
 class CustomPagination(PageNumberPagination):
@@ -1,7 +1,6 @@
 import os
 from django.core.exceptions import ValidationError
 from django.conf import settings
-from PIL import Image
 
 
 class ProfilePictureValidator:
@@ -30,6 +29,8 @@ class ProfilePictureValidator:
     
     @staticmethod
     def validate_dimensions(value):
+        from PIL import Image
+
         min_width, min_height = settings.PROFILE_PICTURE_SETTINGS['MIN_DIMENSIONS']
         
         try:
@@ -45,7 +46,12 @@ class ProfilePictureValidator:
             raise ValidationError('Unable to read image file') from e
     
     @classmethod
-    def validate_all(cls, value):
+    def validate_upload(cls, value):
+        """The checks that need no image decoding, cheap enough for the request."""
         cls.validate_extension(value)
         cls.validate_file_size(value)
+
+    @classmethod
+    def validate_all(cls, value):
+        cls.validate_upload(value)
         cls.validate_dimensions(value)
\ No newline at end of file
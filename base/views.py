@@ -1,3 +1,40 @@
-from django.shortcuts import render
+from rest_framework import generics, permissions, status
 
-# Create your views here.
+from base.api_response import APIResponse
+from base.batch import BatchDispatcher
+from base.db_metrics import connection_pool_stats
+from base.serializers import BatchRequestSerializer
+
+
+class BatchView(generics.GenericAPIView):
+    serializer_class = BatchRequestSerializer
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return APIResponse.error(
+                message="Batch request failed",
+                errors=serializer.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        dispatcher = BatchDispatcher(request, view_class=type(self))
+        results = dispatcher.dispatch(
+            serializer.validated_data['requests'],
+            parallel=serializer.validated_data['parallel']
+        )
+        return APIResponse.success(
+            data=results,
+            message="Batch processed successfully"
+        )
+
+
+class DatabasePoolStatsView(generics.GenericAPIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return APIResponse.success(
+            data=connection_pool_stats(),
+            message="Database pool statistics retrieved successfully"
+        )
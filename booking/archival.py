@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Exists, OuterRef, Q
+
+from artist.models import ArtistAvailability, ArtistPortfolioItem, Review
+from base.archive import ArchivePolicy, soft_deleted
+from base.constants import BookingStatus
+from booking.models import Booking, Payment
+
+
+def archivable_bookings(now):
+    """
+    Soft-deleted bookings and bookings completed (and untouched) for
+    ``COMPLETED_BOOKINGS_AFTER_DAYS``. Reviewed bookings stay while their
+    review is live, since the review points at them.
+    """
+    cutoff = now - timedelta(days=settings.ARCHIVE_SETTINGS['COMPLETED_BOOKINGS_AFTER_DAYS'])
+    completed = Q(status=BookingStatus.COMPLETED, updated_at__lt=cutoff)
+    return (soft_deleted(now) | completed) & ~Exists(Review.all_objects.filter(booking=OuterRef('pk')))
+
+
+# Reviews go first so that the bookings they released can follow in the same run.
+ARCHIVE_POLICIES = [
+    ArchivePolicy(Review, soft_deleted),
+    ArchivePolicy(Booking, archivable_bookings, dependents=[(Payment, 'booking')]),
+    ArchivePolicy(ArtistPortfolioItem, soft_deleted),
+    ArchivePolicy(ArtistAvailability, soft_deleted),
+]
@@ -0,0 +1,69 @@
+from django.db import transaction
+
+from artist.models import Artist
+from booking.models import Booking
+from booking.signals import bookings_bulk_created
+from booking.quotes import conflicting_artist_ids, event_duration_hours, quote_amount
+
+
+def book_artists(event, artist_ids, booker, special_requests=None, all_or_nothing=False):
+    """
+    Book many artists for one already-validated event in a single transaction:
+    one artist query, one conflict query and one bulk insert. Returns one
+    result per distinct requested artist, in request order.
+
+    Artist rows are locked for the duration, as BookingSerializer does for
+    single bookings, so concurrent bookings for the same artists cannot both
+    pass the conflict check.
+    """
+    artist_ids = list(dict.fromkeys(artist_ids))
+    duration_hours = event_duration_hours(event)
+    results = {}
+
+    with transaction.atomic():
+        artists = Artist.active_objects.select_for_update().in_bulk(artist_ids)
+        conflicts = conflicting_artist_ids(event, artist_ids=list(artists))
+
+        to_create = []
+        for artist_id in artist_ids:
+            artist = artists.get(artist_id)
+            if artist is None:
+                results[artist_id] = failure(artist_id, "Artist does not exist.")
+            elif not artist.available_for_booking:
+                results[artist_id] = failure(artist_id, "Artist is not available for bookings.")
+            elif artist_id in conflicts:
+                results[artist_id] = failure(artist_id, "Artist is already booked for this time slot.")
+            else:
+                to_create.append(Booking(
+                    event=event,
+                    artist=artist,
+                    booker=booker,
+                    amount=quote_amount(artist.hourly_rate, duration_hours),
+                    special_requests=special_requests
+                ))
+
+        if all_or_nothing and results:
+            for booking in to_create:
+                results[booking.artist_id] = failure(booking.artist_id, "Not booked because another artist failed.")
+            to_create = []
+
+        created = Booking.active_objects.bulk_create(to_create)
+        if created:
+            bookings_bulk_created.send(sender=Booking, bookings=created)
+        for booking in created:
+            results[booking.artist_id] = {
+                'artist': booking.artist_id,
+                'success': True,
+                'booking': str(booking.id),
+                'amount': f"{booking.amount:.2f}",
+            }
+
+    return [results[artist_id] for artist_id in artist_ids]
+
+
+def failure(artist_id, message):
+    return {
+        'artist': artist_id,
+        'success': False,
+        'error': message,
+    }
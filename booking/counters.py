@@ -0,0 +1,179 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, F, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from artist.models import Artist
+from authentication.models import User
+from base.constants import BookingStatus, EventStatus, PaymentStatus
+from booking.models import ArchivedBooking, ArchivedPayment, Booking, Venue
+
+OPEN_BOOKING_STATUSES = [BookingStatus.PENDING, BookingStatus.CONFIRMED]
+
+BOOKING_FIELDS = ('artist_id', 'booker_id', 'status', 'is_active')
+EVENT_FIELDS = ('venue_id', 'status', 'is_active')
+PAYMENT_FIELDS = ('booking_id', 'status', 'amount', 'is_active')
+
+
+def snapshot(instance, fields):
+    values = instance.__dict__
+    return {field: values.get(field) for field in fields}
+
+
+def booking_counts(state):
+    """What one booking adds to the counters, as ``{(model, pk, field): amount}``."""
+    if not state or not state['is_active']:
+        return {}
+    counts = {}
+    if state['artist_id']:
+        if state['status'] in OPEN_BOOKING_STATUSES:
+            counts[Artist, state['artist_id'], 'upcoming_bookings_count'] = 1
+        elif state['status'] == BookingStatus.COMPLETED:
+            counts[Artist, state['artist_id'], 'completed_gigs_count'] = 1
+    if state['booker_id']:
+        counts[User, state['booker_id'], 'bookings_count'] = 1
+    return counts
+
+
+def event_counts(state):
+    if not state or not state['is_active'] or not state['venue_id'] or state['status'] == EventStatus.CANCELLED:
+        return {}
+    return {(Venue, state['venue_id'], 'events_hosted_count'): 1}
+
+
+def payment_counts(state, bookers):
+    """Completed payments count towards the booker's spend; ``bookers`` maps booking id to booker id."""
+    if not state or not state['is_active'] or state['status'] != PaymentStatus.COMPLETED:
+        return {}
+    booker_id = bookers.get(state['booking_id'])
+    if not booker_id:
+        return {}
+    return {(User, booker_id, 'total_spend'): Decimal(state['amount'] or 0)}
+
+
+def payment_bookers(booking_ids):
+    booking_ids = {booking_id for booking_id in booking_ids if booking_id}
+    if not booking_ids:
+        return {}
+    return dict(Booking.all_objects.filter(pk__in=booking_ids).values_list('pk', 'booker_id'))
+
+
+def summed_counts(rows, fields, counts):
+    """
+    The contributions of ``rows`` as if they were all active, from one
+    grouped query; ``counts`` is ``booking_counts`` or ``event_counts``.
+    """
+    fields = [field for field in fields if field != 'is_active']
+    totals = defaultdict(int)
+    for row in rows.order_by().values(*fields).annotate(rows=Count('pk')):
+        number = row.pop('rows')
+        for key, amount in counts({**row, 'is_active': True}).items():
+            totals[key] += amount * number
+    return totals
+
+
+def summed_spend(payments):
+    """What the completed ``payments`` add to their bookers' spend, from one grouped query."""
+    rows = (
+        payments.filter(status=PaymentStatus.COMPLETED, booking__booker__isnull=False)
+        .order_by().values_list('booking__booker_id').annotate(spend=Sum('amount'))
+    )
+    return {(User, booker_id, 'total_spend'): spend for booker_id, spend in rows if spend}
+
+
+def apply_counter_changes(removed, added):
+    """
+    Move the counters from the ``removed`` contributions to the ``added``
+    ones with one ``F()`` update per row that changes. ``updated_at`` moves
+    too, so change feeds pick up the new counts.
+    """
+    deltas = defaultdict(dict)
+    for contributions, sign in ((removed, -1), (added, 1)):
+        for (model, pk, field), amount in contributions.items():
+            deltas[model, pk][field] = deltas[model, pk].get(field, 0) + sign * amount
+
+    for (model, pk), fields in deltas.items():
+        increments = {field: F(field) + amount for field, amount in fields.items() if amount}
+        if increments:
+            model.all_objects.filter(pk=pk).update(**increments, updated_at=timezone.now())
+
+
+def _archived(archive, column, aggregate, output_field, **filters):
+    """``aggregate`` over the archived rows whose ``column`` points at the outer row."""
+    rows = (
+        archive.objects.filter(**{column: OuterRef('pk')}, **filters)
+        .order_by().values(column).annotate(total=aggregate).values('total')
+    )
+    return Coalesce(Subquery(rows, output_field=output_field), Value(0), output_field=output_field)
+
+
+def _expected_counters():
+    """
+    Per model, the counters recomputed from bookings, events and payments.
+    Archived bookings and payments still count; see booking.archival.
+    """
+    spend = Q(bookings__payment__is_active=True, bookings__payment__status=PaymentStatus.COMPLETED)
+    money = DecimalField(max_digits=14, decimal_places=2)
+    return [
+        (Artist, {
+            'upcoming_bookings_count': Count('bookings', filter=Q(
+                bookings__is_active=True, bookings__status__in=OPEN_BOOKING_STATUSES
+            )) + _archived(
+                ArchivedBooking, 'artist', Count('pk'), IntegerField(),
+                is_active=True, status__in=OPEN_BOOKING_STATUSES
+            ),
+            'completed_gigs_count': Count('bookings', filter=Q(
+                bookings__is_active=True, bookings__status=BookingStatus.COMPLETED
+            )) + _archived(
+                ArchivedBooking, 'artist', Count('pk'), IntegerField(),
+                is_active=True, status=BookingStatus.COMPLETED
+            ),
+        }),
+        (Venue, {
+            'events_hosted_count': Count('events', filter=Q(events__is_active=True) & ~Q(
+                events__status=EventStatus.CANCELLED
+            )),
+        }),
+        (User, {
+            'bookings_count': Count('bookings', filter=Q(bookings__is_active=True), distinct=True) + _archived(
+                ArchivedBooking, 'booker', Count('pk'), IntegerField(), is_active=True
+            ),
+            'total_spend': Coalesce(
+                Sum('bookings__payment__amount', filter=spend),
+                Value(Decimal(0)),
+                output_field=money
+            ) + _archived(
+                ArchivedPayment, 'booking__booker', Sum('amount'), money,
+                is_active=True, status=PaymentStatus.COMPLETED
+            ),
+        }),
+    ]
+
+
+def reconcile_counters(fix=False, batch_size=1000):
+    """
+    Compare every stored counter with its recomputed value. Returns
+    ``{model label: number of rows that drifted}``; with ``fix`` the drifted
+    rows are corrected.
+    """
+    drifted = {}
+    for model, expected in _expected_counters():
+        aliases = {f'expected_{field}': aggregate for field, aggregate in expected.items()}
+        mismatch = Q()
+        for field in expected:
+            mismatch |= ~Q(**{field: F(f'expected_{field}')})
+        rows = (
+            model.all_objects.annotate(**aliases).filter(mismatch)
+            .values_list('pk', *aliases).order_by()
+        )
+        now = timezone.now()
+        stale = [
+            model(pk=row[0], updated_at=now, **dict(zip(expected, row[1:])))
+            for row in rows.iterator(chunk_size=batch_size)
+        ]
+        if fix and stale:
+            model.all_objects.bulk_update(stale, [*expected, 'updated_at'], batch_size=batch_size)
+        drifted[model._meta.label] = len(stale)
+    return drifted
@@ -0,0 +1,9 @@
+from django.conf import settings
+
+from base.facets import FacetSet, RangeFacet, TermsFacet
+
+venue_facets = FacetSet('venue', [
+    TermsFacet('city'),
+    TermsFacet('state'),
+    RangeFacet('capacity', settings.FACET_SETTINGS['CAPACITY_EDGES']),
+])
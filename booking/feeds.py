@@ -0,0 +1,123 @@
+import bisect
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from base.constants import EventStatus
+from booking.models import Event
+
+
+class UpcomingEventFeed:
+    """
+    Precomputed, ordered ids of upcoming published events per city/state scope.
+
+    Each scope is cached as ``{bucket: [(start_ts, event_id), ...]}`` where a
+    bucket covers ``BUCKET_SECONDS`` of start times. Reading a feed only has to
+    trim the current bucket against "now"; whole buckets in the past are
+    skipped. The index is stored under a per-scope version: saves to Event
+    and Venue bump the versions of the scopes they touch with ``cache.incr``
+    (see booking.signals) and the next read rebuilds, so concurrent writers
+    never overwrite each other's changes. Other workers only see a bump
+    through a shared cache; with the per-process default they can lag by up
+    to ``CACHE_TIMEOUT``, which is why readers re-check what the ids point to.
+    """
+
+    KEY_PREFIX = 'upcoming_events'
+
+    def __init__(self):
+        config = settings.EVENT_FEED_SETTINGS
+        self.bucket_seconds = config['BUCKET_SECONDS']
+        self.timeout = config['CACHE_TIMEOUT']
+
+    def scope_key(self, city=None, state=None):
+        city = (city or '*').strip().lower()
+        state = (state or '*').strip().lower()
+        return f"{self.KEY_PREFIX}:{city}:{state}"
+
+    def scopes_for(self, venue):
+        keys = {self.scope_key()}
+        if venue is not None:
+            keys.update({
+                self.scope_key(city=venue.city),
+                self.scope_key(state=venue.state),
+                self.scope_key(city=venue.city, state=venue.state),
+            })
+        return keys
+
+    def event_ids(self, city=None, state=None, now=None):
+        """Ordered ids of upcoming events in the scope, building it on a miss."""
+        now = now or timezone.now()
+        scope = self.scope_key(city, state)
+        key = f"{scope}:{self._version(scope)}"
+        index = cache.get(key)
+        if index is None:
+            index = self.build(city, state, now)
+            cache.set(key, index, self.timeout)
+        return self.flatten(index, now)
+
+    def build(self, city=None, state=None, now=None):
+        queryset = Event.active_objects.filter(
+            status=EventStatus.PUBLISHED,
+            start_time__gte=now or timezone.now()
+        )
+        if city:
+            queryset = queryset.filter(venue__city__iexact=city.strip())
+        if state:
+            queryset = queryset.filter(venue__state__iexact=state.strip())
+
+        index = {}
+        for event_id, start_time in queryset.order_by().values_list('id', 'start_time'):
+            self._insert(index, event_id, start_time.timestamp())
+        return index
+
+    def flatten(self, index, now):
+        now_ts = now.timestamp()
+        current = self._bucket(now_ts)
+        ids = []
+        for bucket in sorted(index):
+            if bucket < current:
+                continue
+            entries = index[bucket]
+            if bucket == current:
+                entries = entries[bisect.bisect_left(entries, (now_ts,)):]
+            ids.extend(event_id for _, event_id in entries)
+        return ids
+
+    def update(self, event, previous_venue=None):
+        """Expire every scope the event leaves or joins."""
+        for key in self.scopes_for(previous_venue) | self.scopes_for(event.venue):
+            self._bump(key)
+
+    def remove(self, event):
+        self.update(event)
+
+    def invalidate(self, venue):
+        for key in self.scopes_for(venue):
+            self._bump(key)
+
+    def _version(self, key):
+        version_key = f"{key}:version"
+        version = cache.get(version_key)
+        if version is None:
+            cache.add(version_key, time.time_ns(), None)
+            version = cache.get(version_key, 0)
+        return version
+
+    def _bump(self, key):
+        try:
+            cache.incr(f"{key}:version")
+        except ValueError:
+            # No version yet, or it was evicted: start from one that no
+            # earlier index can have been stored under.
+            cache.add(f"{key}:version", time.time_ns(), None)
+
+    def _bucket(self, timestamp):
+        return int(timestamp // self.bucket_seconds)
+
+    def _insert(self, index, event_id, timestamp):
+        bisect.insort(index.setdefault(self._bucket(timestamp), []), (timestamp, event_id))
+
+
+upcoming_event_feed = UpcomingEventFeed()
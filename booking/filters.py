@@ -0,0 +1,90 @@
+from django.conf import settings
+from django.db.models import Case, FloatField, Q, Value, When
+from rest_framework import filters, status
+
+from base import geo
+from base.api_response import APIResponse
+from booking.serializers import ProximityQuerySerializer
+
+
+class ProximityFilter(filters.BaseFilterBackend):
+    """
+    ``?lat=&lng=&radius_km=`` returns venues within a radius and
+    ``?lat=&lng=&nearest=k`` the k nearest, ordered by distance and annotated
+    with ``distance_km``.
+
+    Candidates come from a prefix match on the indexed ``geohash`` column over
+    the 3x3 block of cells around the point, then exact haversine distances
+    are computed in Python. Views set ``proximity_prefix`` to reach the venue
+    from their model (``'venue__'`` for events), and use ProximityQueryMixin
+    so bad parameters are answered with the usual error envelope.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = ProximityQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        if 'lat' not in params:
+            return queryset
+
+        latitude, longitude = params['lat'], params['lng']
+        prefix = getattr(view, 'proximity_prefix', '')
+        max_results = settings.GEO_SEARCH_SETTINGS['MAX_RESULTS']
+
+        if 'radius_km' in params:
+            radius_km = params['radius_km']
+            precision = geo.precision_for_radius(radius_km, latitude)
+            candidates = self._candidates(queryset, prefix, latitude, longitude, precision)
+            matches = [match for match in candidates if match[1] <= radius_km][:max_results]
+        else:
+            nearest = params.get('nearest', min(settings.GEO_SEARCH_SETTINGS['DEFAULT_NEAREST'], max_results))
+            matches = self._nearest(queryset, prefix, latitude, longitude, nearest)
+
+        distances = Case(
+            *[When(pk=pk, then=Value(round(distance, 3))) for pk, distance in matches],
+            default=Value(None),
+            output_field=FloatField()
+        )
+        return queryset.filter(pk__in=[pk for pk, _ in matches]).annotate(
+            distance_km=distances
+        ).order_by('distance_km', 'pk')
+
+    def _nearest(self, queryset, prefix, latitude, longitude, count):
+        for precision in range(max(geo.CELL_SIZES_KM), 0, -1):
+            candidates = self._candidates(queryset, prefix, latitude, longitude, precision)
+            # The 3x3 block is exhaustive for anything closer than one cell
+            # dimension, so the k-th candidate within that distance is final.
+            if len(candidates) >= count and candidates[count - 1][1] <= geo.min_cell_dimension_km(precision, latitude):
+                return candidates[:count]
+        return self._candidates(queryset, prefix, latitude, longitude, 0)[:count]
+
+    def _candidates(self, queryset, prefix, latitude, longitude, precision):
+        queryset = queryset.exclude(**{f'{prefix}geohash': ''}).exclude(**{f'{prefix}geohash__isnull': True})
+        if precision:
+            cells = geo.neighbourhood(geo.encode(latitude, longitude, precision))
+            cell_filter = Q()
+            for cell in cells:
+                cell_filter |= Q(**{f'{prefix}geohash__startswith': cell})
+            queryset = queryset.filter(cell_filter)
+
+        rows = queryset.order_by().values_list('pk', f'{prefix}latitude', f'{prefix}longitude')
+        candidates = [
+            (pk, geo.haversine_km(latitude, longitude, float(row_lat), float(row_lng)))
+            for pk, row_lat, row_lng in rows
+        ]
+        candidates.sort(key=lambda candidate: (candidate[1], candidate[0]))
+        return candidates
+
+
+class ProximityQueryMixin:
+    """Checks the ProximityFilter parameters before listing."""
+
+    def list(self, request, *args, **kwargs):
+        query = ProximityQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return APIResponse.error(
+                message="Invalid proximity query",
+                errors=query.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from base.archive import archive_rows
+from booking.archival import ARCHIVE_POLICIES
+
+
+class Command(BaseCommand):
+    help = (
+        "Move soft-deleted rows and old completed bookings (with their payments) "
+        "into the archive tables in batches; run periodically, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None, help="Rows per transaction")
+        parser.add_argument("--max-batches", type=int, default=None, help="Stop each table after this many batches")
+
+    def handle(self, *args, **options):
+        report = archive_rows(ARCHIVE_POLICIES, batch_size=options["batch_size"], max_batches=options["max_batches"])
+        for label, (moved, seconds) in report.items():
+            rate = moved / seconds if seconds else 0
+            self.stdout.write(f"{label:<28} {moved:>8} rows  {seconds:7.2f}s  {rate:9.0f} rows/s")
+        moved = sum(moved for moved, _ in report.values())
+        seconds = sum(seconds for _, seconds in report.values())
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {moved} rows in {seconds:.2f}s ({moved / seconds if seconds else 0:.0f} rows/s)"
+        ))
@@ -0,0 +1,96 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from authentication.models import User
+from base.concurrency import ConcurrentUpdateError, update_with_retry
+from booking.models import Booking, Event, Venue
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure contended Booking updates: versioned compare-and-swap with "
+        "retries against SELECT ... FOR UPDATE row locks. Every update adds 1 "
+        "to a booking's amount, so the final amounts show any lost update. "
+        "Runs on a throwaway test database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=None,
+                            help="Concurrent writers; defaults to 8, or 1 on SQLite")
+        parser.add_argument("--updates", type=int, default=200, help="Updates per writer")
+        parser.add_argument("--rows", type=int, default=1, help="Bookings the writers spread over; 1 is worst case")
+        parser.add_argument("--attempts", type=int, default=50, help="Optimistic attempts per update before giving up")
+
+    def handle(self, *args, **options):
+        threads = options["threads"] or (1 if connection.vendor == "sqlite" else 8)
+        updates, rows = options["updates"], options["rows"]
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            booking_ids = self.setup(rows)
+            for mode in ("optimistic", "locked"):
+                Booking.all_objects.update(amount=0)
+                self.attempts, self.attempts_lock = 0, threading.Lock()
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=threads) as pool:
+                    results = list(pool.map(
+                        lambda worker: self.run(mode, worker, booking_ids, updates, options["attempts"]),
+                        range(threads)
+                    ))
+                elapsed = time.perf_counter() - started
+                applied = sum(done for done, _ in results)
+                failed = sum(gave_up for _, gave_up in results)
+                total = sum(Booking.all_objects.filter(pk__in=booking_ids).values_list('amount', flat=True))
+                retries = self.attempts - applied - failed if mode == "optimistic" else 0
+                self.stdout.write(
+                    f"{mode:<10} {applied:>6} updates  {elapsed:7.2f}s  {applied / elapsed:8.0f}/s  "
+                    f"retries {retries:>6}  gave up {failed:>4}  lost {applied - int(total):>4}"
+                )
+        finally:
+            connections.close_all()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def setup(self, rows):
+        user = User.objects.create_user(email="bench@example.com", username="bench", password="bench")
+        venue = Venue.all_objects.create(
+            name="Bench", owner=user, address="-", city="-", state="-", zip_code="-", capacity=1, description="-"
+        )
+        start = timezone.now() + timedelta(days=1)
+        event = Event.all_objects.create(
+            title="Bench", description="-", venue=venue, start_time=start,
+            end_time=start + timedelta(hours=1), ticket_price=Decimal("0")
+        )
+        return [Booking.all_objects.create(event=event, booker=user, amount=0).pk for _ in range(rows)]
+
+    def run(self, mode, worker, booking_ids, updates, attempts):
+        applied = gave_up = 0
+        try:
+            for index in range(updates):
+                booking_id = booking_ids[(worker + index) % len(booking_ids)]
+                if mode == "locked":
+                    with transaction.atomic():
+                        booking = Booking.all_objects.select_for_update().get(pk=booking_id)
+                        booking.amount += 1
+                        booking.save(update_fields=["amount"])
+                    applied += 1
+                    continue
+                try:
+                    update_with_retry(Booking, booking_id, self.increment, attempts=attempts)
+                    applied += 1
+                except ConcurrentUpdateError:
+                    gave_up += 1
+        finally:
+            connections.close_all()
+        return applied, gave_up
+
+    def increment(self, booking):
+        with self.attempts_lock:
+            self.attempts += 1
+        booking.amount += 1
+        return ["amount"]
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from asgiref.sync import sync_to_async
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from artist.models import Artist
+from authentication.models import User
+from booking.models import Booking, Event, Venue
+
+
+class FakeMonnifyHandler(BaseHTTPRequestHandler):
+    """Answers the Monnify endpoints we call after sleeping ``latency`` seconds."""
+    latency = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, body):
+        time.sleep(self.latency)
+        payload = json.dumps({"requestSuccessful": True, "responseBody": body}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path.endswith("/auth/login"):
+            return self._respond({"accessToken": "benchmark-token"})
+        reference = f"MNFY|{uuid.uuid4().hex}"
+        return self._respond({
+            "checkoutUrl": f"https://checkout.invalid/{reference}",
+            "transactionReference": reference,
+        })
+
+    def do_GET(self):
+        return self._respond({
+            "paymentStatus": "PAID",
+            "amountPaid": "100.00",
+            "paidOn": timezone.now().strftime("%Y-%m-%d %H:%M:%S.%f"),
+        })
+
+
+class FakeMonnifyServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the sync (WSGI) and async (ASGI) payment endpoints against a "
+        "simulated Monnify gateway with configurable latency. Runs on a "
+        "throwaway test database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=100, help="Payments to create and verify per mode")
+        parser.add_argument("--latency", type=float, default=0.5, help="Simulated gateway latency in seconds")
+        parser.add_argument("--workers", type=int, default=8, help="WSGI worker threads")
+
+    def handle(self, *args, **options):
+        FakeMonnifyHandler.latency = options["latency"]
+        server = FakeMonnifyServer(("127.0.0.1", 0), FakeMonnifyHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        gateway_url = f"http://127.0.0.1:{server.server_port}"
+
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            with override_settings(MONNIFY_BASE_URL=gateway_url, MONNIFY_TRANSACTIONS_URL=f"{gateway_url}/transactions"):
+                self.stdout.write(
+                    f"{options['requests']} payments, {options['latency']}s gateway latency, "
+                    f"{options['workers']} WSGI threads"
+                )
+                self.report("WSGI", self.run_wsgi(options))
+                self.report("ASGI", asyncio.run(self.run_asgi(options)))
+        finally:
+            server.shutdown()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def report(self, label, timings):
+        for phase, (count, elapsed, failures) in timings.items():
+            self.stdout.write(
+                f"{label:<5} {phase:<7} {elapsed:8.2f}s  {count / elapsed:8.1f} req/s  failures={failures}"
+            )
+
+    def create_bookings(self, count):
+        owner = User.objects.create_user(
+            email=f"bench-{uuid.uuid4().hex[:8]}@example.com",
+            username=uuid.uuid4().hex,
+            password=uuid.uuid4().hex,
+        )
+        venue = Venue.all_objects.create(
+            name="Bench Hall", owner=owner, address="1 Bench Road", city="Lagos",
+            state="Lagos", zip_code="100001", capacity=500, description="Benchmark venue",
+        )
+        start_time = timezone.now() + timedelta(days=7)
+        event = Event.all_objects.create(
+            title="Bench Night", description="Benchmark event", venue=venue,
+            start_time=start_time, end_time=start_time + timedelta(hours=2), ticket_price=10,
+        )
+        artist = Artist.all_objects.create(stage_name="Bench", genre="afrobeat", hourly_rate=50)
+        bookings = Booking.all_objects.bulk_create([
+            Booking(event=event, artist=artist, booker=owner, amount=100) for _ in range(count)
+        ])
+        token = str(RefreshToken.for_user(owner).access_token)
+        return bookings, {"Authorization": f"Bearer {token}"}
+
+    def run_wsgi(self, options):
+        """Each request holds one of ``workers`` threads for the whole gateway round trip."""
+        bookings, headers = self.create_bookings(options["requests"])
+
+        def call(url, payload):
+            try:
+                response = Client().post(url, payload, content_type="application/json", headers=headers)
+                return response.status_code, response.json().get("data") or {}
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(options["workers"]) as executor:
+            def execute(url, payloads):
+                return list(executor.map(lambda payload: call(url, payload), payloads))
+
+            return self.run_phases(execute, bookings, reverse("payment-create"), reverse("verify-payment"))
+
+    async def run_asgi(self, options):
+        """All requests are in flight at once on a single event loop."""
+        bookings, headers = await sync_to_async(self.create_bookings)(options["requests"])
+        client = AsyncClient()
+
+        async def call(url, payload):
+            response = await client.post(url, payload, content_type="application/json", headers=headers)
+            return response.status_code, response.json().get("data") or {}
+
+        async def execute(url, payloads):
+            return await asyncio.gather(*(call(url, payload) for payload in payloads))
+
+        return await self.arun_phases(
+            execute, bookings, reverse("payment-create-async"), reverse("verify-payment-async")
+        )
+
+    def run_phases(self, execute, bookings, create_url, verify_url):
+        started = time.perf_counter()
+        created = execute(create_url, self.create_payloads(bookings))
+        create_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        verified = execute(verify_url, self.verify_payloads(created))
+        verify_elapsed = time.perf_counter() - started
+
+        return {
+            "create": self.summarise(created, create_elapsed),
+            "verify": self.summarise(verified, verify_elapsed),
+        }
+
+    async def arun_phases(self, execute, bookings, create_url, verify_url):
+        started = time.perf_counter()
+        created = await execute(create_url, self.create_payloads(bookings))
+        create_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        verified = await execute(verify_url, self.verify_payloads(created))
+        verify_elapsed = time.perf_counter() - started
+
+        return {
+            "create": self.summarise(created, create_elapsed),
+            "verify": self.summarise(verified, verify_elapsed),
+        }
+
+    def create_payloads(self, bookings):
+        return [{"booking": str(booking.pk), "payment_method": "ONLINE"} for booking in bookings]
+
+    def verify_payloads(self, created):
+        return [
+            {"reference_number": data["reference_number"]}
+            for status_code, data in created if status_code == 201
+        ]
+
+    def summarise(self, results, elapsed):
+        failures = sum(1 for status_code, _ in results if status_code >= 400)
+        return len(results), elapsed, failures
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from booking.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the booking, gig, event and spend counters on artists, venues "
+        "and users with their source rows; run periodically, with --fix to "
+        "correct drift."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fix", action="store_true", help="Write the recomputed values to drifted rows")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        drifted = reconcile_counters(fix=options["fix"])
+        for label, count in drifted.items():
+            self.stdout.write(f"{label:<24} {count:>7} drifted")
+        verb = "Fixed" if options["fix"] else "Found"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {sum(drifted.values())} drifted rows in {time.perf_counter() - started:.2f}s"
+        ))
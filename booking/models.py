@@ -1,8 +1,10 @@
 import uuid
 from django.db import models
 from authentication.models import User
+from base import geo
 from base.constants import BookingStatus, EventStatus, PaymentStatus
-from base.models import BaseModel
+from base.archive import archive_model
+from base.models import BaseModel, VersionedModel
 
 
 # Create your models here.
@@ -16,9 +18,26 @@ class Venue(BaseModel):
     capacity = models.PositiveIntegerField()
     description = models.TextField()
     amenities = models.TextField(blank=True, null=True)
+    latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    geohash = models.CharField(max_length=12, blank=True, default='', db_index=True, editable=False)
+    # Maintained by booking.signals; see booking.counters.
+    events_hosted_count = models.IntegerField(default=0, editable=False)
+    counter_fields = ('events_hosted_count',)
 
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        if self.latitude is not None and self.longitude is not None:
+            self.geohash = geo.encode(float(self.latitude), float(self.longitude))
+        else:
+            self.geohash = ''
+        if 'update_fields' in kwargs and kwargs['update_fields'] is not None:
+            fields = set(kwargs['update_fields'])
+            if fields & {'latitude', 'longitude'}:
+                kwargs['update_fields'] = fields | {'geohash'}
+        return super().save(*args, **kwargs)
     
 
 class Event(BaseModel):
@@ -35,7 +54,7 @@ class Event(BaseModel):
         return self.title
     
 
-class Booking(BaseModel):
+class Booking(VersionedModel):
     id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True, primary_key=True)
     event = models.ForeignKey(Event, on_delete=models.SET_NULL, null=True, blank=True, related_name='bookings')
     artist = models.ForeignKey('artist.Artist', on_delete=models.SET_NULL, null=True, blank=True, related_name='bookings')
@@ -48,7 +67,7 @@ class Booking(BaseModel):
         return f"{self.id}"
 
 
-class Payment(BaseModel):
+class Payment(VersionedModel):
     id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True, primary_key=True)
     booking = models.OneToOneField(Booking, on_delete=models.SET_NULL,null=True, blank=True, related_name='payment')
     amount = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
@@ -59,4 +78,8 @@ class Payment(BaseModel):
     reference_number = models.CharField(max_length=100, null=True, blank=True)
 
     def __str__(self):
-        return f"{self.reference_number}"
\ No newline at end of file
+        return f"{self.reference_number}"
+
+# Rows moved out of the live tables by archival; see booking.archival.
+ArchivedBooking = archive_model(Booking)
+ArchivedPayment = archive_model(Payment, related={'booking': ArchivedBooking})
@@ -0,0 +1,60 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+from base.constants import BookingStatus
+from booking.models import Booking
+
+CENT = Decimal('0.01')
+SECONDS_PER_HOUR = Decimal(3600)
+
+
+def event_duration_hours(event):
+    """Exact event length in hours, without going through float."""
+    delta = event.end_time - event.start_time
+    seconds = Decimal(delta.days * 86400 + delta.seconds) + Decimal(delta.microseconds) / Decimal(1000000)
+    return seconds / SECONDS_PER_HOUR
+
+
+def quote_amount(hourly_rate, duration_hours):
+    return (Decimal(hourly_rate) * duration_hours).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def conflicting_artist_ids(event, artist_ids=None, exclude_booking_id=None):
+    """Ids of every artist with a pending or confirmed booking overlapping the event."""
+    queryset = Booking.active_objects.filter(
+        event__start_time__lt=event.end_time,
+        event__end_time__gt=event.start_time,
+        status__in=[BookingStatus.PENDING, BookingStatus.CONFIRMED],
+        artist__isnull=False
+    )
+    if artist_ids is not None:
+        queryset = queryset.filter(artist_id__in=artist_ids)
+    if exclude_booking_id is not None:
+        queryset = queryset.exclude(id=exclude_booking_id)
+    return set(queryset.order_by().values_list('artist_id', flat=True).distinct())
+
+
+def quote_event(event, artists):
+    """
+    Quote every artist in ``artists`` (a queryset) for ``event``. Artists with
+    overlapping bookings are dropped. Returns ``(quotes, conflicted_count)``.
+    """
+    duration_hours = event_duration_hours(event)
+    conflicts = conflicting_artist_ids(event)
+
+    quotes = []
+    conflicted_count = 0
+    for artist_id, stage_name, genre, hourly_rate in artists.order_by().values_list(
+        'id', 'stage_name', 'genre', 'hourly_rate'
+    ):
+        if artist_id in conflicts:
+            conflicted_count += 1
+            continue
+        quotes.append({
+            'artist': artist_id,
+            'stage_name': stage_name,
+            'genre': genre,
+            'hourly_rate': hourly_rate,
+            'amount': quote_amount(hourly_rate, duration_hours),
+        })
+    quotes.sort(key=lambda quote: (quote['amount'], quote['artist']))
+    return quotes, conflicted_count
@@ -1,23 +1,41 @@
 from datetime import timedelta
+from django.conf import settings
 from django.utils import timezone
 from rest_framework import serializers
 
+from artist.models import Artist
 from artist.serializers import ArtistSerializer
 from authentication.serializers import UserProfileSerializer
 from base.constants import EventStatus, BookingStatus
 from booking.models import Venue, Event, Booking, Payment
+from booking.quotes import CENT, event_duration_hours, quote_amount
 
 
 class VenueSerializer(serializers.ModelSerializer):
     owner_details = serializers.SerializerMethodField()
+    distance_km = serializers.SerializerMethodField()
     
     class Meta:
         model = Venue
         fields = [
             'id', 'name', 'owner', 'owner_details', 'address', 'city', 
-            'state', 'zip_code', 'capacity', 'description', 'amenities'
+            'state', 'zip_code', 'capacity', 'description', 'amenities',
+            'latitude', 'longitude', 'distance_km', 'events_hosted_count'
         ]
-        read_only_fields = ['id', 'owner_details']
+        read_only_fields = ['id', 'owner_details', 'distance_km', 'events_hosted_count']
+    
+    def get_distance_km(self, obj):
+        return getattr(obj, 'distance_km', None)
+    
+    def validate_latitude(self, value):
+        if value is not None and not -90 <= value <= 90:
+            raise serializers.ValidationError("Latitude must be between -90 and 90.")
+        return value
+    
+    def validate_longitude(self, value):
+        if value is not None and not -180 <= value <= 180:
+            raise serializers.ValidationError("Longitude must be between -180 and 180.")
+        return value
     
     def get_owner_details(self, obj):
         if obj.owner:
@@ -32,18 +50,22 @@ class VenueSerializer(serializers.ModelSerializer):
 
 class EventSerializer(serializers.ModelSerializer):
     venue_details = serializers.SerializerMethodField()
+    distance_km = serializers.SerializerMethodField()
     
     class Meta:
         model = Event
         fields = [
             'id', 'title', 'description', 'venue', 'venue_details',
             'start_time', 'end_time', 'status', 'ticket_price',
-            'available_slots'
+            'available_slots', 'distance_km'
         ]
         read_only_fields = [
-            'id', 'venue_details'
+            'id', 'venue_details', 'distance_km'
         ]
     
+    def get_distance_km(self, obj):
+        return getattr(obj, 'distance_km', None)
+    
     def get_venue_details(self, obj):
         if obj.venue:
             return VenueSerializer(obj.venue).data
@@ -75,6 +97,24 @@ class EventSerializer(serializers.ModelSerializer):
         return data
 
 
+def validate_bookable_event(event, request=None):
+    if event.status != EventStatus.PUBLISHED:
+        raise serializers.ValidationError(
+            {"event": "Cannot book an unpublished or cancelled event."}
+        )
+    
+    if event.start_time < timezone.now():
+        raise serializers.ValidationError(
+            {"event": "Cannot book a past event."}
+        )
+    
+    if request and hasattr(request, 'user'):
+        if event.venue is None or event.venue.owner_id != request.user.pk:
+            raise serializers.ValidationError(
+                {"event": "Only the event organizer can book artists for this event."}
+            )
+
+
 class BookingSerializer(serializers.ModelSerializer):
     event_details = serializers.SerializerMethodField()
     artist_details = serializers.SerializerMethodField()
@@ -85,10 +125,10 @@ class BookingSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'event', 'event_details', 'artist', 'artist_details',
             'booker', 'booker_details', 'status', 'amount',
-            'special_requests', 'created_at', 'updated_at'
+            'special_requests', 'created_at', 'updated_at', 'version'
         ]
         read_only_fields = [
-            'id', 'created_at', 'updated_at', 
+            'id', 'created_at', 'updated_at', 'version',
             'event_details', 'artist_details', 'booker_details'
         ]
     
@@ -115,26 +155,20 @@ class BookingSerializer(serializers.ModelSerializer):
             )
         
         if 'event' in data:
-            event = data['event']
-            
-            if event.status != EventStatus.PUBLISHED:
-                raise serializers.ValidationError(
-                    {"event": "Cannot book an unpublished or cancelled event."}
-                )
-            
-            if event.start_time < timezone.now():
-                raise serializers.ValidationError(
-                    {"event": "Cannot book a past event."}
-                )
-            
-            if request and hasattr(request, 'user'):
-                if event.venue.owner != request.user:
-                    raise serializers.ValidationError(
-                        {"event": "Only the event organizer can book artists for this event."}
-                    )
+            validate_bookable_event(data['event'], request)
         
         if 'artist' in data and data['artist']:
             artist = data['artist']
+            if self.instance is None:
+                # Take the artist row lock booking.bulk.book_artists takes, so
+                # single and bulk bookings cannot both pass the conflict check.
+                # BookingListView.create validates inside a transaction.
+                artist = Artist.active_objects.select_for_update().filter(pk=artist.pk).first()
+                if artist is None:
+                    raise serializers.ValidationError(
+                        {"artist": "Artist does not exist."}
+                    )
+                data['artist'] = artist
             if not artist.available_for_booking:
                 raise serializers.ValidationError(
                     {"artist": "Artist is not available for bookings."}
@@ -142,9 +176,8 @@ class BookingSerializer(serializers.ModelSerializer):
         
             if 'event' in data and data['event']:
                 event = data['event']
-                duration_hours = (event.end_time - event.start_time).total_seconds() / 3600
-                expected_amount = round(float(artist.hourly_rate) * duration_hours, 2)
-                if 'amount' in data and abs(float(data['amount']) - expected_amount) > 0.01:
+                expected_amount = quote_amount(artist.hourly_rate, event_duration_hours(event))
+                if 'amount' in data and abs(data['amount'] - expected_amount) > CENT:
                     raise serializers.ValidationError(
                         {"amount": f"Amount should be {expected_amount} based on artist's hourly rate and event duration."}
                     )
@@ -166,10 +199,16 @@ class BookingSerializer(serializers.ModelSerializer):
         if 'amount' not in validated_data and 'artist' in validated_data and 'event' in validated_data:
             artist = validated_data['artist']
             event = validated_data['event']
-            duration_hours = (event.end_time - event.start_time).total_seconds() / 3600
-            validated_data['amount'] = round(float(artist.hourly_rate) * duration_hours, 2)
+            validated_data['amount'] = quote_amount(artist.hourly_rate, event_duration_hours(event))
         
         return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        # Write only the submitted fields, checked against the version read.
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
     
 
 class PaymentSerializer(serializers.ModelSerializer):
@@ -180,10 +219,10 @@ class PaymentSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'booking', 'booking_details', 'amount',
             'payment_method', 'transaction_id', 'status',
-            'paid_at', 'created_at', 'updated_at'
+            'paid_at', 'created_at', 'updated_at', 'version'
         ]
         read_only_fields = [
-            'id', 'created_at', 'updated_at',
+            'id', 'created_at', 'updated_at', 'version',
             'booking_details', 'paid_at'
         ]
     
@@ -219,4 +258,52 @@ class VerifyPaymentSerializer(serializers.Serializer):
         """Validate that payment exists with this reference"""
         if not Payment.active_objects.filter(reference_number=value).exists():
             raise serializers.ValidationError("Payment with this reference does not exist")
-        return value
\ No newline at end of file
+        return value
+
+
+class ArtistQuoteSerializer(serializers.Serializer):
+    artist = serializers.IntegerField()
+    stage_name = serializers.CharField()
+    genre = serializers.CharField()
+    hourly_rate = serializers.DecimalField(max_digits=10, decimal_places=2)
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+
+
+
+class BulkBookingSerializer(serializers.Serializer):
+    event = serializers.PrimaryKeyRelatedField(queryset=Event.active_objects.select_related('venue'))
+    artists = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False)
+    special_requests = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    all_or_nothing = serializers.BooleanField(default=False)
+
+    def validate_artists(self, value):
+        max_artists = settings.BULK_BOOKING_SETTINGS['MAX_ARTISTS']
+        if len(value) > max_artists:
+            raise serializers.ValidationError(f"At most {max_artists} artists can be booked at once.")
+        return value
+
+    def validate(self, data):
+        validate_bookable_event(data['event'], self.context.get('request'))
+        return data
+
+
+class ProximityQuerySerializer(serializers.Serializer):
+    """Query parameters for ``booking.filters.ProximityFilter``."""
+    lat = serializers.FloatField(min_value=-90, max_value=90, required=False)
+    lng = serializers.FloatField(min_value=-180, max_value=180, required=False)
+    radius_km = serializers.FloatField(required=False)
+    nearest = serializers.IntegerField(min_value=1, required=False)
+
+    def validate_radius_km(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("Must be a positive number.")
+        return value
+
+    def validate_nearest(self, value):
+        return min(value, settings.GEO_SEARCH_SETTINGS['MAX_RESULTS'])
+
+    def validate(self, data):
+        if ('lat' in data) != ('lng' in data):
+            missing = 'lng' if 'lat' in data else 'lat'
+            raise serializers.ValidationError({missing: "A numeric coordinate is required for proximity search."})
+        return data
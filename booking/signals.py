@@ -0,0 +1,248 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import Signal, receiver
+
+from artist.models import Artist
+from base.signals import soft_delete_changed
+from booking.counters import (
+    BOOKING_FIELDS,
+    EVENT_FIELDS,
+    PAYMENT_FIELDS,
+    apply_counter_changes,
+    booking_counts,
+    event_counts,
+    payment_bookers,
+    payment_counts,
+    snapshot,
+    summed_counts,
+    summed_spend,
+)
+from booking.facets import venue_facets
+from booking.feeds import upcoming_event_feed
+from booking.models import Booking, Event, Payment, Venue
+from booking.streams import status_broker
+
+# Sent by bulk paths that skip post_save, with ``bookings`` set to the new rows.
+bookings_bulk_created = Signal()
+
+
+@receiver(post_init, sender=Event)
+def remember_event_venue(sender, instance, **kwargs):
+    instance._feed_venue_id = instance.__dict__.get('venue_id')
+
+
+@receiver(post_save, sender=Event)
+def update_upcoming_event_feed(sender, instance, **kwargs):
+    previous_venue = None
+    if instance._feed_venue_id and instance._feed_venue_id != instance.venue_id:
+        previous_venue = Venue.all_objects.filter(pk=instance._feed_venue_id).first()
+    transaction.on_commit(lambda: upcoming_event_feed.update(instance, previous_venue=previous_venue))
+    instance._feed_venue_id = instance.venue_id
+
+
+@receiver(post_delete, sender=Event)
+def remove_from_upcoming_event_feed(sender, instance, **kwargs):
+    transaction.on_commit(lambda: upcoming_event_feed.remove(instance))
+
+
+@receiver(post_init, sender=Venue)
+def remember_venue_location(sender, instance, **kwargs):
+    instance._feed_location = (instance.__dict__.get('city'), instance.__dict__.get('state'))
+
+
+@receiver(post_save, sender=Venue)
+def invalidate_upcoming_event_feed(sender, instance, created, **kwargs):
+    old_city, old_state = instance._feed_location
+    if not created and (old_city, old_state) != (instance.city, instance.state):
+        previous = Venue(city=old_city, state=old_state)
+        transaction.on_commit(lambda: upcoming_event_feed.invalidate(previous))
+        transaction.on_commit(lambda: upcoming_event_feed.invalidate(instance))
+    instance._feed_location = (instance.city, instance.state)
+
+
+@receiver(post_save, sender=Venue)
+@receiver(post_delete, sender=Venue)
+def invalidate_venue_facets(sender, instance, **kwargs):
+    transaction.on_commit(venue_facets.invalidate)
+
+
+def _publish_on_commit(user_ids, event, data):
+    transaction.on_commit(lambda: status_broker.publish(user_ids, event, data))
+
+
+def _booking_recipients(booker_id, artist_id):
+    artist_user_id = Artist.all_objects.filter(pk=artist_id).values_list('user_id', flat=True).first()
+    return [booker_id, artist_user_id]
+
+
+@receiver(post_init, sender=Booking)
+def remember_booking_status(sender, instance, **kwargs):
+    instance._stream_status = instance.__dict__.get('status')
+
+
+def _booking_event(booking):
+    return {
+        'id': booking.pk,
+        'status': booking.status,
+        'event': booking.event_id,
+        'artist': booking.artist_id,
+    }
+
+
+@receiver(post_save, sender=Booking)
+def publish_booking_status(sender, instance, created, **kwargs):
+    if created or instance.status != instance._stream_status:
+        _publish_on_commit(
+            _booking_recipients(instance.booker_id, instance.artist_id),
+            'booking',
+            _booking_event(instance)
+        )
+    instance._stream_status = instance.status
+
+
+@receiver(bookings_bulk_created)
+def publish_bulk_booking_status(sender, bookings, **kwargs):
+    artist_users = dict(Artist.all_objects.filter(
+        pk__in={booking.artist_id for booking in bookings if booking.artist_id}
+    ).values_list('pk', 'user_id'))
+    messages = [
+        ([booking.booker_id, artist_users.get(booking.artist_id)], _booking_event(booking))
+        for booking in bookings
+    ]
+
+    def publish():
+        for user_ids, data in messages:
+            status_broker.publish(user_ids, 'booking', data)
+    transaction.on_commit(publish)
+
+
+@receiver(post_init, sender=Payment)
+def remember_payment_status(sender, instance, **kwargs):
+    instance._stream_status = instance.__dict__.get('status')
+
+
+@receiver(post_save, sender=Payment)
+def publish_payment_status(sender, instance, created, **kwargs):
+    if (created or instance.status != instance._stream_status) and instance.booking_id:
+        booking = Booking.all_objects.filter(pk=instance.booking_id).values('booker_id', 'artist_id').first()
+        if booking:
+            _publish_on_commit(
+                _booking_recipients(booking['booker_id'], booking['artist_id']),
+                'payment',
+                {
+                    'id': instance.pk,
+                    'status': instance.status,
+                    'booking': instance.booking_id,
+                    'reference_number': instance.reference_number,
+                    'paid_at': instance.paid_at,
+                }
+            )
+    instance._stream_status = instance.status
+
+
+@receiver(post_init, sender=Booking)
+def remember_booking_counters(sender, instance, **kwargs):
+    instance._counter_state = snapshot(instance, BOOKING_FIELDS)
+
+
+@receiver(post_save, sender=Booking)
+def update_booking_counters(sender, instance, created, **kwargs):
+    previous = None if created else instance._counter_state
+    current = snapshot(instance, BOOKING_FIELDS)
+    if previous != current:
+        apply_counter_changes(booking_counts(previous), booking_counts(current))
+    instance._counter_state = current
+
+
+@receiver(post_delete, sender=Booking)
+def remove_booking_from_counters(sender, instance, **kwargs):
+    apply_counter_changes(booking_counts(instance._counter_state), {})
+
+
+@receiver(bookings_bulk_created)
+def add_bulk_bookings_to_counters(sender, bookings, **kwargs):
+    added = {}
+    for booking in bookings:
+        for key, amount in booking_counts(snapshot(booking, BOOKING_FIELDS)).items():
+            added[key] = added.get(key, 0) + amount
+    apply_counter_changes({}, added)
+
+
+@receiver(post_init, sender=Event)
+def remember_event_counters(sender, instance, **kwargs):
+    instance._counter_state = snapshot(instance, EVENT_FIELDS)
+
+
+@receiver(post_save, sender=Event)
+def update_event_counters(sender, instance, created, **kwargs):
+    previous = None if created else instance._counter_state
+    current = snapshot(instance, EVENT_FIELDS)
+    if previous != current:
+        apply_counter_changes(event_counts(previous), event_counts(current))
+    instance._counter_state = current
+
+
+@receiver(post_delete, sender=Event)
+def remove_event_from_counters(sender, instance, **kwargs):
+    apply_counter_changes(event_counts(instance._counter_state), {})
+
+
+@receiver(post_init, sender=Payment)
+def remember_payment_counters(sender, instance, **kwargs):
+    instance._counter_state = snapshot(instance, PAYMENT_FIELDS)
+
+
+@receiver(post_save, sender=Payment)
+def update_payment_counters(sender, instance, created, **kwargs):
+    previous = None if created else instance._counter_state
+    current = snapshot(instance, PAYMENT_FIELDS)
+    if previous != current:
+        bookers = payment_bookers([previous and previous['booking_id'], current['booking_id']])
+        apply_counter_changes(payment_counts(previous, bookers), payment_counts(current, bookers))
+    instance._counter_state = current
+
+
+@receiver(post_delete, sender=Payment)
+def remove_payment_from_counters(sender, instance, **kwargs):
+    state = instance._counter_state
+    apply_counter_changes(payment_counts(state, payment_bookers([state['booking_id']])), {})
+
+
+def _soft_delete_counters(contributions, active):
+    if active:
+        apply_counter_changes({}, contributions)
+    else:
+        apply_counter_changes(contributions, {})
+
+
+@receiver(soft_delete_changed, sender=Booking)
+def update_soft_deleted_booking_counters(sender, rows, active, **kwargs):
+    _soft_delete_counters(summed_counts(rows, BOOKING_FIELDS, booking_counts), active)
+
+
+@receiver(soft_delete_changed, sender=Event)
+def update_soft_deleted_event_counters(sender, rows, active, **kwargs):
+    _soft_delete_counters(summed_counts(rows, EVENT_FIELDS, event_counts), active)
+
+
+@receiver(soft_delete_changed, sender=Payment)
+def update_soft_deleted_payment_counters(sender, rows, active, **kwargs):
+    _soft_delete_counters(summed_spend(rows), active)
+
+
+@receiver(soft_delete_changed, sender=Event)
+def invalidate_soft_deleted_event_feeds(sender, rows, **kwargs):
+    venues = [
+        Venue(city=city, state=state)
+        for city, state in rows.filter(venue__isnull=False).order_by().values_list('venue__city', 'venue__state').distinct()
+    ]
+
+    def invalidate():
+        for venue in venues or [None]:
+            upcoming_event_feed.invalidate(venue)
+    transaction.on_commit(invalidate)
+
+
+@receiver(soft_delete_changed, sender=Venue)
+def invalidate_soft_deleted_venue_facets(sender, **kwargs):
+    transaction.on_commit(venue_facets.invalidate)
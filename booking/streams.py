@@ -0,0 +1,110 @@
+import asyncio
+import itertools
+import json
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class Subscription:
+    """One open stream: a bounded queue owned by the event loop serving it."""
+
+    def __init__(self, user_id, loop, max_size):
+        self.user_id = user_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=max_size)
+
+    def deliver(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A client this far behind has to resync anyway; tell it so
+            # instead of buffering without bound.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class StatusBroker:
+    """
+    In-process pub/sub from model saves to open event streams, keyed by user.
+    Publishing is thread-safe and never blocks: messages are handed to each
+    subscriber's own loop. Only streams served by this process are reached,
+    so clients resync from the REST endpoints whenever they reconnect.
+    """
+
+    def __init__(self):
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def subscribe(self, user_id):
+        subscription = Subscription(
+            user_id, asyncio.get_running_loop(), settings.EVENT_STREAM_SETTINGS['QUEUE_SIZE']
+        )
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def publish(self, user_ids, event, data):
+        message = format_event(event, data, next(self._ids))
+        with self._lock:
+            subscriptions = [
+                subscription
+                for user_id in set(user_ids) if user_id is not None
+                for subscription in self._subscriptions.get(user_id, ())
+            ]
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+            except RuntimeError:
+                # The loop has shut down; its stream is gone.
+                self.unsubscribe(subscription)
+
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+def format_event(event, data, event_id=None):
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines += [f"event: {event}", f"data: {json.dumps(data, cls=DjangoJSONEncoder)}"]
+    return "\n".join(lines) + "\n\n"
+
+
+async def event_stream(broker, user_id):
+    """
+    Subscribe once the body is first read and unsubscribe when it ends, so a
+    response that is never iterated leaves nothing behind in the broker.
+    """
+    stream_settings = settings.EVENT_STREAM_SETTINGS
+    subscription = broker.subscribe(user_id)
+    try:
+        yield f"retry: {stream_settings['RETRY_MILLISECONDS']}\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=stream_settings['HEARTBEAT_SECONDS']
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if message is None:
+                yield format_event('resync', {})
+                return
+            yield message
+    finally:
+        broker.unsubscribe(subscription)
+
+
+status_broker = StatusBroker()
@@ -1,3 +1,118 @@
+import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.db import transaction
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from base.concurrency import ConcurrentUpdateError, update_with_retry
+from base.constants import BookingStatus, PaymentStatus
+from booking.models import Booking, Event, Payment, Venue
+from booking.transitions import complete_payment
+from booking.views import BookingDetailView
+
+
+class OptimisticConcurrencyTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(email='owner@example.com', username='owner', password='pass12345')
+        venue = Venue.all_objects.create(
+            name='Hall', owner=self.owner, address='1 Road', city='Lagos', state='Lagos',
+            zip_code='100001', capacity=100, description='Hall'
+        )
+        start = timezone.now() + datetime.timedelta(days=7)
+        event = Event.all_objects.create(
+            title='Gig', description='Gig', venue=venue, start_time=start,
+            end_time=start + datetime.timedelta(hours=2), ticket_price=Decimal('10.00')
+        )
+        self.booking = Booking.all_objects.create(event=event, booker=self.owner, amount=Decimal('200.00'))
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        self.url = f'/api/bookings/{self.booking.pk}/'
+
+    def test_save_bumps_version(self):
+        self.booking.special_requests = 'Sound check at 6'
+        self.booking.save()
+
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.version, 1)
+
+    def test_stale_save_raises(self):
+        stale = Booking.all_objects.get(pk=self.booking.pk)
+        self.booking.special_requests = 'First'
+        self.booking.save()
+
+        stale.special_requests = 'Second'
+        with self.assertRaises(ConcurrentUpdateError), transaction.atomic():
+            stale.save()
+        self.assertEqual(stale.version, 0)
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.special_requests, 'First')
+
+    def test_patch_with_stale_version_conflicts(self):
+        Booking.all_objects.get(pk=self.booking.pk).save()
+
+        response = self.client.patch(self.url, {'special_requests': 'Late', 'version': 0}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.booking.refresh_from_db()
+        self.assertIsNone(self.booking.special_requests)
+
+    def test_patch_racing_another_write_conflicts(self):
+        stale = Booking.all_objects.get(pk=self.booking.pk)
+        Booking.all_objects.get(pk=self.booking.pk).save()
+
+        with mock.patch.object(BookingDetailView, 'get_object', return_value=stale):
+            response = self.client.patch(self.url, {'special_requests': 'Late'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_patch_with_current_version(self):
+        response = self.client.patch(self.url, {'special_requests': 'Late', 'version': 0}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data']['version'], 1)
+
+    def test_update_with_retry_reapplies_after_conflict(self):
+        calls = []
+
+        def apply(booking):
+            calls.append(booking.version)
+            if len(calls) == 1:
+                # Another writer lands between this read and its save.
+                Booking.all_objects.get(pk=booking.pk).save()
+            booking.special_requests = 'Retried'
+            return ['special_requests']
+
+        booking, changed = update_with_retry(Booking, self.booking.pk, apply)
+
+        self.assertTrue(changed)
+        self.assertEqual(calls, [0, 1])
+        booking.refresh_from_db()
+        self.assertEqual((booking.special_requests, booking.version), ('Retried', 2))
+
+    def test_update_with_retry_gives_up(self):
+        def apply(booking):
+            Booking.all_objects.get(pk=booking.pk).save()
+            booking.special_requests = 'Never'
+            return ['special_requests']
+
+        with self.assertRaises(ConcurrentUpdateError):
+            update_with_retry(Booking, self.booking.pk, apply, attempts=2)
+
+    def test_complete_payment_confirms_booking_once(self):
+        payment = Payment.all_objects.create(booking=self.booking, amount=Decimal('200.00'), payment_method='card')
+        paid_at = timezone.now()
+
+        payment, changed = complete_payment(payment.pk, paid_at, 'txn-1')
+        self.assertTrue(changed)
+        self.assertEqual((payment.status, payment.transaction_id), (PaymentStatus.COMPLETED, 'txn-1'))
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, BookingStatus.CONFIRMED)
 
-# Create your tests here.
+        payment, changed = complete_payment(payment.pk, paid_at, 'txn-2')
+        self.assertFalse(changed)
+        self.assertEqual(payment.transaction_id, 'txn-1')
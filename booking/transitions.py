@@ -0,0 +1,33 @@
+from django.db import transaction
+
+from base.concurrency import update_with_retry
+from base.constants import BookingStatus, PaymentStatus
+from booking.models import Booking, Payment
+
+
+def complete_payment(payment_id, paid_at, transaction_id):
+    """
+    Mark a payment completed and its booking confirmed, with versioned
+    writes retried on conflict instead of row locks. Returns the payment
+    and whether this call made the change; a payment that is already
+    completed is left alone.
+    """
+    def complete(payment):
+        if payment.status == PaymentStatus.COMPLETED:
+            return None
+        payment.status = PaymentStatus.COMPLETED
+        payment.paid_at = paid_at
+        payment.transaction_id = transaction_id
+        return ['status', 'paid_at', 'transaction_id']
+
+    def confirm(booking):
+        if booking.status == BookingStatus.CONFIRMED:
+            return None
+        booking.status = BookingStatus.CONFIRMED
+        return ['status']
+
+    with transaction.atomic():
+        payment, changed = update_with_retry(Payment, payment_id, complete)
+        if changed and payment.booking_id:
+            update_with_retry(Booking, payment.booking_id, confirm)
+    return payment, changed
@@ -3,20 +3,38 @@ from booking.views import (
     VenueListView,
     VenueDetailView,
     EventListView,
+    EventChangeFeedView,
     EventDetailView,
+    EventQuoteView,
     BookingListView,
+    BookingChangeFeedView,
     BookingDetailView,
+    BulkBookingView,
+    BookingExportView,
+    PaymentExportView,
     PaymentView,
-    VerifyPaymentView
+    VerifyPaymentView,
+    AsyncPaymentView,
+    AsyncVerifyPaymentView,
+    BookingStatusStreamView
 )
 
 urlpatterns = [
     path('', BookingListView.as_view(), name='booking-list'),
     path('<uuid:pk>/', BookingDetailView.as_view(), name='booking-detail'),
+    path('bulk/', BulkBookingView.as_view(), name='booking-bulk'),
+    path('changes/', BookingChangeFeedView.as_view(), name='booking-changes'),
+    path('export/', BookingExportView.as_view(), name='booking-export'),
     path('venues/', VenueListView.as_view(), name='venue-list'),
     path('venues/<int:pk>/', VenueDetailView.as_view(), name='venue-detail'),
     path('events/', EventListView.as_view(), name='event-list'),
+    path('events/changes/', EventChangeFeedView.as_view(), name='event-changes'),
     path('events/<int:pk>/', EventDetailView.as_view(), name='event-detail'),
+    path('events/<int:pk>/quotes/', EventQuoteView.as_view(), name='event-quotes'),
     path('payments/', PaymentView.as_view(), name='payment-create'),
+    path('payments/export/', PaymentExportView.as_view(), name='payment-export'),
     path('verify-payment/', VerifyPaymentView.as_view(), name='verify-payment'),
+    path('async/payments/', AsyncPaymentView.as_view(), name='payment-create-async'),
+    path('async/verify-payment/', AsyncVerifyPaymentView.as_view(), name='verify-payment-async'),
+    path('stream/', BookingStatusStreamView.as_view(), name='booking-stream'),
 ]
\ No newline at end of file
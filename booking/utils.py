@@ -1,3 +1,4 @@
+from datetime import datetime, timezone as dt_timezone
 from rest_framework import status
 from base.api_response import APIResponse
 
@@ -6,4 +7,10 @@ def validate_venue_owner(venue, request):
         return APIResponse.error(
             message="You don't have permission to edit this venue",
             status_code=status.HTTP_403_FORBIDDEN
-        )
\ No newline at end of file
+        )
+
+def parse_paid_on(paid_on):
+    return datetime.strptime(
+        paid_on,
+        '%Y-%m-%d %H:%M:%S.%f'
+    ).replace(tzinfo=dt_timezone.utc)
@@ -1,31 +1,53 @@
+from decimal import Decimal
+from adrf import generics as async_generics
+from adrf.views import APIView as AsyncAPIView
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, permissions, filters, status
 from rest_framework import filters
+from artist.models import Artist
 from base.api_response import APIResponse
+from base.changes import ChangeFeedView
+from base.concurrency import ConcurrentUpdateError
+from base.exports import ExportView
+from base.facets import FacetedListMixin
+from base.throttling import ReadThrottleMixin
 from base.constants import BookingStatus, EventStatus, PaymentStatus
-from base.utils import MonnifyClient, CustomPagination
+from base.utils import AsyncMonnifyClient, MonnifyClient, CustomPagination
+from booking.bulk import book_artists
+from booking.facets import venue_facets
+from booking.feeds import upcoming_event_feed
+from booking.filters import ProximityFilter, ProximityQueryMixin
 from booking.models import Venue, Event, Booking, Payment
+from booking.quotes import event_duration_hours, quote_event
+from booking.streams import event_stream, status_broker
 from booking.serializers import (
     VenueSerializer,
     EventSerializer,
     BookingSerializer,
     PaymentSerializer,
-    VerifyPaymentSerializer
+    VerifyPaymentSerializer,
+    ArtistQuoteSerializer,
+    BulkBookingSerializer
 )
-from booking.utils import validate_venue_owner
+from booking.transitions import complete_payment
+from booking.utils import parse_paid_on, validate_venue_owner
 
 
-monnify = MonnifyClient()
-
-class VenueListView(generics.ListCreateAPIView):
+class VenueListView(ReadThrottleMixin, ProximityQueryMixin, FacetedListMixin, generics.ListCreateAPIView):
     queryset = Venue.active_objects.select_related('owner').all()
     serializer_class = VenueSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    throttle_scope = 'search'
     pagination_class = CustomPagination
+    facet_set = venue_facets
 
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter, ProximityFilter]
     filterset_fields = {
         'capacity': ['gte', 'lte', 'exact'],
         'city': ['exact', 'icontains'],
@@ -90,17 +112,17 @@ class VenueDetailView(generics.RetrieveUpdateDestroyAPIView):
             )
 
 
-class EventListView(generics.ListCreateAPIView):
-    queryset = Event.active_objects.filter(
-        status=EventStatus.PUBLISHED,
-        start_time__gte=timezone.now()
-    ).select_related('venue')
+class EventListView(ReadThrottleMixin, ProximityQueryMixin, generics.ListCreateAPIView):
     serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    throttle_scope = 'search'
     pagination_class = CustomPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter, ProximityFilter]
     filterset_fields = {
         'venue': ['exact'],
+        'venue__city': ['iexact'],
+        'venue__state': ['iexact'],
+        'venue__capacity': ['gte', 'lte'],
         'ticket_price': ['gte', 'lte', 'exact'],
         'start_time': ['gte', 'lte', 'date'],
         'available_slots': ['gte', 'lte'],
@@ -113,6 +135,33 @@ class EventListView(generics.ListCreateAPIView):
     ]
     ordering_fields = ['start_time', 'ticket_price', 'available_slots']
     ordering = ['start_time']
+    proximity_prefix = 'venue__'
+    feed_query_params = {'page', 'page_size', 'venue__city__iexact', 'venue__state__iexact'}
+
+    def get_queryset(self):
+        return Event.active_objects.filter(
+            status=EventStatus.PUBLISHED,
+            start_time__gte=timezone.now()
+        ).select_related('venue__owner')
+
+    def list(self, request, *args, **kwargs):
+        if not set(request.query_params) <= self.feed_query_params:
+            return super().list(request, *args, **kwargs)
+
+        event_ids = upcoming_event_feed.event_ids(
+            city=request.query_params.get('venue__city__iexact'),
+            state=request.query_params.get('venue__state__iexact')
+        )
+        page = self.paginate_queryset(event_ids)
+        # Re-checked because another worker's cached index can lag behind.
+        events = Event.active_objects.select_related('venue__owner').filter(
+            status=EventStatus.PUBLISHED, start_time__gt=timezone.now()
+        ).in_bulk(page)
+        serializer = self.get_serializer(
+            [events[event_id] for event_id in page if event_id in events],
+            many=True
+        )
+        return self.get_paginated_response(serializer.data)
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -137,6 +186,12 @@ class EventListView(generics.ListCreateAPIView):
         )
     
 
+class EventChangeFeedView(ChangeFeedView):
+    queryset = Event.all_objects.select_related('venue__owner')
+    serializer_class = EventSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+
+
 class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Event.active_objects.all()
     serializer_class = EventSerializer
@@ -177,6 +232,38 @@ class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
         )
     
 
+class EventQuoteView(generics.GenericAPIView):
+    """
+    Exact quotes for every matching artist for one event, computed in one pass.
+    Artists already booked over the event's time slot are left out.
+    """
+    serializer_class = ArtistQuoteSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = {
+        'id': ['in'],
+        'genre': ['exact', 'icontains'],
+        'hourly_rate': ['gte', 'lte'],
+    }
+
+    def get_queryset(self):
+        return Artist.active_objects.filter(available_for_booking=True)
+
+    def get(self, request, *args, **kwargs):
+        event = generics.get_object_or_404(Event.active_objects.all(), pk=kwargs['pk'])
+        artists = self.filter_queryset(self.get_queryset())
+        quotes, conflicted_count = quote_event(event, artists)
+        return APIResponse.success(
+            data={
+                'event': event.pk,
+                'duration_hours': str(event_duration_hours(event).quantize(Decimal('0.0001'))),
+                'excluded_for_conflicts': conflicted_count,
+                'quotes': self.get_serializer(quotes, many=True).data
+            },
+            message="Quotes generated successfully"
+        )
+
+
 class BookingListView(generics.ListCreateAPIView):
     serializer_class = BookingSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -211,27 +298,86 @@ class BookingListView(generics.ListCreateAPIView):
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid():
+        # Validation locks the artist row until the booking is saved.
+        with transaction.atomic():
+            if not serializer.is_valid():
+                return APIResponse.error(
+                    message="Booking creation failed",
+                    errors=serializer.errors,
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
             event = serializer.validated_data.get('event')
             if event and event.venue.owner != request.user:
                 return APIResponse.error(
                     message="You can only book artists for your own events.",
                     status_code=status.HTTP_403_FORBIDDEN
                 )
-            
             serializer.save(booker=request.user)
-            return APIResponse.success(
-                data=serializer.data,
-                message="Booking created successfully",
-                status_code=status.HTTP_201_CREATED
+        return APIResponse.success(
+            data=serializer.data,
+            message="Booking created successfully",
+            status_code=status.HTTP_201_CREATED
+        )
+
+
+class BookingExportView(ExportView):
+    queryset = Booking.active_objects.all()
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filterset_fields = BookingListView.filterset_fields
+    search_fields = BookingListView.search_fields
+    export_name = 'bookings'
+    export_fields = [
+        'id', 'status', 'amount', 'special_requests',
+        'event_id', 'event__title', 'event__start_time', 'event__end_time',
+        'artist_id', 'artist__stage_name',
+        'booker_id', 'booker__email',
+        'created_at', 'updated_at'
+    ]
+
+
+class BulkBookingView(generics.GenericAPIView):
+    serializer_class = BulkBookingSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return APIResponse.error(
+                message="Bulk booking failed",
+                errors=serializer.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
             )
-        return APIResponse.error(
-            message="Booking creation failed",
-            errors=serializer.errors,
-            status_code=status.HTTP_400_BAD_REQUEST
+
+        results = book_artists(
+            serializer.validated_data['event'],
+            serializer.validated_data['artists'],
+            booker=request.user,
+            special_requests=serializer.validated_data.get('special_requests'),
+            all_or_nothing=serializer.validated_data['all_or_nothing']
+        )
+        booked = sum(1 for result in results if result['success'])
+        return APIResponse.success(
+            data={
+                'booked': booked,
+                'failed': len(results) - booked,
+                'results': results
+            },
+            message=f"{booked} of {len(results)} artists booked",
+            status_code=status.HTTP_201_CREATED if booked else status.HTTP_200_OK
         )
 
 
+class BookingChangeFeedView(ChangeFeedView):
+    serializer_class = BookingSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        queryset = Booking.all_objects.select_related('event', 'artist', 'booker')
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(booker=self.request.user)
+        return queryset
+
+
 class BookingDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Booking.active_objects.select_related('event', 'artist', 'booker').all()
     serializer_class = BookingSerializer
@@ -250,9 +396,15 @@ class BookingDetailView(generics.RetrieveUpdateDestroyAPIView):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         
+        if 'version' in request.data and str(request.data['version']) != str(instance.version):
+            return self.conflict()
+
         serializer = self.get_serializer(instance, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
+            try:
+                serializer.save()
+            except ConcurrentUpdateError:
+                return self.conflict()
             return APIResponse.success(
                 data=serializer.data,
                 message="Booking updated successfully"
@@ -272,17 +424,27 @@ class BookingDetailView(generics.RetrieveUpdateDestroyAPIView):
             )
         
         instance.status = BookingStatus.CANCELLED
-        instance.delete()
+        try:
+            instance.delete()
+        except ConcurrentUpdateError:
+            return self.conflict()
         return APIResponse.success(
             data=BookingSerializer(instance).data,
             message="Booking cancelled successfully"
         )
+
+    def conflict(self):
+        return APIResponse.error(
+            message="Booking was changed by another request, reload it and try again",
+            status_code=status.HTTP_409_CONFLICT
+        )
     
 
 class PaymentView(generics.CreateAPIView):
     queryset = Payment.active_objects.all()
     serializer_class = PaymentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = 'payments'
     
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -335,6 +497,27 @@ class PaymentView(generics.CreateAPIView):
         )
     
 
+class PaymentExportView(ExportView):
+    queryset = Payment.active_objects.all()
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    filterset_fields = {
+        'booking': ['exact'],
+        'booking__event': ['exact'],
+        'booking__artist': ['exact'],
+        'status': ['exact'],
+        'created_at': ['date', 'gte', 'lte'],
+        'paid_at': ['date', 'gte', 'lte'],
+    }
+    search_fields = ['reference_number', 'transaction_id', 'booking__booker__email']
+    export_name = 'payments'
+    export_fields = [
+        'id', 'status', 'amount', 'payment_method',
+        'reference_number', 'transaction_id', 'paid_at',
+        'booking_id', 'booking__event_id', 'booking__artist_id', 'booking__booker__email',
+        'created_at', 'updated_at'
+    ]
+
+
 class VerifyPaymentView(generics.GenericAPIView):
     serializer_class = VerifyPaymentSerializer
     
@@ -362,17 +545,7 @@ class VerifyPaymentView(generics.GenericAPIView):
             
             transaction_data = verification['transaction']
             if transaction_data['status'] == 'PAID' and payment.status != PaymentStatus.COMPLETED:
-                payment.status = PaymentStatus.COMPLETED
-                payment.paid_at = timezone.datetime.strptime(
-                    transaction_data['paid_on'],
-                    '%Y-%m-%d %H:%M:%S.%f'
-                ).replace(tzinfo=timezone.utc)
-                payment.transaction_id = reference_number
-                payment.save()
-                
-                if payment.booking:
-                    payment.booking.status = BookingStatus.CONFIRMED
-                    payment.booking.save()
+                complete_payment(payment.pk, parse_paid_on(transaction_data['paid_on']), reference_number)
             
             data = {
                 'payment_status': transaction_data['status'],
@@ -390,4 +563,147 @@ class VerifyPaymentView(generics.GenericAPIView):
             return APIResponse.error(
                 message=f"Error verifying payment: {str(e)}",
                 status_code=status.HTTP_400_BAD_REQUEST
-            )
\ No newline at end of file
+            )
+
+
+class AsyncPaymentView(async_generics.CreateAPIView):
+    """
+    Async counterpart of PaymentView. The Monnify call is awaited, so a slow
+    gateway does not pin a worker thread while the checkout is created.
+    """
+    queryset = Payment.active_objects.all()
+    serializer_class = PaymentSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = 'payments'
+
+    async def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        if not await sync_to_async(serializer.is_valid)():
+            return APIResponse.error(
+                message="Payment processing failed",
+                errors=serializer.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        booking = await Booking.active_objects.select_related('event').aget(
+            pk=serializer.validated_data['booking'].pk
+        )
+        if booking.booker_id != request.user.pk and not request.user.is_staff:
+            return APIResponse.error(
+                message="You can only pay for your own bookings",
+                status_code=status.HTTP_403_FORBIDDEN
+            )
+
+        if await Payment.active_objects.filter(booking=booking).aexists():
+            return APIResponse.error(
+                message="Payment already exists for this booking",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            monnify = AsyncMonnifyClient()
+            payment_data = await monnify.generate_checkout_url(booking, request.user)
+            payment = await Payment.active_objects.acreate(
+                booking=booking,
+                amount=booking.amount,
+                payment_method="ONLINE",
+                status=PaymentStatus.PENDING,
+                reference_number=payment_data['transaction_reference']
+            )
+
+            return APIResponse.success(
+                data={
+                    'checkout_url': payment_data['checkout_url'],
+                    'payment_id': str(payment.id),
+                    'reference_number': payment.reference_number
+                },
+                message="Payment initialized successfully",
+                status_code=status.HTTP_201_CREATED
+            )
+
+        except Exception as e:
+            return APIResponse.error(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+
+class AsyncVerifyPaymentView(async_generics.GenericAPIView):
+    """
+    Async counterpart of VerifyPaymentView.
+    """
+    serializer_class = VerifyPaymentSerializer
+
+    async def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        reference_number = serializer.validated_data['reference_number']
+
+        try:
+            payment = await Payment.active_objects.select_related('booking').aget(
+                reference_number=reference_number
+            )
+        except Payment.DoesNotExist:
+            return APIResponse.error(
+                message="Payment not found",
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+
+        try:
+            monnify = AsyncMonnifyClient()
+            verification = await monnify.confirm_payment(reference_number)
+            if not verification.get('success', False):
+                return APIResponse.error(
+                    message="Payment verification failed",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+
+            transaction_data = verification['transaction']
+            if transaction_data['status'] == 'PAID' and payment.status != PaymentStatus.COMPLETED:
+                await sync_to_async(complete_payment)(
+                    payment.pk, parse_paid_on(transaction_data['paid_on']), reference_number
+                )
+
+            data = {
+                'payment_status': transaction_data['status'],
+                'amount_paid': transaction_data['amount_paid'],
+                'paid_at': transaction_data['paid_on'],
+                'transaction_reference': transaction_data['transaction_reference']
+            }
+
+            return APIResponse.success(
+                message="Payment verified successfully",
+                data=data
+            )
+
+        except Exception as e:
+            return APIResponse.error(
+                message=f"Error verifying payment: {str(e)}",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+
+class BookingStatusStreamView(AsyncAPIView):
+    """
+    Server-sent events for the user's bookings and payments: a ``booking`` or
+    ``payment`` event whenever one is created or changes status, a comment
+    line every few seconds to keep proxies open, and ``resync`` when the
+    client fell too far behind. Idle streams only hold a queue, so one ASGI
+    worker can keep thousands open; fetch current state on every (re)connect.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    async def get(self, request, *args, **kwargs):
+        if not isinstance(request._request, ASGIRequest):
+            return APIResponse.error(
+                message="Event streams are only served by the ASGI application",
+                status_code=status.HTTP_501_NOT_IMPLEMENTED
+            )
+
+        response = StreamingHttpResponse(
+            event_stream(status_broker, request.user.pk),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
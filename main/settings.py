@@ -14,7 +14,6 @@ from datetime import timedelta
 from dotenv import load_dotenv
 from pathlib import Path
 from typing import cast
-from distutils.util import strtobool
 
 load_dotenv()
 
@@ -36,6 +35,7 @@ ALLOWED_HOSTS = ['*']
 
 #PAYMENT GATEWAY CONFIGURATION
 MONNIFY_BASE_URL=os.getenv('MONNIFY_BASE_URL', '')
+MONNIFY_TRANSACTIONS_URL=os.getenv('MONNIFY_TRANSACTIONS_URL', 'https://sandbox.monnify.com/api/v2/transactions')
 MONNIFY_API_KEY=os.getenv('MONNIFY_API_KEY', '')
 MONNIFY_SECRET_KEY=os.getenv('MONNIFY_SECRET_KEY', '')
 MONNIFY_CONTRACT_CODE=os.getenv('MONNIFY_CONTRACT_CODE', '')
@@ -47,6 +47,153 @@ PROFILE_PICTURE_SETTINGS = {
     'MIN_DIMENSIONS': (100, 100),
 }
 
+# Upcoming-events index kept in the default cache under per-scope versions
+# that saves bump. Run more than one worker against a shared cache (Redis,
+# memcached); with the per-process local-memory cache, other workers only
+# notice after CACHE_TIMEOUT.
+EVENT_FEED_SETTINGS = {
+    'BUCKET_SECONDS': 3600,
+    'CACHE_TIMEOUT': 300,
+}
+
+GEO_SEARCH_SETTINGS = {
+    'MAX_RESULTS': 200,
+    'DEFAULT_NEAREST': 10,
+}
+
+ARTIST_RECOMMENDATION_SETTINGS = {
+    'TOP_K': 10,
+    'MAX_LIMIT': 100,
+    'WEIGHTS': {
+        'genre': 1.0,
+        'price': 0.5,
+        'rating': 0.3,
+        'co_booking': 1.5,
+    },
+}
+
+TASK_QUEUE_SETTINGS = {
+    'VISIBILITY_TIMEOUT_SECONDS': 300,
+    'POLL_INTERVAL_SECONDS': 1.0,
+    'BATCH_SIZE': 10,
+    'MAX_ATTEMPTS': 5,
+    'RETRY_BACKOFF_SECONDS': 10,
+    'MAX_RETRY_BACKOFF_SECONDS': 3600,
+}
+
+# Import-time budget for a worker: django.setup() plus the URLconf, checked
+# by `manage.py startup_profile`.
+STARTUP_PROFILE_SETTINGS = {
+    'BUDGET_MS': 800,
+    'TOP': 15,
+}
+
+# Token buckets per throttle_scope; a rate of '10/min' allows bursts of 10
+# refilled over a minute. Point CACHE_ALIAS at Redis or Memcached so the
+# limits hold across workers.
+RATE_LIMIT_SETTINGS = {
+    'CACHE_ALIAS': 'default',
+    'SYNC_FRACTION': 0.1,
+    'SYNC_INTERVAL_SECONDS': 1.0,
+    'MAX_LOCAL_KEYS': 10000,
+    'RATES': {
+        'login': {'ip': '10/min', 'route': '600/min'},
+        'payments': {'user': '20/min', 'ip': '60/min'},
+        'search': {'user': '120/min', 'ip': '240/min', 'route': '6000/min'},
+        'autocomplete': {'user': '600/min', 'ip': '1200/min'},
+    },
+}
+
+EVENT_STREAM_SETTINGS = {
+    'HEARTBEAT_SECONDS': 15,
+    'QUEUE_SIZE': 100,
+    'RETRY_MILLISECONDS': 3000,
+}
+
+# Streaming exports: rows fetched per server-side cursor round trip, and
+# rows joined into each chunk written to the client.
+EXPORT_SETTINGS = {
+    'CHUNK_SIZE': 2000,
+    'ROWS_PER_WRITE': 200,
+}
+
+# Unpaginated list views stream their rows; CHUNK_SIZE rows are fetched and
+# serialized at a time.
+STREAMING_LIST_SETTINGS = {
+    'CHUNK_SIZE': 500,
+}
+
+CHANGE_FEED_SETTINGS = {
+    'PAGE_SIZE': 500,
+    'MAX_PAGE_SIZE': 1000,
+    'SETTLE_SECONDS': 2,
+}
+
+# Versioned Booking and Payment writes: attempts per read-modify-write and
+# the base backoff between them when another writer wins.
+OPTIMISTIC_LOCKING_SETTINGS = {
+    'MAX_ATTEMPTS': 5,
+    'RETRY_BACKOFF_SECONDS': 0.005,
+}
+
+# Archival (manage.py archive_rows): soft-deleted rows and old completed
+# bookings move to the *_archive tables BATCH_SIZE rows per transaction,
+# pausing PAUSE_SECONDS between batches to leave room for live traffic.
+ARCHIVE_SETTINGS = {
+    'SOFT_DELETED_AFTER_DAYS': 30,
+    'COMPLETED_BOOKINGS_AFTER_DAYS': 365,
+    'BATCH_SIZE': 1000,
+    'PAUSE_SECONDS': 0,
+}
+
+BULK_BOOKING_SETTINGS = {
+    'MAX_ARTISTS': 100,
+}
+
+# Facet counts on the artist and venue lists (?facets=true). The unfiltered
+# counts are cached for CACHE_TIMEOUT and dropped on every artist or venue
+# save; TERMS_LIMIT caps the genre, city and state values listed.
+FACET_SETTINGS = {
+    'CACHE_TIMEOUT': 300,
+    'TERMS_LIMIT': 20,
+    'HOURLY_RATE_EDGES': [10000, 50000, 100000, 250000, 500000],
+    'CAPACITY_EDGES': [100, 250, 500, 1000, 5000],
+}
+
+# Per-worker typeahead index: other workers' edits show up within
+# REFRESH_SECONDS and popularity is recomputed every REBUILD_SECONDS.
+# Answers for prefixes matching at least MEMO_MIN_MATCHES terms are memoized.
+TYPEAHEAD_SETTINGS = {
+    'LIMIT': 8,
+    'MAX_LIMIT': 25,
+    'REFRESH_SECONDS': 5,
+    'REBUILD_SECONDS': 900,
+    'SYNC_OVERLAP_SECONDS': 5,
+    'MEMO_MIN_MATCHES': 500,
+    'MEMO_SIZE': 2000,
+}
+
+# Fuzzy artist search. Candidates (LIMIT * CANDIDATE_FACTOR by stage name,
+# plus up to GENRE_CANDIDATES by genre) are re-ranked by trigram similarity
+# and kept above THRESHOLD. Without pg_trgm, trigrams carried by more than
+# MAX_POSTINGS artists are skipped while rarer ones remain.
+FUZZY_SEARCH_SETTINGS = {
+    'LIMIT': 20,
+    'MAX_LIMIT': 50,
+    'THRESHOLD': 0.25,
+    'CANDIDATE_FACTOR': 5,
+    'GENRE_CANDIDATES': 50,
+    'MAX_POSTINGS': 5000,
+    'MAX_TRIGRAMS': 12,
+    'FREQUENCY_CACHE_SECONDS': 3600,
+    'GENRE_CACHE_SECONDS': 300,
+}
+
+BATCH_REQUEST_SETTINGS = {
+    'MAX_REQUESTS': 20,
+    'MAX_WORKERS': 4,
+}
+
 
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -61,12 +208,16 @@ INSTALLED_APPS = [
     'base.apps.BaseConfig',
     'authentication.apps.AuthenticationConfig',
     'artist.apps.ArtistConfig',
-    'booking.apps.BookingConfig'
+    'booking.apps.BookingConfig',
+    'tasks.apps.TasksConfig',
+    'analytics.apps.AnalyticsConfig',
+    'search.apps.SearchConfig'
 
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'base.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -99,7 +250,11 @@ AUTH_USER_MODEL = 'authentication.User'
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
-    )
+    ),
+    'DEFAULT_THROTTLE_CLASSES': (
+        'base.throttling.TokenBucketThrottle',
+    ),
+    'EXCEPTION_HANDLER': 'base.api_response.api_exception_handler',
 }
 
 
@@ -124,7 +279,31 @@ if USE_POSTGRES:
             'PASSWORD': os.getenv("DATABASE_PASSWORD"),
             'HOST': os.getenv("DATABASE_HOST"),
             'PORT': os.getenv("DATABASE_PORT"),
+            # Keep connections open across requests and ping them before reuse.
+            'CONN_MAX_AGE': int(os.getenv("DATABASE_CONN_MAX_AGE", 60)),
+            'CONN_HEALTH_CHECKS': True,
         }}
+    if os.getenv("DATABASE_POOL"):
+        # Bounded psycopg 3 pool shared by the threads of a worker process.
+        # Django requires CONN_MAX_AGE=0 here; the pool does the reuse.
+        from psycopg_pool import ConnectionPool
+
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS'] = {
+            'pool': {
+                'min_size': int(os.getenv("DATABASE_POOL_MIN_SIZE", 2)),
+                'max_size': int(os.getenv("DATABASE_POOL_MAX_SIZE", 10)),
+                'timeout': float(os.getenv("DATABASE_POOL_TIMEOUT", 10)),
+                'check': ConnectionPool.check_connection,
+            }
+        }
+    # Comma separated hosts of streaming replicas of the primary above.
+    for index, host in enumerate(filter(None, os.getenv("DATABASE_REPLICA_HOSTS", "").split(",")), start=1):
+        DATABASES[f'replica_{index}'] = {
+            **DATABASES['default'],
+            'HOST': host.strip(),
+            'TEST': {'MIRROR': 'default'},
+        }
 else:
     DATABASES = {
     'default': {
@@ -132,6 +311,23 @@ else:
         'NAME': BASE_DIR / 'db.sqlite3',
     }
 }
+    # Local replica fed by `manage.py replicate_sqlite`, which copies the
+    # primary file on an interval to simulate replication lag.
+    if os.getenv("USE_SQLITE_REPLICA"):
+        DATABASES['replica_1'] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db_replica.sqlite3',
+            'TEST': {'MIRROR': 'default'},
+        }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['base.db_router.ReplicaRouter']
+
+REPLICA_ROUTING_SETTINGS = {
+    'PIN_SECONDS': int(os.getenv("REPLICA_PIN_SECONDS", 5)),
+    'COOKIE_NAME': 'primary_pin',
+    'HEADER_NAME': 'X-Primary-Pin',
+}
 
 
 # Password validation
@@ -24,7 +24,10 @@ urlpatterns = [
     path('secret-path/', admin.site.urls),
     path('api/artists/', include('artist.urls')),
     path('api/accounts/', include('authentication.urls')),
-    path('api/bookings/', include('booking.urls'))
+    path('api/bookings/', include('booking.urls')),
+    path('api/analytics/', include('analytics.urls')),
+    path('api/search/', include('search.urls')),
+    path('api/', include('base.urls'))
 ]
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
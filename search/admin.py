@@ -0,0 +1,7 @@
+from django.contrib import admin
+
+from search.models import ArtistTrigram
+
+# Register your models here.
+
+admin.site.register(ArtistTrigram)
@@ -0,0 +1,194 @@
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, F, Value
+
+from artist.models import Artist
+from search.models import ArtistTrigram
+from search.typeahead import normalize
+
+GENRES_CACHE_KEY = 'search:genres'
+FREQUENCY_CACHE_PREFIX = 'search:trigram'
+
+
+def trigrams(text):
+    """Trigrams as pg_trgm makes them: per word, padded with two spaces before and one after."""
+    grams = set()
+    for word in re.findall(r'\w+', normalize(text)):
+        padded = f'  {word} '
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return grams
+
+
+def similarity(left, right):
+    """Share of trigrams in common, as pg_trgm's ``similarity()``; takes trigram sets."""
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+def match_score(grams, width, text):
+    """
+    Best similarity between query trigrams ``grams`` and ``text`` or any run
+    of ``width`` consecutive words in it (the query's word count), so "wizkd"
+    still scores well against "Wizkid Live".
+    """
+    words = re.findall(r'\w+', normalize(text))
+    score = similarity(grams, trigrams(text))
+    for start in range(len(words) - width + 1):
+        score = max(score, similarity(grams, trigrams(' '.join(words[start:start + width]))))
+    return score
+
+
+def uses_pg_trgm():
+    return connection.vendor == 'postgresql'
+
+
+def index_artists(artist_ids):
+    """Replace the trigram postings of ``artist_ids``; inactive artists are left out."""
+    artist_ids = list(artist_ids)
+    rows = [
+        ArtistTrigram(trigram=trigram, artist_id=artist_id)
+        for artist_id, stage_name in Artist.active_objects.filter(pk__in=artist_ids).values_list('pk', 'stage_name')
+        for trigram in trigrams(stage_name)
+    ]
+    with transaction.atomic():
+        ArtistTrigram.objects.filter(artist_id__in=artist_ids).delete()
+        ArtistTrigram.objects.bulk_create(rows, batch_size=5000)
+    return len(rows)
+
+
+def rebuild_index(batch_size=2000):
+    """Rebuild the trigram postings for every active artist. Returns the number of postings."""
+    ArtistTrigram.objects.all().delete()
+    written, batch = 0, []
+    for artist_id in Artist.active_objects.order_by('pk').values_list('pk', flat=True).iterator(chunk_size=batch_size):
+        batch.append(artist_id)
+        if len(batch) >= batch_size:
+            written += index_artists(batch)
+            batch = []
+    if batch:
+        written += index_artists(batch)
+    return written
+
+
+def _frequency_key(gram):
+    # Trigrams hold spaces, which memcached keys cannot.
+    return f'{FREQUENCY_CACHE_PREFIX}:{gram.encode().hex()}'
+
+
+def _frequencies(grams):
+    """How many artists carry each trigram, cached for ``FREQUENCY_CACHE_SECONDS``."""
+    keys = {_frequency_key(gram): gram for gram in grams}
+    cached = cache.get_many(keys)
+    frequencies = {keys[key]: count for key, count in cached.items()}
+    missing = [gram for gram in grams if gram not in frequencies]
+    if missing:
+        counted = dict(
+            ArtistTrigram.objects.filter(trigram__in=missing).values('trigram').annotate(count=Count('pk'))
+            .order_by().values_list('trigram', 'count')
+        )
+        fresh = {gram: counted.get(gram, 0) for gram in missing}
+        cache.set_many(
+            {_frequency_key(gram): count for gram, count in fresh.items()},
+            settings.FUZZY_SEARCH_SETTINGS['FREQUENCY_CACHE_SECONDS']
+        )
+        frequencies.update(fresh)
+    return frequencies
+
+
+def _table_candidates(grams, limit):
+    """
+    Artists sharing the most trigrams with the query. Only the rarest
+    trigrams are looked up, and any carried by more than ``MAX_POSTINGS``
+    artists are skipped while rarer ones remain, so the work per query
+    stays bounded as the artist table grows.
+    """
+    config = settings.FUZZY_SEARCH_SETTINGS
+    frequencies = _frequencies(grams)
+    ranked = sorted((gram for gram in grams if frequencies[gram]), key=frequencies.get)
+    selective = [gram for gram in ranked if frequencies[gram] <= config['MAX_POSTINGS']]
+    used = (selective or ranked[:1])[:config['MAX_TRIGRAMS']]
+    if not used:
+        return []
+    return list(
+        ArtistTrigram.objects.filter(trigram__in=used).values('artist_id').annotate(shared=Count('pk'))
+        .order_by('-shared').values_list('artist_id', flat=True)[:limit]
+    )
+
+
+def _pg_trgm_candidates(query, limit):
+    """
+    Artists whose stage name contains a run of words similar to ``query``
+    (``<%``/``word_similarity``), which is what ``match_score`` re-ranks on.
+    Whole-name similarity (``%``) would miss "wizkd" in "Wizkid Live". The
+    operator's threshold is lowered to ``THRESHOLD`` for the query.
+    """
+    from django.contrib.postgres.lookups import TrigramWordSimilar
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+            [str(settings.FUZZY_SEARCH_SETTINGS['THRESHOLD'])]
+        )
+        return list(
+            Artist.active_objects.filter(TrigramWordSimilar(F('stage_name'), Value(query)))
+            .annotate(similarity=TrigramWordSimilarity(query, 'stage_name'))
+            .order_by('-similarity').values_list('pk', flat=True)[:limit]
+        )
+
+
+def _genres():
+    genres = cache.get(GENRES_CACHE_KEY)
+    if genres is None:
+        genres = {
+            genre: trigrams(genre)
+            for genre in Artist.active_objects.order_by().values_list('genre', flat=True).distinct()
+        }
+        cache.set(GENRES_CACHE_KEY, genres, settings.FUZZY_SEARCH_SETTINGS['GENRE_CACHE_SECONDS'])
+    return genres
+
+
+def fuzzy_search(query, limit=None):
+    """
+    Artists whose stage name or genre is similar to ``query`` despite typos,
+    as ``[(artist, score)]`` best first. Candidates come from pg_trgm's word
+    similarity on Postgres and from the ArtistTrigram table elsewhere; genres
+    are matched against the small cached list of distinct genres. Candidates
+    are then re-ranked here with ``match_score`` on every backend.
+    """
+    config = settings.FUZZY_SEARCH_SETTINGS
+    limit = limit or config['LIMIT']
+    grams = trigrams(query)
+    if not grams:
+        return []
+
+    candidate_limit = limit * config['CANDIDATE_FACTOR']
+    if uses_pg_trgm():
+        candidate_ids = _pg_trgm_candidates(query, candidate_limit)
+    else:
+        candidate_ids = _table_candidates(grams, candidate_limit)
+    genres = [
+        genre for genre, genre_grams in _genres().items()
+        if similarity(grams, genre_grams) >= config['THRESHOLD']
+    ]
+
+    rows = list(Artist.active_objects.filter(pk__in=candidate_ids).values_list('pk', 'stage_name', 'genre'))
+    if genres:
+        genre_rows = Artist.active_objects.filter(genre__in=genres).exclude(pk__in=candidate_ids).order_by()
+        rows += genre_rows.values_list('pk', 'stage_name', 'genre')[:config['GENRE_CANDIDATES']]
+
+    width = max(len(normalize(query).split()), 1)
+    genre_scores = {genre: match_score(grams, width, genre) for genre in {row[2] for row in rows}}
+    scored = []
+    for pk, stage_name, genre in rows:
+        score = max(match_score(grams, width, stage_name), genre_scores[genre])
+        if score >= config['THRESHOLD']:
+            scored.append((round(score, 3), stage_name.lower(), pk))
+    top = sorted(scored, key=lambda item: (-item[0], item[1], item[2]))[:limit]
+
+    artists = Artist.active_objects.select_related('user').in_bulk([pk for _, _, pk in top])
+    return [(artists[pk], score) for score, _, pk in top if pk in artists]
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from search.fuzzy import rebuild_index, uses_pg_trgm
+
+
+class Command(BaseCommand):
+    help = (
+        "Prepare fuzzy artist search: on Postgres enable pg_trgm and index "
+        "stage names with GIN, elsewhere rebuild the trigram postings table."
+    )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        if uses_pg_trgm():
+            with connection.cursor() as cursor:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS artist_stage_name_trgm_idx "
+                    "ON artist_artist USING gin (stage_name gin_trgm_ops)"
+                )
+            self.stdout.write(self.style.SUCCESS(
+                f"pg_trgm index ready in {time.perf_counter() - started:.2f}s"
+            ))
+            return
+        written = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {written} trigram postings in {time.perf_counter() - started:.2f}s"
+        ))
@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class ArtistTrigram(models.Model):
+    """
+    Trigram postings for fuzzy stage name search on databases without
+    pg_trgm. The unique index on (trigram, artist) answers candidate lookups
+    without touching the artist table.
+    """
+    trigram = models.CharField(max_length=3)
+    artist = models.ForeignKey('artist.Artist', on_delete=models.CASCADE, related_name='+')
+
+    class Meta:
+        unique_together = ('trigram', 'artist')
+
+    def __str__(self):
+        return f"{self.trigram!r} -> {self.artist_id}"
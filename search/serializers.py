@@ -0,0 +1,28 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from search.typeahead import SOURCES
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=100, trim_whitespace=False)
+    types = serializers.CharField(required=False, help_text="Comma separated: artist, venue, event")
+    limit = serializers.IntegerField(min_value=1, required=False)
+
+    def validate_types(self, value):
+        kinds = [kind.strip() for kind in value.split(',') if kind.strip()]
+        unknown = set(kinds) - set(SOURCES)
+        if unknown:
+            raise serializers.ValidationError(f"Unknown types: {', '.join(sorted(unknown))}.")
+        return kinds
+
+    def validate_limit(self, value):
+        return min(value, settings.TYPEAHEAD_SETTINGS['MAX_LIMIT'])
+
+
+class FuzzyArtistQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=100)
+    limit = serializers.IntegerField(min_value=1, required=False)
+
+    def validate_limit(self, value):
+        return min(value, settings.FUZZY_SEARCH_SETTINGS['MAX_LIMIT'])
@@ -0,0 +1,61 @@
+from django.db import transaction
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from artist.models import Artist
+from base.signals import soft_delete_changed
+from booking.models import Event, Venue
+from search.fuzzy import GENRES_CACHE_KEY, index_artists, uses_pg_trgm
+from search.typeahead import typeahead_index
+
+KINDS = {Artist: 'artist', Venue: 'venue', Event: 'event'}
+
+
+@receiver(post_save, sender=Artist)
+@receiver(post_save, sender=Venue)
+@receiver(post_save, sender=Event)
+def refresh_typeahead_entry(sender, instance, **kwargs):
+    kind, pk = KINDS[sender], instance.pk
+    transaction.on_commit(lambda: typeahead_index.refresh(kind, pk))
+
+
+@receiver(post_delete, sender=Artist)
+@receiver(post_delete, sender=Venue)
+@receiver(post_delete, sender=Event)
+def remove_typeahead_entry(sender, instance, **kwargs):
+    kind, pk = KINDS[sender], instance.pk
+    transaction.on_commit(lambda: typeahead_index.remove(kind, pk))
+
+
+@receiver(post_init, sender=Artist)
+def remember_artist_search_fields(sender, instance, **kwargs):
+    values = instance.__dict__
+    instance._search_state = (values.get('stage_name'), values.get('genre'), values.get('is_active'))
+
+
+@receiver(post_save, sender=Artist)
+def refresh_artist_trigrams(sender, instance, created, **kwargs):
+    previous = instance._search_state
+    instance._search_state = (instance.stage_name, instance.genre, instance.is_active)
+    if not created and previous == instance._search_state:
+        return
+    if created or previous[1] != instance.genre:
+        transaction.on_commit(lambda: cache.delete(GENRES_CACHE_KEY))
+    if not uses_pg_trgm() and (created or previous[0::2] != instance._search_state[0::2]):
+        pk = instance.pk
+        transaction.on_commit(lambda: index_artists([pk]))
+
+
+@receiver(soft_delete_changed, sender=Artist)
+@receiver(soft_delete_changed, sender=Venue)
+@receiver(soft_delete_changed, sender=Event)
+def refresh_soft_deleted_search_entries(sender, rows, **kwargs):
+    kind, pks = KINDS[sender], list(rows.values_list('pk', flat=True))
+    if not pks:
+        return
+    transaction.on_commit(lambda: typeahead_index.refresh(kind, *pks))
+    if sender is Artist:
+        transaction.on_commit(lambda: cache.delete(GENRES_CACHE_KEY))
+        if not uses_pg_trgm():
+            transaction.on_commit(lambda: index_artists(pks))
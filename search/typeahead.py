@@ -0,0 +1,236 @@
+import bisect
+import heapq
+import math
+import re
+import threading
+import time
+import unicodedata
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q
+from django.utils import timezone
+
+from artist.models import Artist
+from base.constants import BookingStatus, EventStatus
+from booking.models import Event, Venue
+
+
+def normalize(text):
+    """Lowercase, strip accents and punctuation, and collapse whitespace."""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char)).casefold()
+    return ' '.join(re.sub(r'[^\w\s]', ' ', text).split())
+
+
+def index_terms(label):
+    """Every word onwards, so "Burna Boy" is found by "bur" and by "boy"."""
+    words = normalize(label).split()
+    return {' '.join(words[start:]) for start in range(len(words))}
+
+
+class Source:
+    """One model feeding the index: its label field and a popularity annotation."""
+
+    def __init__(self, model, field, popularity, listed=Q(), expires=None):
+        self.model = model
+        self.field = field
+        self.popularity = popularity
+        self.listed = listed
+        self.expires = expires
+
+    def rows(self, queryset):
+        """``(pk, label, popularity, expires_at, listed)`` for each row."""
+        fields = ['pk', self.field, 'popularity', 'is_listed']
+        if self.expires:
+            fields.append(self.expires)
+        rows = queryset.annotate(
+            popularity=self.popularity,
+            is_listed=ExpressionWrapper(Q(is_active=True) & self.listed, output_field=BooleanField())
+        ).order_by().values_list(*fields)
+        for row in rows:
+            expires_at = row[4].timestamp() if self.expires and row[4] else None
+            yield row[0], row[1], row[2], expires_at, bool(row[3])
+
+    def all(self):
+        queryset = self.model.active_objects.filter(self.listed)
+        if self.expires:
+            queryset = queryset.filter(**{f'{self.expires}__gt': timezone.now()})
+        return self.rows(queryset)
+
+    def changed_since(self, since):
+        return self.rows(self.model.all_objects.filter(updated_at__gte=since))
+
+    def some(self, pks):
+        return self.rows(self.model.all_objects.filter(pk__in=pks))
+
+
+SOURCES = {
+    'artist': Source(
+        Artist, 'stage_name',
+        Count('bookings', filter=Q(
+            bookings__is_active=True,
+            bookings__status__in=[BookingStatus.CONFIRMED, BookingStatus.COMPLETED]
+        ), distinct=True)
+    ),
+    'venue': Source(Venue, 'name', Count('events', filter=Q(events__is_active=True), distinct=True)),
+    'event': Source(
+        Event, 'title',
+        Count('bookings', filter=Q(bookings__is_active=True), distinct=True),
+        listed=Q(status=EventStatus.PUBLISHED), expires='start_time'
+    ),
+}
+
+
+class TypeaheadIndex:
+    """
+    Per-worker prefix index over artist stage names, venue names and event
+    titles. Terms live in one sorted list of ``(term, kind, pk)`` so a prefix
+    is a pair of binary searches; the matches are ranked by popularity
+    (confirmed bookings for artists, events for venues, bookings for events).
+
+    Saves in this worker are applied as soon as they commit (see
+    search.signals). Other workers' writes are picked up every
+    ``REFRESH_SECONDS`` by reading rows whose ``updated_at`` moved, and the
+    whole index, popularity included, is rebuilt every ``REBUILD_SECONDS``.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._terms = []
+        self._entries = {}
+        self._memo = {}
+        self._built_at = None
+        self._checked_at = 0
+        self._synced_at = None
+
+    @property
+    def is_built(self):
+        return self._built_at is not None
+
+    def search(self, prefix, kinds=None, limit=None):
+        config = settings.TYPEAHEAD_SETTINGS
+        term = normalize(prefix)
+        kinds = tuple(sorted(kinds or SOURCES))
+        limit = limit or config['LIMIT']
+        if not term:
+            return []
+        self.ensure_fresh()
+
+        memo_key = (term, kinds, limit)
+        now = time.time()
+        with self._lock:
+            memo = self._memo.get(memo_key)
+            if memo is not None and memo[1] > now:
+                return memo[0]
+            start = bisect.bisect_left(self._terms, (term,))
+            end = bisect.bisect_left(self._terms, (term + '\U0010ffff',), start)
+            matches = {}
+            for _, kind, pk in self._terms[start:end]:
+                entry = self._entries[kind, pk]
+                if kind in kinds and (entry['expires_at'] is None or entry['expires_at'] > now):
+                    matches[kind, pk] = entry
+            top = heapq.nlargest(
+                limit, matches.items(), key=lambda item: (item[1]['popularity'], -len(item[1]['label']))
+            )
+            results = [
+                {'type': kind, 'id': pk, 'label': entry['label'], 'popularity': entry['popularity']}
+                for (kind, pk), entry in top
+            ]
+            if end - start >= config['MEMO_MIN_MATCHES']:
+                # Broad prefixes are memoized until an entry under them
+                # changes or one of the listed events starts.
+                if len(self._memo) >= config['MEMO_SIZE']:
+                    self._memo = {}
+                valid_until = min((entry['expires_at'] for _, entry in top if entry['expires_at']), default=math.inf)
+                self._memo[memo_key] = (results, valid_until)
+            return results
+
+    def ensure_fresh(self):
+        config = settings.TYPEAHEAD_SETTINGS
+        now = time.monotonic()
+        rebuild = self._built_at is None or now - self._built_at > config['REBUILD_SECONDS']
+        if not rebuild and now - self._checked_at <= config['REFRESH_SECONDS']:
+            return
+        # Once built, let one thread refresh while the others keep answering.
+        if not self._refresh_lock.acquire(blocking=not self.is_built):
+            return
+        try:
+            now = time.monotonic()
+            if self._built_at is None or now - self._built_at > config['REBUILD_SECONDS']:
+                self.rebuild()
+            elif now - self._checked_at > config['REFRESH_SECONDS']:
+                self.sync()
+        finally:
+            self._refresh_lock.release()
+
+    def rebuild(self):
+        started = timezone.now()
+        entries = {}
+        for kind, source in SOURCES.items():
+            for pk, label, popularity, expires_at, _ in source.all():
+                entries[kind, pk] = self._entry(label, popularity, expires_at)
+        terms = sorted((term, kind, pk) for (kind, pk), entry in entries.items() for term in entry['terms'])
+        with self._lock:
+            self._entries, self._terms, self._memo = entries, terms, {}
+            self._built_at = self._checked_at = time.monotonic()
+            self._synced_at = started
+
+    def sync(self):
+        """Apply rows changed by any worker since the last sync."""
+        started = timezone.now()
+        # Re-read a short overlap so rows committed late are not missed.
+        since = self._synced_at - timedelta(seconds=settings.TYPEAHEAD_SETTINGS['SYNC_OVERLAP_SECONDS'])
+        for kind, source in SOURCES.items():
+            for row in source.changed_since(since):
+                self._apply(kind, *row)
+        with self._lock:
+            self._checked_at = time.monotonic()
+            self._synced_at = started
+
+    def refresh(self, kind, *pks):
+        """Re-read rows after local saves."""
+        if not self.is_built:
+            return
+        rows = list(SOURCES[kind].some(pks))
+        for pk in set(pks) - {row[0] for row in rows}:
+            self.remove(kind, pk)
+        for row in rows:
+            self._apply(kind, *row)
+
+    def remove(self, kind, pk):
+        with self._lock:
+            entry = self._entries.pop((kind, pk), None)
+            if entry is None:
+                return
+            for term in entry['terms']:
+                position = bisect.bisect_left(self._terms, (term, kind, pk))
+                if position < len(self._terms) and self._terms[position] == (term, kind, pk):
+                    del self._terms[position]
+            self._forget(entry['terms'])
+
+    def _apply(self, kind, pk, label, popularity, expires_at, listed):
+        if not listed:
+            self.remove(kind, pk)
+            return
+        entry = self._entry(label, popularity, expires_at)
+        with self._lock:
+            if self._entries.get((kind, pk)) == entry:
+                return
+            self.remove(kind, pk)
+            self._entries[kind, pk] = entry
+            for term in entry['terms']:
+                bisect.insort(self._terms, (term, kind, pk))
+            self._forget(entry['terms'])
+
+    def _forget(self, terms):
+        """Drop memoized answers for prefixes of ``terms``."""
+        for key in [key for key in self._memo if any(term.startswith(key[0]) for term in terms)]:
+            del self._memo[key]
+
+    def _entry(self, label, popularity, expires_at):
+        return {'label': label, 'popularity': popularity, 'expires_at': expires_at, 'terms': index_terms(label)}
+
+
+typeahead_index = TypeaheadIndex()
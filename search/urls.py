@@ -0,0 +1,7 @@
+from django.urls import path
+from search.views import AutocompleteView, FuzzyArtistSearchView
+
+urlpatterns = [
+    path('autocomplete/', AutocompleteView.as_view(), name='search-autocomplete'),
+    path('artists/', FuzzyArtistSearchView.as_view(), name='search-artists'),
+]
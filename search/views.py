@@ -0,0 +1,53 @@
+from rest_framework import generics, permissions, status
+
+from artist.serializers import ArtistSerializer
+from base.api_response import APIResponse
+from search.fuzzy import fuzzy_search
+from search.serializers import AutocompleteQuerySerializer, FuzzyArtistQuerySerializer
+from search.typeahead import typeahead_index
+
+
+class AutocompleteView(generics.GenericAPIView):
+    """
+    Top matches for a search-box prefix across artist stage names, venue
+    names and event titles, most popular first. Served from the in-memory
+    typeahead index, so no query runs per keystroke.
+    """
+    permission_classes = [permissions.AllowAny]
+    throttle_scope = 'autocomplete'
+
+    def get(self, request, *args, **kwargs):
+        query = AutocompleteQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return APIResponse.error(
+                message="Invalid autocomplete query",
+                errors=query.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        params = query.validated_data
+        results = typeahead_index.search(params['q'], kinds=params.get('types'), limit=params.get('limit'))
+        return APIResponse.success(data={'results': results})
+
+
+class FuzzyArtistSearchView(generics.GenericAPIView):
+    """
+    Artists whose stage name or genre is close to ``q``, tolerating typos,
+    best match first with its trigram similarity ``score``.
+    """
+    serializer_class = ArtistSerializer
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    throttle_scope = 'search'
+
+    def get(self, request, *args, **kwargs):
+        query = FuzzyArtistQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return APIResponse.error(
+                message="Invalid search query",
+                errors=query.errors,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        matches = fuzzy_search(query.validated_data['q'], limit=query.validated_data.get('limit'))
+        results = []
+        for artist, score in matches:
+            results.append({**self.get_serializer(artist).data, 'score': score})
+        return APIResponse.success(data={'results': results})
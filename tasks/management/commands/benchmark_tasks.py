@@ -0,0 +1,65 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+
+from tasks.models import Task
+from tasks.queue import enqueue, enqueue_many, registry, work
+
+NOOP = 'tasks.benchmark.noop'
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure task queue throughput: single and bulk enqueue, then draining "
+        "no-op tasks with several workers and batch sizes. Runs on a throwaway "
+        "test database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=2000, help="Tasks per measurement")
+        parser.add_argument("--workers", type=int, default=None,
+                            help="Concurrent workers (threads); defaults to 4, or 1 on SQLite")
+        parser.add_argument("--batch-sizes", default="1,10,50", help="Comma separated claim sizes to compare")
+
+    def handle(self, *args, **options):
+        count = options["tasks"]
+        workers = options["workers"] or (1 if connection.vendor == "sqlite" else 4)
+        batch_sizes = [int(size) for size in options["batch_sizes"].split(",") if size]
+
+        registry[NOOP] = lambda *args, **kwargs: None
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            started = time.perf_counter()
+            for index in range(count):
+                enqueue(NOOP, args=[index])
+            self.report("enqueue", count, time.perf_counter() - started)
+            Task.objects.all().delete()
+
+            started = time.perf_counter()
+            enqueue_many((NOOP, [index], None) for index in range(count))
+            self.report("enqueue_many", count, time.perf_counter() - started)
+
+            for batch_size in batch_sizes:
+                Task.objects.all().delete()
+                enqueue_many((NOOP, [index], None) for index in range(count))
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    processed = sum(pool.map(
+                        lambda worker: self.drain(f"bench-{worker}", batch_size), range(workers)
+                    ))
+                self.report(f"dequeue batch={batch_size} workers={workers}", processed, time.perf_counter() - started)
+        finally:
+            registry.pop(NOOP, None)
+            connections.close_all()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def drain(self, worker_id, batch_size):
+        try:
+            return work(worker_id=worker_id, batch_size=batch_size, poll_interval=0, once=True)
+        finally:
+            connections.close_all()
+
+    def report(self, label, count, elapsed):
+        self.stdout.write(f"{label:<32} {count:>7} tasks  {elapsed:7.2f}s  {count / elapsed:9.0f} tasks/s")
@@ -0,0 +1,35 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from tasks.queue import default_worker_id, registry, work
+
+
+class Command(BaseCommand):
+    help = "Run a task queue worker. Start one per core; workers coordinate through the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None, help="Tasks leased per claim")
+        parser.add_argument("--poll-interval", type=float, default=None, help="Seconds to sleep when the queue is empty")
+        parser.add_argument("--once", action="store_true", help="Exit once the queue is drained")
+
+    def handle(self, *args, **options):
+        stopping = []
+
+        def stop(signum, frame):
+            # Finish the leased batch, then exit.
+            stopping.append(signum)
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        worker_id = default_worker_id()
+        self.stdout.write(f"Worker {worker_id} running {len(registry)} registered tasks: {', '.join(sorted(registry))}")
+        processed = work(
+            worker_id=worker_id,
+            batch_size=options["batch_size"],
+            poll_interval=options["poll_interval"],
+            once=options["once"],
+            should_stop=lambda: bool(stopping)
+        )
+        self.stdout.write(self.style.SUCCESS(f"Worker {worker_id} stopped after {processed} tasks"))
@@ -0,0 +1,171 @@
+import logging
+import os
+import random
+import socket
+import time
+import traceback
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from base.constants import TaskStatus
+from tasks.models import Task
+
+logger = logging.getLogger(__name__)
+
+registry = {}
+
+
+def task(func=None, *, name=None, priority=0, max_attempts=None):
+    """
+    Register ``func`` as a task. The decorated function gains
+    ``func.delay(*args, **kwargs)`` to enqueue a call with the defaults given
+    here; arguments must be JSON serializable.
+    """
+    def register(func):
+        task_name = name or f"{func.__module__}.{func.__name__}"
+        registry[task_name] = func
+        func.task_name = task_name
+        func.delay = lambda *args, **kwargs: enqueue(
+            task_name, args, kwargs, priority=priority, max_attempts=max_attempts
+        )
+        return func
+    return register(func) if func is not None else register
+
+
+def _task_name(func_or_name):
+    return getattr(func_or_name, 'task_name', func_or_name)
+
+
+def _build(func_or_name, args, kwargs, priority, delay, max_attempts, now):
+    return Task(
+        name=_task_name(func_or_name),
+        args=list(args or ()),
+        kwargs=dict(kwargs or {}),
+        priority=priority,
+        run_at=now + timedelta(seconds=delay),
+        max_attempts=max_attempts or settings.TASK_QUEUE_SETTINGS['MAX_ATTEMPTS'],
+    )
+
+
+def enqueue(func_or_name, args=(), kwargs=None, priority=0, delay=0, max_attempts=None):
+    """
+    Queue one call. The row is written on the current connection, so inside
+    a transaction the task only becomes visible to workers once it commits.
+    """
+    queued = _build(func_or_name, args, kwargs, priority, delay, max_attempts, timezone.now())
+    queued.save()
+    return queued
+
+
+def enqueue_many(calls, priority=0, delay=0, max_attempts=None, batch_size=1000):
+    """Queue ``(func_or_name, args, kwargs)`` calls with one INSERT per ``batch_size``."""
+    now = timezone.now()
+    tasks = [
+        _build(func_or_name, args, kwargs, priority, delay, max_attempts, now)
+        for func_or_name, args, kwargs in calls
+    ]
+    Task.objects.bulk_create(tasks, batch_size=batch_size)
+    return len(tasks)
+
+
+def claim(worker_id, limit=1, visibility_timeout=None):
+    """
+    Lease up to ``limit`` ready tasks, highest priority first. Rows are locked
+    with SKIP LOCKED where the database supports it so concurrent workers do
+    not queue up behind each other. The lease is taken with a conditional
+    UPDATE, so a row can never be handed to two workers.
+    """
+    timeout = visibility_timeout or settings.TASK_QUEUE_SETTINGS['VISIBILITY_TIMEOUT_SECONDS']
+    now = timezone.now()
+    ready = Q(status=TaskStatus.QUEUED, run_at__lte=now) | Q(status=TaskStatus.RUNNING, locked_until__lt=now)
+    lease = f"{worker_id[:40]}:{uuid.uuid4().hex[:16]}"
+
+    with transaction.atomic():
+        candidates = Task.objects.filter(ready).order_by('-priority', 'run_at', 'id')
+        if connection.features.has_select_for_update_skip_locked:
+            candidates = candidates.select_for_update(skip_locked=True)
+        ids = list(candidates.values_list('id', flat=True)[:limit])
+        if not ids:
+            return []
+        Task.objects.filter(ready, id__in=ids).update(
+            status=TaskStatus.RUNNING,
+            locked_by=lease,
+            locked_until=now + timedelta(seconds=timeout),
+            attempts=F('attempts') + 1
+        )
+    return list(Task.objects.filter(locked_by=lease, status=TaskStatus.RUNNING).order_by('-priority', 'run_at', 'id'))
+
+
+def retry_delay(attempts):
+    """Exponential backoff with jitter: about base * 2^(attempts - 1), capped."""
+    queue_settings = settings.TASK_QUEUE_SETTINGS
+    delay = min(queue_settings['RETRY_BACKOFF_SECONDS'] * 2 ** (attempts - 1), queue_settings['MAX_RETRY_BACKOFF_SECONDS'])
+    return delay * random.uniform(0.75, 1.25)
+
+
+def run_task(task):
+    """
+    Run a claimed task and record the outcome. Returns True on success.
+    Updates are conditional on the lease, so a worker whose lease expired
+    cannot overwrite the result of the worker that took the task over.
+    """
+    leased = Task.objects.filter(pk=task.pk, locked_by=task.locked_by)
+    released = {'locked_by': '', 'locked_until': None}
+    func = registry.get(task.name)
+    try:
+        if func is None:
+            raise LookupError(f"No task registered as {task.name!r}")
+        if task.attempts > task.max_attempts:
+            raise RuntimeError(f"Lease expired on the final attempt ({task.max_attempts})")
+        func(*task.args, **task.kwargs)
+    except Exception:
+        error = traceback.format_exc()[-5000:]
+        if func is not None and task.attempts < task.max_attempts:
+            leased.update(
+                status=TaskStatus.QUEUED,
+                run_at=timezone.now() + timedelta(seconds=retry_delay(task.attempts)),
+                last_error=error,
+                **released
+            )
+        else:
+            leased.update(status=TaskStatus.FAILED, finished_at=timezone.now(), last_error=error, **released)
+        logger.warning("Task %s #%s failed (attempt %s/%s)", task.name, task.pk, task.attempts, task.max_attempts)
+        return False
+
+    leased.update(status=TaskStatus.SUCCEEDED, finished_at=timezone.now(), last_error='', **released)
+    return True
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def work(worker_id=None, batch_size=None, poll_interval=None, once=False, should_stop=lambda: False):
+    """
+    Claim and run tasks until ``should_stop()`` is true, sleeping
+    ``poll_interval`` whenever the queue is empty. With ``once``, return as
+    soon as the queue is drained. Returns the number of tasks run.
+    """
+    queue_settings = settings.TASK_QUEUE_SETTINGS
+    worker_id = worker_id or default_worker_id()
+    batch_size = batch_size or queue_settings['BATCH_SIZE']
+    poll_interval = queue_settings['POLL_INTERVAL_SECONDS'] if poll_interval is None else poll_interval
+
+    processed = 0
+    while not should_stop():
+        close_old_connections()
+        tasks = claim(worker_id, limit=batch_size)
+        if not tasks:
+            if once:
+                break
+            time.sleep(poll_interval)
+            continue
+        for claimed in tasks:
+            run_task(claimed)
+            processed += 1
+    return processed